@@ -2044,7 +2044,7 @@ def run_recipe_backcast():
                     model.fit(X_train, y_train_lagged.tolist())
                     
                     # Predict on test set
-                    pred = [model.predict_row(x) for x in X_test]
+                    pred = model.predict_batch(X_test)
                     models_predictions[model_name] = np.array(pred)
                     
                 except Exception as e:
@@ -2514,7 +2514,7 @@ def refresh_recipe_charts():
                     model.fit(X_train.tolist(), y_train.tolist())
                     
                     # Predict on test set
-                    pred = [model.predict_row(x) for x in X_test.tolist()]
+                    pred = model.predict_batch(X_test.tolist())
                     backcast_preds[model_name] = np.array(pred)
                     
                 except Exception as e:
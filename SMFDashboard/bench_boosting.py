@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark the XGBoost plugin's tree methods on the monthly ``__all__`` feature set.
+
+Builds the recipe-style feature block (target lags plus every other column of
+the monthly CSV at lag 0), then times ``tree_method="exact"`` against the
+histogram engine at several ``max_bins`` and reports in-sample RMSE of each,
+so the speedup can be read next to what binning costs in fit.
+
+    python bench_boosting.py --target CPI --min-obs 300 --max-bins 16 64 256
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+CUR_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(CUR_DIR, "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from core.data import TimeSeriesFrame
+from core.features import build_feature_block
+from core.utils import parse_ymd
+from models.xgboost.model import create
+
+
+def _training_rows(args):
+    frame = TimeSeriesFrame.from_csv(args.data, date_col="date")
+    if args.min_obs:
+        # Sparse series leave few rows where every column is observed
+        keep_cols = [c for c in frame.columns if c == args.target or np.isfinite(frame.column(c)).sum() >= args.min_obs]
+        frame = frame.subset(keep_cols)
+    features = {"target_lags": args.target_lags, "exog": {"__all__": {"lags": [0]}}}
+    block = build_feature_block(frame, args.target, features)
+    dates, X, y, _ = block.for_horizon(args.horizon)
+    start, end = parse_ymd(args.train_start), parse_ymd(args.train_end)
+    keep = [i for i, d in enumerate(dates) if (start is None or d >= start) and (end is None or d <= end)]
+    return [X[i] for i in keep], [y[i] for i in keep], len(block.columns)
+
+
+def _time_fit(params, X, y, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        model = create(params)
+        t0 = time.perf_counter()
+        model.fit(X, y)
+        best = min(best, time.perf_counter() - t0)
+    rmse = math.sqrt(sum((model.predict_row(r) - v) ** 2 for r, v in zip(X, y)) / len(y))
+    return best, rmse
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--data", default=os.path.join(CUR_DIR, "data", "merged", "smf_monthly_data.csv"))
+    ap.add_argument("--target", default="CPI")
+    ap.add_argument("--target-lags", type=int, nargs="+", default=[1, 12])
+    ap.add_argument("--horizon", type=int, default=1)
+    ap.add_argument("--train-start", default=None, help="YYYY-MM-DD (default: every usable row)")
+    ap.add_argument("--train-end", default=None, help="YYYY-MM-DD")
+    ap.add_argument("--min-obs", type=int, default=0, help="Leave series with fewer observations out of __all__")
+    ap.add_argument("--n-estimators", type=int, default=20)
+    ap.add_argument("--max-depth", type=int, default=6)
+    ap.add_argument("--max-bins", type=int, nargs="+", default=[16, 64, 256])
+    ap.add_argument("--repeat", type=int, default=3, help="Fits per method; the fastest is reported")
+    ap.add_argument("--skip-exact", action="store_true", help="Time the histogram engine only")
+    args = ap.parse_args()
+
+    X, y, p = _training_rows(args)
+    if not X:
+        print("No training rows in the requested window")
+        return 1
+    print(f"{args.target} h={args.horizon}: {len(X)} rows x {p} features, "
+          f"{args.n_estimators} trees of depth {args.max_depth}")
+    base = {"n_estimators": args.n_estimators, "max_depth": args.max_depth}
+
+    exact_s = None
+    print(f"{'method':<16}{'fit s':>10}{'speedup':>10}{'rmse':>12}")
+    if not args.skip_exact:
+        exact_s, rmse = _time_fit({**base, "tree_method": "exact"}, X, y, args.repeat)
+        print(f"{'exact':<16}{exact_s:>10.3f}{'1.0x':>10}{rmse:>12.6f}")
+    for bins in args.max_bins:
+        s, rmse = _time_fit({**base, "tree_method": "hist", "max_bins": bins}, X, y, args.repeat)
+        speedup = f"{exact_s / s:.1f}x" if exact_s else "-"
+        print(f"{f'hist/{bins}':<16}{s:>10.3f}{speedup:>10}{rmse:>12.6f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark TimeSeriesFrame CSV loading: the old DictReader path against the bulk reader.
+
+Times both on the daily, weekly and monthly merged files, once with every
+column and once with ``--select-cols`` and ``--as-of``, and checks that the
+two paths load the same frame. The bulk reader is called with
+``use_cache=False`` so the memory-mapped sidecar does not enter the timing.
+
+    python bench_loader.py --select-cols 3 --as-of 2015-06-30 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+
+CUR_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(CUR_DIR, "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from core.data import TimeSeriesFrame
+from core.utils import parse_ymd
+
+FILES = ("daily", "weekly", "monthly")
+
+
+def _dictreader_load(path: str, date_col: str, select_cols: Optional[List[str]] = None, as_of_date: Optional[datetime] = None) -> TimeSeriesFrame:
+    """The row-at-a-time loader ``from_csv`` used before the bulk reader."""
+    dates: List[datetime] = []
+    cols: Dict[str, List[float]] = {}
+    with open(path, "r", newline="") as f:
+        r = csv.DictReader(f)
+        if select_cols is None:
+            select_cols = [c for c in r.fieldnames if c != date_col]
+        for c in select_cols:
+            cols[c] = []
+        for row in r:
+            dt = parse_ymd(row[date_col])
+            if as_of_date is not None and dt > as_of_date:
+                break
+            dates.append(dt)
+            for c in select_cols:
+                try:
+                    v = float(row[c])
+                except Exception:
+                    v = float('nan')
+                cols[c].append(v)
+    return TimeSeriesFrame(dates, cols)
+
+
+def _bulk_load(path: str, date_col: str, select_cols: Optional[List[str]] = None, as_of_date: Optional[datetime] = None) -> TimeSeriesFrame:
+    return TimeSeriesFrame.from_csv(path, date_col, select_cols=select_cols, as_of_date=as_of_date, use_cache=False)
+
+
+def _best_of(fn, repeat: int, *args) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _same(a: TimeSeriesFrame, b: TimeSeriesFrame) -> bool:
+    return (
+        a.names == b.names
+        and np.array_equal(a.index, b.index)
+        and np.array_equal(a.values, b.values, equal_nan=True)
+    )
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--data-dir", default=os.path.join(CUR_DIR, "data", "merged"))
+    ap.add_argument("--date-col", default="date")
+    ap.add_argument("--select-cols", type=int, default=3, help="Number of leading columns to select in the second pass")
+    ap.add_argument("--as-of", default="2015-06-30", help="YYYY-MM-DD cut-off for the second pass")
+    ap.add_argument("--repeat", type=int, default=5, help="Loads per path; the fastest is reported")
+    args = ap.parse_args()
+
+    as_of = parse_ymd(args.as_of)
+    print(f"{'file':<10}{'shape':>12}{'selection':>22}{'DictReader ms':>16}{'bulk ms':>10}{'speedup':>10}")
+    status = 0
+    for freq in FILES:
+        path = os.path.join(args.data_dir, f"smf_{freq}_data.csv")
+        if not os.path.exists(path):
+            print(f"{freq:<10}  missing {path}")
+            continue
+        full = _bulk_load(path, args.date_col)
+        shape = f"{len(full)}x{len(full.names)}"
+        subset = full.names[:args.select_cols]
+        for label, select_cols, cut in (("all columns", None, None), (f"{len(subset)} cols, as-of", subset, as_of)):
+            call = (path, args.date_col, select_cols, cut)
+            if not _same(_dictreader_load(*call), _bulk_load(*call)):
+                print(f"{freq:<10}{shape:>12}{label:>22}  MISMATCH between the two paths")
+                status = 1
+                continue
+            old = _best_of(_dictreader_load, args.repeat, *call)
+            new = _best_of(_bulk_load, args.repeat, *call)
+            print(f"{freq:<10}{shape:>12}{label:>22}{old * 1e3:>16.1f}{new * 1e3:>10.1f}{old / new:>9.1f}x")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
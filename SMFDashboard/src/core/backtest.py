@@ -1,10 +1,18 @@
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+import multiprocessing as mp
+import random
+import zlib
+from bisect import bisect_right
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Tuple
 from datetime import datetime
 
+import numpy as np
+
 from .base import BaseModel
-from .features import assemble_supervised_v2
+from .features import FeatureBlock, build_feature_block
 from .metrics import rmse_mae
 from .utils import format_ymd, advance_date
 
@@ -33,6 +41,222 @@ def split_by_date(
     return out_d, out_X, out_y, out_yt
 
 
+def _date_rows(dates: List[datetime], start: datetime | None, end: datetime | None) -> List[int]:
+    """Positions of the origins ``split_by_date`` keeps for [start, end]."""
+    return [
+        i for i, d in enumerate(dates)
+        if (start is None or d >= start) and (end is None or d <= end)
+    ]
+
+
+def parse_strategy(strategy: str) -> Dict[str, object]:
+    """
+    Parse a backtest strategy string into its parameters.
+
+    Accepted forms: ``frozen``, ``refit`` (expanding window, refit at every
+    origin), ``rolling:<N>`` (only the last N training rows), ``refit_every:<k>``
+    (refit every k test origins, frozen in between) and comma-separated
+    combinations such as ``rolling:60,refit_every:3``.
+    Returns ``{"mode": "frozen"}`` or ``{"mode": "refit", "window": N|None, "refit_every": k}``.
+    """
+    text = (strategy or "frozen").strip().lower()
+    if text == "frozen":
+        return {"mode": "frozen"}
+    params: Dict[str, object] = {"mode": "refit", "window": None, "refit_every": 1}
+    for part in text.split(","):
+        name, _, value = part.strip().partition(":")
+        if name == "refit" and not value:
+            continue
+        if name in ("rolling", "refit_every"):
+            try:
+                n = int(value)
+            except ValueError:
+                n = 0
+            if n < 1:
+                raise ValueError(f"Strategy '{strategy}': {name} needs a positive integer, e.g. {name}:12")
+            params["window" if name == "rolling" else "refit_every"] = n
+            continue
+        raise ValueError(f"Unknown strategy: {strategy}")
+    return params
+
+
+def strategy_label(params: Dict[str, object]) -> str:
+    """Canonical strategy string for parsed parameters (inverse of ``parse_strategy``)."""
+    if params.get("mode") == "frozen":
+        return "frozen"
+    parts = []
+    if params.get("window"):
+        parts.append(f"rolling:{params['window']}")
+    if int(params.get("refit_every") or 1) > 1:
+        parts.append(f"refit_every:{params['refit_every']}")
+    return ",".join(parts) or "refit"
+
+
+def _train_windows(
+    dates: List[datetime], train_start: datetime | None, origins: List[int], window: int | None = None
+) -> Iterator[List[int]]:
+    """
+    Training rows for each refit origin: every row dated in [train_start, origin date],
+    in frame order (what ``split_by_date(..., train_start, d_cur)`` would select),
+    cut to the last ``window`` rows when given.
+    """
+    rows = _date_rows(dates, train_start, None)
+    if all(dates[a] < dates[b] for a, b in zip(rows, rows[1:])):
+        ends = [dates[j] for j in rows]
+        for i in origins:
+            stop = bisect_right(ends, dates[i])
+            yield rows[max(0, stop - window) if window else 0: stop]
+    else:
+        for i in origins:
+            sel = [j for j in rows if dates[j] <= dates[i]]
+            yield sel[-window:] if window else sel
+
+
+def _refit(
+    model: BaseModel | None,
+    fitted: List[int],
+    window: List[int],
+    model_factory,
+    model_params: Dict,
+    X: Dict[int, List[float]],
+    y: Dict[int, float],
+) -> BaseModel:
+    """
+    Bring ``model`` (trained on rows ``fitted``) to the rows in ``window``.
+    When the window only moved forward the model's ``update`` hook gets the
+    appended and dropped rows; otherwise, or if it declines, a fresh model is fit.
+    """
+    if model is not None and fitted and window[0] in fitted:
+        d = fitted.index(window[0])
+        keep = len(fitted) - d
+        if window[:keep] == fitted[d:]:
+            add, drop = window[keep:], fitted[:d]
+            if not add and not drop:
+                return model
+            if model.update(
+                [X[j] for j in add], [y[j] for j in add],
+                [X[j] for j in drop] or None, [y[j] for j in drop] or None,
+            ):
+                return model
+    model = model_factory(model_params)
+    model.fit([X[j] for j in window], [y[j] for j in window])
+    return model
+
+
+def _refit_schedule(
+    origins: List[int], windows: Iterator[List[int]], refit_every: int
+) -> List[Tuple[int, List[int] | None]]:
+    """
+    ``(origin, window)`` per predicted origin; window is None where the model
+    from the previous refit is reused. Origins with no training rows are skipped.
+    """
+    steps: List[Tuple[int, List[int] | None]] = []
+    since_fit = refit_every
+    for i, window in zip(origins, windows):
+        if not window:
+            continue
+        if since_fit >= refit_every:
+            steps.append((i, window))
+            since_fit = 0
+        else:
+            steps.append((i, None))
+        since_fit += 1
+    return steps
+
+
+# Refit points per segment: each segment starts from a fresh fit, so segments can
+# run in parallel and sliding-window downdates never accumulate past this many steps.
+_REFITS_PER_SEGMENT = 32
+
+
+def _split_segments(steps: List[Tuple[int, List[int] | None]]) -> List[List[Tuple[int, List[int] | None]]]:
+    """Split the schedule into contiguous runs of ``_REFITS_PER_SEGMENT`` refits (independent of n_jobs)."""
+    starts = [k for k, (_, w) in enumerate(steps) if w is not None][::_REFITS_PER_SEGMENT]
+    if not starts:
+        return [steps]
+    cuts = starts + [len(steps)]
+    return [steps[cuts[c]:cuts[c + 1]] for c in range(len(starts))]
+
+
+# Seed every backtest fit derives its task seed from unless the caller passes one
+DEFAULT_SEED = 0
+
+
+def _task_seed(seed: int | None, horizon: int, origin: int | None) -> int | None:
+    if seed is None:
+        return None
+    return zlib.crc32(f"{seed}:{horizon}:{origin}".encode())
+
+
+def _seed_globals(seed: int | None) -> None:
+    if seed is not None:
+        random.seed(seed)
+        np.random.seed(seed)
+
+
+@contextmanager
+def _caller_rng_kept() -> Iterator[None]:
+    """Restore the global ``random``/``numpy.random`` state that in-process tasks reseed."""
+    state = random.getstate(), np.random.get_state()
+    try:
+        yield
+    finally:
+        random.setstate(state[0])
+        np.random.set_state(state[1])
+
+
+def _fit_predict(model_factory, model_params: Dict, X_fit, y_fit, X_pred, seed: int | None,
+                 warm: Dict | None = None) -> List[float]:
+    """Frozen task: one fit (seeded from ``warm`` params if given), predictions for every test origin."""
+    _seed_globals(seed)
+    model: BaseModel = model_factory(model_params)
+    if warm is not None:
+        model.warm_start(warm)
+    model.fit(X_fit, y_fit)
+    return model.predict_batch(X_pred)
+
+
+def _refit_segment(model_factory, model_params: Dict, steps, X: Dict[int, List[float]], y: Dict[int, float],
+                   seed: int | None, horizon: int) -> List[float]:
+    """Refit task: walk a contiguous run of the schedule (X/y keyed by row position)."""
+    model: BaseModel | None = None
+    fitted: List[int] = []
+    preds: List[float] = []
+    pending: List[int] = []  # origins served by the current fit, scored in one batch
+    for i, window in steps:
+        if window is not None:
+            if pending:
+                preds.extend(model.predict_batch([X[j] for j in pending]))
+                pending = []
+            _seed_globals(_task_seed(seed, horizon, i))
+            model = _refit(model, fitted, window, model_factory, model_params, X, y)
+            fitted = window
+        pending.append(i)
+    if pending:
+        preds.extend(model.predict_batch([X[j] for j in pending]))
+    return preds
+
+
+def _run_tasks(tasks: List[Tuple], n_jobs: int, executor: str) -> List[List[float]]:
+    """
+    Run ``(fn, *args)`` tasks, in a pool when ``n_jobs`` > 1; results keep task
+    order. Tasks run in this process (serially or on threads) leave the
+    caller's global generators as they found them.
+    """
+    if n_jobs <= 1 or len(tasks) <= 1:
+        with _caller_rng_kept():
+            return [t[0](*t[1:]) for t in tasks]
+    if executor == "thread":
+        with _caller_rng_kept(), ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            return [f.result() for f in [pool.submit(*t) for t in tasks]]
+    if executor != "process":
+        raise ValueError(f"Unknown executor: {executor}")
+    methods = mp.get_all_start_methods()
+    with ProcessPoolExecutor(max_workers=n_jobs, mp_context=mp.get_context("fork") if "fork" in methods else None) as pool:
+        futures = [pool.submit(*t) for t in tasks]
+        return [f.result() for f in futures]
+
+
 def backtest_direct(
     model_factory,
     model_params: Dict,
@@ -44,82 +268,100 @@ def backtest_direct(
     train_range: Tuple[datetime | None, datetime | None],
     test_range: Tuple[datetime | None, datetime | None],
     strategy: str = "frozen",
+    feature_block: FeatureBlock | None = None,
+    n_jobs: int = 1,
+    executor: str = "process",
+    seed: int | None = DEFAULT_SEED,
+    warm_start: Dict[int, Dict] | None = None,
 ) -> Tuple[Dict[int, Dict[str, float]], List[Dict[str, object]]]:
     """
-    Direct multi-horizon backtest with frozen or refit strategies.
+    Direct multi-horizon backtest; ``strategy`` is parsed by ``parse_strategy``
+    (frozen, refit, rolling:<N>, refit_every:<k>).
     Returns per-horizon metrics and long-form rows per origin/horizon.
+    The feature block is built once (or passed in by the caller) and each
+    horizon's X/y is sliced from it.
+
+    With ``n_jobs`` > 1, horizons and runs of refit origins are fitted in a
+    ``executor`` ("process" or "thread") pool; rows keep the serial order.
+    The global ``random`` and ``numpy.random`` generators are reseeded before
+    each fresh fit from (seed, horizon, origin), whatever ``n_jobs`` is (None
+    means ``DEFAULT_SEED``), so results do not depend on the pool size or
+    scheduling; the caller's generator state is restored afterwards. Threads
+    share those generators, so models that draw from them (e.g. LSTM) are only
+    reproducible with the process executor. Process pools need a picklable
+    ``model_factory`` (plugin ``create`` functions are).
+
+    ``warm_start`` maps a horizon to fitted params (of the same plugin, on the
+    same training window) passed to the model's ``warm_start`` hook before the
+    frozen fit of that horizon; refit strategies always fit cold.
     """
     target_lags = features_cfg.get("target_lags", [0])
     exog_cfg = features_cfg.get("exog", {})
     train_start, train_end = train_range
     test_start, test_end = test_range
 
+    params = parse_strategy(strategy)
     all_rows: List[Dict[str, object]] = []
     metrics_by_h: Dict[int, Dict[str, float]] = {}
+    if seed is None:
+        seed = DEFAULT_SEED
 
+    if feature_block is None:
+        feature_block = build_feature_block(frame, target_id, features_cfg)
+
+    # Plan every fit first (one task per horizon for frozen, contiguous runs of
+    # origins for refit strategies), run the tasks, then emit rows in order.
+    plans: List[Tuple[int, List[datetime], List[float], List[float], List[int], List[int]]] = []
+    tasks: List[Tuple] = []
     for h in sorted(horizons):
-        dates, X, y, y_t = assemble_supervised_v2(
-            frame=frame,
-            target_id=target_id,
-            features_cfg=features_cfg,
-            horizon=h,
-        )
+        dates, X, y, y_t = feature_block.for_horizon(h)
         # train split by origin dates
-        d_tr, X_tr, y_tr, ytr_tr = split_by_date(dates, X, y, y_t, train_start, train_end)
-        d_te, X_te, y_te, ytr_te = split_by_date(dates, X, y, y_t, test_start, test_end)
+        tr_idx = _date_rows(dates, train_start, train_end)
+        te_idx = _date_rows(dates, test_start, test_end)
 
-        if not d_tr or not d_te:
+        if not tr_idx or not te_idx:
             metrics_by_h[h] = {"rmse": float("nan"), "mae": float("nan")}
             continue
+        metrics_by_h[h] = {}
 
-        if strategy == "frozen":
-            model: BaseModel = model_factory(model_params)
-            model.fit(X_tr, y_tr)
-            preds: List[float] = [model.predict_row(x) for x in X_te]
-            m = rmse_mae(y_te, preds)
-            metrics_by_h[h] = m
-            for d, yt, a, f in zip(d_te, ytr_te, y_te, preds):
-                all_rows.append({
-                    "origin_date": format_ymd(d),
-                    "target_date": format_ymd(advance_date(d, freq=freq, steps=h)),
-                    "horizon": h,
-                    "y_t": yt,
-                    "forecast": f,
-                    "actual": a,
-                    "error": a - f,
-                })
-        elif strategy == "refit":
-            preds: List[float] = []
-            acts: List[float] = []
-            rows_local: List[Dict[str, object]] = []
-            # For each test origin, refit using all available training origins up to that origin
-            for d_cur in d_te:
-                # Build cumulative train window: <= d_cur
-                d_tr_c, X_tr_c, y_tr_c, _ = split_by_date(dates, X, y, y_t, train_start, d_cur)
-                if not d_tr_c:
-                    continue
-                model: BaseModel = model_factory(model_params)
-                model.fit(X_tr_c, y_tr_c)
-                # Locate index of current origin
-                idx = d_te.index(d_cur)
-                x_row = X_te[idx]
-                a = y_te[idx]
-                f = model.predict_row(x_row)
-                preds.append(f)
-                acts.append(a)
-                rows_local.append({
-                    "origin_date": format_ymd(d_cur),
-                    "target_date": format_ymd(advance_date(d_cur, freq=freq, steps=h)),
-                    "horizon": h,
-                    "y_t": ytr_te[idx],
-                    "forecast": f,
-                    "actual": a,
-                    "error": a - f,
-                })
-            m = rmse_mae(acts, preds)
-            metrics_by_h[h] = m
-            all_rows.extend(rows_local)
+        if params["mode"] == "frozen":
+            origins = te_idx
+            tasks.append((_fit_predict, model_factory, model_params,
+                          [X[j] for j in tr_idx], [y[j] for j in tr_idx], [X[i] for i in te_idx],
+                          _task_seed(seed, h, None), (warm_start or {}).get(h)))
+            spans = [len(tasks) - 1]
         else:
-            raise ValueError(f"Unknown strategy: {strategy}")
+            # For each test origin, refit on the training origins up to that origin (all of
+            # them, or the last `window`), every `refit_every` origins. Consecutive windows
+            # overlap, so models with an ``update`` hook only see the appended/dropped rows.
+            steps = _refit_schedule(
+                te_idx, _train_windows(dates, train_start, te_idx, params["window"]), params["refit_every"]
+            )
+            origins = [i for i, _ in steps]
+            spans = []
+            for segment in _split_segments(steps):
+                rows_used = sorted({i for i, _ in segment} | {j for _, w in segment if w for j in w})
+                tasks.append((_refit_segment, model_factory, model_params, segment,
+                              {j: X[j] for j in rows_used}, {j: y[j] for j in rows_used}, seed, h))
+                spans.append(len(tasks) - 1)
+        plans.append((h, dates, y, y_t, origins, spans))
+
+    results = _run_tasks(tasks, n_jobs, executor)
+
+    for h, dates, y, y_t, origins, spans in plans:
+        preds: List[float] = [f for t in spans for f in results[t]]
+        acts: List[float] = [y[i] for i in origins]
+        metrics_by_h[h] = rmse_mae(acts, preds)
+        for i, a, f in zip(origins, acts, preds):
+            d = dates[i]
+            all_rows.append({
+                "origin_date": format_ymd(d),
+                "target_date": format_ymd(advance_date(d, freq=freq, steps=h)),
+                "horizon": h,
+                "y_t": y_t[i],
+                "forecast": f,
+                "actual": a,
+                "error": a - f,
+            })
 
     return metrics_by_h, all_rows
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 
 class BaseModel(ABC):
@@ -9,7 +9,8 @@ class BaseModel(ABC):
     Minimal plugin model API for v2.
 
     Models receive a numeric feature matrix X and target vector y to fit.
-    Prediction uses a single feature row (same column order used at fit-time).
+    Prediction uses a single feature row (same column order used at fit-time),
+    or a matrix of such rows via predict_batch.
     Parameters are persisted via get_params/set_params by the engine.
     """
 
@@ -21,10 +22,45 @@ class BaseModel(ABC):
     def predict_row(self, x_row: List[float]) -> float:
         ...
 
+    def predict_batch(self, X: List[List[float]]) -> List[float]:
+        """
+        ``predict_row`` for every row of the rectangular matrix ``X``, e.g. a
+        backtest's whole test window in one call. Plugins may override this
+        with a vectorized version, which must return exactly what the per-row
+        calls would; the default loops over the rows.
+        """
+        return [self.predict_row(x) for x in X]
+
     @abstractmethod
     def get_params(self) -> Dict:
         ...
 
+    def update(
+        self,
+        X_new: List[List[float]],
+        y_new: List[float],
+        X_drop: Optional[List[List[float]]] = None,
+        y_drop: Optional[List[float]] = None,
+    ) -> bool:
+        """
+        Move a fitted model's training set forward: append ``X_new``/``y_new``
+        after the rows it has seen and, for sliding windows, remove the oldest
+        rows ``X_drop``/``y_drop``, as if ``fit`` had been called on the result.
+        Return False (without changing state) if the model cannot do this
+        cheaply; the engine then refits from scratch.
+        """
+        return False
+
+    def warm_start(self, params: Dict) -> bool:
+        """
+        Seed the next ``fit`` from ``params``: the ``get_params`` of the same
+        plugin fitted on the same rows with different hyperparameters (e.g. a
+        cached neighbour in an alpha sweep). ``fit`` must still arrive at what
+        a cold fit would, up to the model's convergence tolerance. Return False
+        if the model cannot use them; it then fits from scratch.
+        """
+        return False
+
     @abstractmethod
     def set_params(self, params: Dict) -> None:
         ...
@@ -37,7 +73,7 @@ class ModelSpec:
     Fields (all optional; used for defaults/validation):
     - frequency: list[str] or "any"
     - input: {"target": {"lags": [int, ...]}, "exog": {name: {"lags": [...]}}}
-    - strategies: list[str] subset of {"frozen", "refit"}
+    - strategies: list[str] subset of {"frozen", "refit"} (refit also covers rolling:<N> / refit_every:<k>)
     - supports_horizons: "any" or list[int]
     """
 
@@ -0,0 +1,268 @@
+"""
+Content-addressed blob store for sharing cached models between runs.
+
+Every file is stored once under ``blobs/<2 hex>/<62 hex>``, named by its
+sha256. It is written to ``tmp/`` first and moved into place with an atomic
+rename, so concurrent writers of the same content never expose a partial
+file; blobs are immutable (mode 0444). A cache entry is a small JSON ref,
+``refs/<cache_key>.json``, holding the entry's index row and its files by
+digest; the refs directory is the store's index.
+
+Several ``run_v2.py`` processes, checkouts and users on one host can share a
+store (for several users make the directory group-writable with the setgid
+bit). Publishers hold a shared ``flock`` on ``.lock`` while ``gc`` holds it
+exclusively, so a blob is never collected between being written and being
+referenced. A gzipped tarball of the same layout moves a warm store between
+hosts; imports verify every blob against its name.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
+import tarfile
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import BinaryIO, Dict, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows; the store is then unlocked
+    fcntl = None
+
+_DIGEST = re.compile(r"^[0-9a-f]{64}$")
+_KEY = re.compile(r"^[0-9A-Za-z_-]+$")
+_BLOB_MEMBER = re.compile(r"^blobs/([0-9a-f]{2})/([0-9a-f]{62})$")
+_REF_MEMBER = re.compile(r"^refs/([0-9A-Za-z_-]+)\.json$")
+_CHUNK = 1 << 20
+
+
+def safe_relpath(rel: str) -> bool:
+    """True for a relative ``/``-separated path that stays inside its root."""
+    parts = rel.split("/")
+    return bool(rel) and not rel.startswith("/") and all(p not in ("", ".", "..") for p in parts) and "\\" not in rel
+
+
+def _valid_ref(key: str, ref: object) -> bool:
+    if not isinstance(ref, dict) or ref.get("key") != key or not isinstance(ref.get("entry"), dict):
+        return False
+    files = ref.get("files")
+    return isinstance(files, dict) and all(
+        isinstance(rel, str) and safe_relpath(rel) and isinstance(d, str) and _DIGEST.match(d)
+        for rel, d in files.items()
+    )
+
+
+class BlobStore:
+    """sha256-addressed files plus one ref per cache entry under ``root``."""
+
+    def __init__(self, root: str):
+        self.root = root
+        self.blobs_dir = os.path.join(root, "blobs")
+        self.refs_dir = os.path.join(root, "refs")
+        self.tmp_dir = os.path.join(root, "tmp")
+        self._lock_path = os.path.join(root, ".lock")
+        for d in (self.blobs_dir, self.refs_dir, self.tmp_dir):
+            os.makedirs(d, exist_ok=True)
+
+    # --- Blobs ---
+    def blob_path(self, digest: str) -> str:
+        return os.path.join(self.blobs_dir, digest[:2], digest[2:])
+
+    def has(self, digest: str) -> bool:
+        return os.path.exists(self.blob_path(digest))
+
+    def _put_stream(self, src: BinaryIO, expected: Optional[str] = None) -> str:
+        """Copy ``src`` into the store while hashing it; returns the digest."""
+        fd, tmp = tempfile.mkstemp(dir=self.tmp_dir)
+        try:
+            h = hashlib.sha256()
+            with os.fdopen(fd, "wb") as dst:
+                for chunk in iter(lambda: src.read(_CHUNK), b""):
+                    h.update(chunk)
+                    dst.write(chunk)
+            digest = h.hexdigest()
+            if expected is not None and digest != expected:
+                raise ValueError(f"Blob content does not match its name {expected}")
+            path = self.blob_path(digest)
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.chmod(tmp, 0o444)
+                os.replace(tmp, path)
+            return digest
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+    def put_file(self, path: str) -> str:
+        with open(path, "rb") as f:
+            return self._put_stream(f)
+
+    # --- Refs ---
+    def _ref_path(self, key: str) -> str:
+        if not _KEY.match(key):
+            raise ValueError(f"Invalid cache key '{key}'")
+        return os.path.join(self.refs_dir, f"{key}.json")
+
+    def get_ref(self, key: str) -> Optional[Dict]:
+        """The ref for ``key``, or None if it is absent, malformed or missing blobs."""
+        try:
+            with open(self._ref_path(key), "r") as f:
+                ref = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not _valid_ref(key, ref) or not all(self.has(d) for d in ref["files"].values()):
+            return None
+        return ref
+
+    def put_ref(self, key: str, ref: Dict) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.tmp_dir)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(ref, f, indent=2)
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, self._ref_path(key))
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+    def keys(self) -> List[str]:
+        return sorted(n[:-5] for n in os.listdir(self.refs_dir) if n.endswith(".json") and _KEY.match(n[:-5]))
+
+    @contextmanager
+    def lock(self, exclusive: bool = False) -> Iterator[None]:
+        """Hold ``.lock`` shared (publish/import) or exclusive (gc)."""
+        if fcntl is None:
+            yield
+            return
+        try:
+            fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o666)
+        except PermissionError:
+            # A store mounted read-only for this user can still be locked for reading
+            fd = os.open(self._lock_path, os.O_RDONLY)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+        finally:
+            os.close(fd)
+
+    def publish(self, key: str, files: Dict[str, str], entry: Dict) -> Dict:
+        """
+        Store ``files`` (``relpath -> local path``) and point ``key``'s ref at
+        them together with the entry's index row.
+        """
+        with self.lock():
+            digests = {rel: self.put_file(path) for rel, path in sorted(files.items())}
+            ref = {"key": key, "published": time.time(), "entry": entry, "files": digests}
+            self.put_ref(key, ref)
+        return ref
+
+    # --- Maintenance ---
+    def gc(self, min_age_seconds: float = 3600.0) -> Dict[str, int]:
+        """
+        Delete blobs no ref points at and temp files older than
+        ``min_age_seconds`` (left by interrupted writers).
+
+        Returns:
+            Counts of removed blobs and freed bytes
+        """
+        removed = freed = 0
+        with self.lock(exclusive=True):
+            live = set()
+            for key in self.keys():
+                try:
+                    with open(self._ref_path(key), "r") as f:
+                        live.update(json.load(f).get("files", {}).values())
+                except (OSError, ValueError):
+                    continue
+            for prefix in os.listdir(self.blobs_dir):
+                sub = os.path.join(self.blobs_dir, prefix)
+                for name in os.listdir(sub):
+                    if prefix + name not in live:
+                        path = os.path.join(sub, name)
+                        freed += os.path.getsize(path)
+                        os.unlink(path)
+                        removed += 1
+            cutoff = time.time() - min_age_seconds
+            for name in os.listdir(self.tmp_dir):
+                path = os.path.join(self.tmp_dir, name)
+                if os.path.getmtime(path) < cutoff:
+                    os.unlink(path)
+        return {"removed_blobs": removed, "freed_bytes": freed}
+
+    # --- Transfer between hosts ---
+    def export_tar(self, path: str, keys: Optional[List[str]] = None) -> int:
+        """
+        Write the refs for ``keys`` (default: all) and their blobs to a gzipped
+        tarball. Blobs come first so a truncated archive never carries a ref
+        without its files. Returns the number of refs written.
+        """
+        refs = {}
+        for key in self.keys() if keys is None else keys:
+            ref = self.get_ref(key)
+            if ref is not None:
+                refs[key] = ref
+
+        def reset_owner(info: tarfile.TarInfo) -> tarfile.TarInfo:
+            info.uid = info.gid = 0
+            info.uname = info.gname = ""
+            return info
+
+        with self.lock(), tarfile.open(path, "w:gz") as tar:
+            for digest in sorted({d for ref in refs.values() for d in ref["files"].values()}):
+                tar.add(self.blob_path(digest), arcname=f"blobs/{digest[:2]}/{digest[2:]}", filter=reset_owner)
+            for key, ref in sorted(refs.items()):
+                data = json.dumps(ref, indent=2).encode("utf-8")
+                info = tarfile.TarInfo(f"refs/{key}.json")
+                info.size = len(data)
+                info.mtime = int(time.time())
+                info.mode = 0o644
+                tar.addfile(info, io.BytesIO(data))
+        return len(refs)
+
+    def import_tar(self, path: str) -> List[str]:
+        """
+        Add the blobs and refs of an ``export_tar`` archive. Blobs are verified
+        against their names; existing refs are kept; other members are ignored.
+
+        Returns:
+            Keys whose refs are now in the store
+        """
+        refs: Dict[str, Dict] = {}
+        with self.lock(), tarfile.open(path, "r:*") as tar:
+            for member in tar:
+                if not member.isfile():
+                    continue
+                blob = _BLOB_MEMBER.match(member.name)
+                ref = _REF_MEMBER.match(member.name)
+                if blob:
+                    digest = blob.group(1) + blob.group(2)
+                    if not self.has(digest):
+                        self._put_stream(tar.extractfile(member), expected=digest)
+                elif ref:
+                    data = json.loads(tar.extractfile(member).read().decode("utf-8"))
+                    if _valid_ref(ref.group(1), data):
+                        refs[ref.group(1)] = data
+            imported = []
+            for key, ref in refs.items():
+                if self.get_ref(key) is None:
+                    if not all(self.has(d) for d in ref["files"].values()):
+                        continue
+                    self.put_ref(key, ref)
+                imported.append(key)
+        return sorted(imported)
+
+
+@contextmanager
+def scratch_store(parent: str) -> Iterator[BlobStore]:
+    """A temporary store under ``parent`` (same filesystem, so blobs can be hardlinked out)."""
+    root = tempfile.mkdtemp(prefix=".blobs-", dir=parent)
+    try:
+        yield BlobStore(root)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
@@ -12,47 +12,339 @@ from __future__ import annotations
 import os
 import json
 import hashlib
+import math
 import shutil
-from typing import Dict, List, Optional, Tuple, Any
+import sqlite3
+import sys
+from bisect import bisect_right
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from datetime import datetime
 import pickle
 
+from . import cache_codec
+from .blob_store import BlobStore, safe_relpath, scratch_store
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    cache_key        TEXT PRIMARY KEY,
+    created          TEXT NOT NULL,
+    model_name       TEXT,
+    target_id        TEXT,
+    data_fingerprint TEXT,
+    strategy         TEXT,
+    n_horizons       INTEGER NOT NULL DEFAULT 0,
+    horizons         TEXT NOT NULL DEFAULT '[]',
+    metadata         TEXT NOT NULL DEFAULT '{}',
+    metrics_summary  TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS idx_entries_model ON entries(model_name);
+CREATE INDEX IF NOT EXISTS idx_entries_target ON entries(target_id);
+CREATE INDEX IF NOT EXISTS idx_entries_fingerprint ON entries(data_fingerprint);
+CREATE INDEX IF NOT EXISTS idx_entries_created ON entries(created);
+CREATE TABLE IF NOT EXISTS entry_columns (
+    cache_key   TEXT NOT NULL REFERENCES entries(cache_key) ON DELETE CASCADE,
+    column_name TEXT NOT NULL,
+    column_hash TEXT NOT NULL,
+    PRIMARY KEY (cache_key, column_name)
+);
+CREATE INDEX IF NOT EXISTS idx_entry_columns_column ON entry_columns(column_name);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Schema changes after the initial layout, applied in order (PRAGMA user_version counts them)
+_MIGRATIONS = (
+    ("ALTER TABLE entries ADD COLUMN data_end TEXT",),
+    (
+        # Entry sizes (NULL until measured) and access tracking for eviction
+        "ALTER TABLE entries ADD COLUMN size_bytes INTEGER",
+        "ALTER TABLE entries ADD COLUMN last_access TEXT",
+        "ALTER TABLE entries ADD COLUMN access_count INTEGER NOT NULL DEFAULT 0",
+        "UPDATE entries SET last_access = created",
+        "CREATE INDEX idx_entries_lru ON entries(last_access)",
+        "CREATE INDEX idx_entries_lfu ON entries(access_count, last_access)",
+        "CREATE INDEX idx_entries_unsized ON entries(cache_key) WHERE size_bytes IS NULL",
+        # Running totals kept by triggers so stats never scan the table or the tree
+        "CREATE TABLE totals (name TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+        "INSERT INTO totals (name, value) SELECT 'entries', COUNT(*) FROM entries",
+        "INSERT INTO totals (name, value) SELECT 'models', COALESCE(SUM(n_horizons), 0) FROM entries",
+        "INSERT INTO totals (name, value) VALUES ('bytes', 0)",
+        """CREATE TRIGGER entries_totals_insert AFTER INSERT ON entries BEGIN
+            UPDATE totals SET value = value + CASE name
+                WHEN 'entries' THEN 1 WHEN 'models' THEN NEW.n_horizons
+                ELSE COALESCE(NEW.size_bytes, 0) END;
+        END""",
+        """CREATE TRIGGER entries_totals_update AFTER UPDATE OF n_horizons, size_bytes ON entries BEGIN
+            UPDATE totals SET value = value + CASE name
+                WHEN 'entries' THEN 0 WHEN 'models' THEN NEW.n_horizons - OLD.n_horizons
+                ELSE COALESCE(NEW.size_bytes, 0) - COALESCE(OLD.size_bytes, 0) END;
+        END""",
+        """CREATE TRIGGER entries_totals_delete AFTER DELETE ON entries BEGIN
+            UPDATE totals SET value = value - CASE name
+                WHEN 'entries' THEN 1 WHEN 'models' THEN OLD.n_horizons
+                ELSE COALESCE(OLD.size_bytes, 0) END;
+        END""",
+    ),
+)
+
+_ENTRY_COLUMNS = (
+    "cache_key", "created", "model_name", "target_id", "data_fingerprint",
+    "strategy", "n_horizons", "horizons", "metadata", "metrics_summary", "data_end",
+    "size_bytes", "last_access",
+)
+
+EVICTION_POLICIES = {
+    "lru": "last_access ASC",
+    "lfu": "access_count ASC, last_access ASC",
+}
+
+# Top-level entry directories, as named in blob store refs
+_ENTRY_ROOTS = ("models", "results")
+
+# Rendered run outputs kept per entry (paths relative to an ``OutputManager`` run directory)
+OUTPUT_FILES = (
+    os.path.join("forecasts", "backtest.csv"),
+    os.path.join("metrics", "metrics.csv"),
+    os.path.join("artifacts", "feature_manifest.json"),
+)
+_FICLONE = 0x40049409  # linux/fs.h: share the source file's extents (btrfs, XFS, ...)
+
+_UPSERT = (
+    f"INSERT INTO entries ({', '.join(_ENTRY_COLUMNS)}) VALUES ({', '.join('?' * len(_ENTRY_COLUMNS))}) "
+    "ON CONFLICT(cache_key) DO UPDATE SET "
+    + ", ".join(f"{c} = excluded.{c}" for c in _ENTRY_COLUMNS[1:])
+)
+
+
+def _param_distance(a: Dict, b: Dict) -> float:
+    """Distance between two ``model_params`` dicts (see ``CacheManager.find_neighbours``)."""
+    d = 0.0
+    for k in set(a) | set(b):
+        x, y = a.get(k), b.get(k)
+        if x == y:
+            continue
+        numeric = all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in (x, y))
+        if numeric and x > 0 and y > 0:
+            d += abs(math.log(x / y))
+        elif numeric:
+            d += abs(x - y) / max(abs(x), abs(y))
+        else:
+            d += 1.0
+    return d
+
+
+def _link_file(src: str, dst: str) -> str:
+    """
+    Make ``dst`` a copy of ``src`` as cheaply as the filesystem allows: a
+    reflink, then a hardlink, then a plain copy. Returns the method used.
+    """
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    if fcntl is not None and sys.platform.startswith("linux"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            return "reflink"
+        except OSError:
+            if os.path.exists(dst):
+                os.unlink(dst)
+    try:
+        os.link(src, dst)
+        return "hardlink"
+    except OSError:
+        shutil.copy2(src, dst)
+        return "copy"
+
 
 class CacheManager:
     """Manages model and result caching for nowcasting runs."""
 
-    def __init__(self, base_dir: str = "v2-claude/model_library", verbose: bool = False):
+    def __init__(
+        self,
+        base_dir: str = "v2-claude/model_library",
+        verbose: bool = False,
+        max_bytes: Optional[int] = None,
+        eviction: str = "lru",
+        shared_dir: Optional[str] = None,
+    ):
         """
         Initialize the cache manager.
 
         Args:
             base_dir: Base directory for the model library
             verbose: Enable verbose logging
+            max_bytes: Byte budget for cached entries (None = unbounded)
+            eviction: Which entries to drop first when over budget ("lru" or "lfu")
+            shared_dir: Content-addressed store shared with other runs and users
+                (see ``core.blob_store``); saved entries are published to it and
+                local misses are looked up in it
         """
+        if eviction not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy '{eviction}' (expected one of {sorted(EVICTION_POLICIES)})")
         self.base_dir = base_dir
         self.models_dir = os.path.join(base_dir, "models")
         self.results_dir = os.path.join(base_dir, "results")
-        self.index_path = os.path.join(base_dir, "index.json")
+        self.index_path = os.path.join(base_dir, "index.sqlite")
         self.verbose = verbose
+        self.max_bytes = max_bytes
+        self.eviction = eviction
+        # Keys looked up, saved or given outputs through this manager; never evicted by it
+        self._pinned: set = set()
+        self.shared = BlobStore(shared_dir) if shared_dir else None
+        # Bytes served from / stored into the library through this manager (run telemetry)
+        self.io = {"bytes_read": 0, "bytes_written": 0}
 
         # Create directories if they don't exist
         os.makedirs(self.models_dir, exist_ok=True)
         os.makedirs(self.results_dir, exist_ok=True)
 
-        # Load or initialize index
-        self.index = self._load_index()
+        # Open the index (created on first use) and import a legacy index.json once
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_pid: Optional[int] = None
+        self._connect()
+        self._migrate_json_index()
+        self._measure_unsized()
 
-    def _load_index(self) -> Dict:
-        """Load the cache index from disk."""
-        if os.path.exists(self.index_path):
-            with open(self.index_path, 'r') as f:
-                return json.load(f)
-        return {"entries": {}, "metadata": {"created": datetime.now().isoformat()}}
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Return this process's connection to the SQLite index.
 
-    def _save_index(self):
-        """Save the cache index to disk."""
-        with open(self.index_path, 'w') as f:
-            json.dump(self.index, f, indent=2)
+        The index runs in WAL mode so readers never block the single writer;
+        connections are reopened after a fork (``run_v2 --jobs`` workers).
+        """
+        if self._db is None or self._db_pid != os.getpid():
+            conn = sqlite3.connect(self.index_path, timeout=60.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.executescript(_SCHEMA)
+            conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('created', ?)",
+                         (datetime.now().isoformat(),))
+            self._db, self._db_pid = conn, os.getpid()
+            self._migrate_schema()
+        return self._db
+
+    def _migrate_schema(self) -> None:
+        """Bring an index created by an older version up to the current ``_MIGRATIONS``."""
+        if self._db.execute("PRAGMA user_version").fetchone()[0] >= len(_MIGRATIONS):
+            return
+        with self._transaction() as conn:
+            # Re-read under the write lock: another process may have migrated meanwhile
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            for statements in _MIGRATIONS[version:]:
+                for statement in statements:
+                    conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {len(_MIGRATIONS)}")
+
+    def _entry_size(self, cache_key: str) -> int:
+        """Bytes on disk under an entry's model and result directories."""
+        total = 0
+        for root_dir in (self.models_dir, self.results_dir):
+            for root, dirs, files in os.walk(os.path.join(root_dir, cache_key)):
+                for file in files:
+                    try:
+                        total += os.path.getsize(os.path.join(root, file))
+                    except OSError:
+                        pass
+        return total
+
+    def _measure_unsized(self) -> None:
+        """Record sizes for entries created before sizes were tracked (migrated indexes)."""
+        conn = self._connect()
+        keys = [k for (k,) in conn.execute("SELECT cache_key FROM entries WHERE size_bytes IS NULL")]
+        if not keys:
+            return
+        sizes = [(self._entry_size(k), k) for k in keys]
+        with self._transaction() as conn:
+            conn.executemany("UPDATE entries SET size_bytes = ? WHERE cache_key = ? AND size_bytes IS NULL", sizes)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a block of statements as one write transaction (rolled back on error)."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close the index connection (reopened on next use)."""
+        if self._db is not None and self._db_pid == os.getpid():
+            self._db.close()
+        self._db = self._db_pid = None
+
+    @staticmethod
+    def _entry_row(cache_key: str, entry: Dict) -> Tuple:
+        """Flatten an index entry into the ``entries`` column order."""
+        metadata = entry.get("metadata") or {}
+        horizons = list(entry.get("horizons") or [])
+        return (
+            cache_key,
+            entry.get("created") or datetime.now().isoformat(),
+            metadata.get("model_name"),
+            metadata.get("target_id"),
+            metadata.get("data_fingerprint"),
+            metadata.get("strategy"),
+            len(horizons),
+            json.dumps(horizons),
+            json.dumps(metadata),
+            json.dumps(entry.get("metrics_summary") or {}),
+            metadata.get("data_end"),
+            entry.get("size_bytes"),
+            entry.get("last_access") or entry.get("created") or datetime.now().isoformat(),
+        )
+
+    @staticmethod
+    def _row_entry(row: Tuple) -> Dict:
+        """Inverse of ``_entry_row`` for rows selected as ``created, horizons, metadata, metrics_summary``."""
+        return {
+            "created": row[0],
+            "metadata": json.loads(row[2]),
+            "horizons": json.loads(row[1]),
+            "metrics_summary": json.loads(row[3]),
+        }
+
+    def _migrate_json_index(self) -> None:
+        """Import entries from a pre-SQLite ``index.json`` and rename it to ``index.json.migrated``."""
+        legacy_path = os.path.join(self.base_dir, "index.json")
+        if not os.path.exists(legacy_path):
+            return
+        with self._transaction() as conn:
+            try:
+                with open(legacy_path, 'r') as f:
+                    legacy = json.load(f)
+            except FileNotFoundError:
+                return  # another process finished the migration first
+            except ValueError:
+                legacy = {}
+            # INSERT OR IGNORE keeps the migration idempotent if two processes race here
+            conn.executemany(
+                f"INSERT OR IGNORE INTO entries ({', '.join(_ENTRY_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(_ENTRY_COLUMNS))})",
+                [self._entry_row(k, e) for k, e in (legacy.get("entries") or {}).items()],
+            )
+            created = (legacy.get("metadata") or {}).get("created")
+            if created:
+                conn.execute("UPDATE meta SET value = ? WHERE key = 'created' AND value > ?", (created, created))
+        try:
+            os.replace(legacy_path, legacy_path + ".migrated")
+            os.unlink(legacy_path + ".lock")
+        except FileNotFoundError:
+            pass
+        if self.verbose:
+            print(f"[Cache] Migrated {len(legacy.get('entries') or {})} entries from {legacy_path}")
 
     def generate_cache_key(
         self,
@@ -65,11 +357,19 @@ class CacheManager:
         test_range: Tuple[Optional[datetime], Optional[datetime]],
         data_fingerprint: str,
         frequency: str,
-        strategy: str
+        strategy: str,
+        seed: Optional[int] = None,
+        with_params: bool = True
     ) -> str:
         """
         Generate a unique cache key for a model configuration.
 
+        With ``with_params=False`` the model parameters are left out, giving
+        the key of the parameter family every hyperparameter variant of this
+        configuration shares (see ``find_neighbours``). ``seed`` is the seed
+        the backtest fits were derived from, so entries trained under another
+        seeding are not served.
+
         Returns:
             A hexadecimal hash string uniquely identifying this configuration
         """
@@ -90,8 +390,11 @@ class CacheManager:
             ],
             "data_fingerprint": data_fingerprint,
             "frequency": frequency,
-            "strategy": strategy
+            "strategy": strategy,
+            "seed": seed,
         }
+        if not with_params:
+            del config["model_params"]
 
         # Convert to canonical JSON string for consistent hashing
         config_str = json.dumps(config, sort_keys=True, separators=(',', ':'))
@@ -135,83 +438,260 @@ class CacheManager:
 
         return normalized
 
-    def compute_data_fingerprint(self, frame) -> str:
+    def compute_column_hashes(
+        self, frame, columns: Optional[List[str]] = None, stop: Optional[int] = None
+    ) -> Dict[str, str]:
+        """
+        Per-column content hashes (date index + column buffer).
+
+        Hashes cover rows ``[0, stop)`` (default: all rows) and are memoized on
+        the frame and, for full CSV loads, in the frame's binary sidecar until
+        the source file changes. Requested columns that are absent from the
+        frame map to ``"missing"``.
+        """
+        names = sorted(frame.columns.keys()) if columns is None else sorted(set(columns))
+        return {c: (frame.column_hash(c, stop) if c in frame.columns else "missing") for c in names}
+
+    def compute_data_fingerprint(
+        self, frame, columns: Optional[List[str]] = None, stop: Optional[int] = None
+    ) -> str:
         """
         Compute a fingerprint of the data frame for change detection.
 
+        Every value is covered (via ``compute_column_hashes``), so a revision
+        anywhere in the history changes the fingerprint.
+
         Args:
             frame: TimeSeriesFrame object
+            columns: Restrict the fingerprint to these columns (default: all)
+            stop: Restrict the fingerprint to the first ``stop`` rows (default: all)
 
         Returns:
             A hash string representing the data content
         """
-        # Create a fingerprint based on shape, columns, and sample of data
+        dates = frame.dates[:stop]
+        column_hashes = self.compute_column_hashes(frame, columns, stop)
         fingerprint_data = {
-            "shape": (len(frame.dates), len(frame.columns)),
-            "columns": sorted(frame.columns.keys()),
+            "shape": (len(dates), len(column_hashes)),
+            "columns": sorted(column_hashes),
             "date_range": [
-                frame.dates[0].isoformat() if frame.dates else None,
-                frame.dates[-1].isoformat() if frame.dates else None
+                dates[0].isoformat() if dates else None,
+                dates[-1].isoformat() if dates else None
             ],
-            # Sample first and last few rows for change detection
-            "sample_checksum": self._compute_data_sample_checksum(frame)
+            "column_hashes": column_hashes
         }
 
         fingerprint_str = json.dumps(fingerprint_data, sort_keys=True)
         return hashlib.md5(fingerprint_str.encode()).hexdigest()
 
-    def _compute_data_sample_checksum(self, frame) -> str:
-        """Compute checksum of data samples for fingerprinting."""
-        sample_size = min(5, len(frame.dates))
-        if sample_size == 0:
-            return ""
+    def compute_entry_fingerprint(
+        self,
+        frame,
+        manifest: Dict,
+        horizons: List[int],
+        data_end: Optional[datetime],
+    ) -> Dict[str, Any]:
+        """
+        Fingerprint exactly the data one cache entry reads.
 
-        # Sample first and last rows
-        sample_data = []
-        for i in list(range(sample_size)) + list(range(-sample_size, 0)):
-            if 0 <= i < len(frame.dates):
-                row = []
-                for col in sorted(frame.columns.keys()):
-                    val = frame.columns[col][i] if i < len(frame.columns[col]) else None
-                    row.append(str(val))
-                sample_data.append(",".join(row))
+        Only ``manifest["source_columns"]`` are hashed, over rows from the start
+        of the frame (recursive transforms such as EMA see all history) up to
+        the last date the run uses: ``data_end`` (the later of train/test end;
+        None means open-ended) plus the longest horizon and any feature lead.
+        Appending months or revising other columns leaves the result unchanged.
 
-        return hashlib.md5("\n".join(sample_data).encode()).hexdigest()
+        Returns:
+            ``{"data_fingerprint", "column_hashes", "data_end"}`` where
+            ``data_end`` is the last hashed date (None when all rows are hashed)
+        """
+        stop = None
+        if data_end is not None:
+            stop = bisect_right(frame.dates, data_end) + max(horizons, default=0) + int(manifest.get("max_lead", 0))
+            stop = min(stop, len(frame.dates))
+        columns = manifest["source_columns"]
+        return {
+            "data_fingerprint": self.compute_data_fingerprint(frame, columns, stop),
+            "column_hashes": self.compute_column_hashes(frame, columns, stop),
+            "data_end": frame.dates[stop - 1].isoformat() if stop else None,
+        }
 
     def check_cache(self, cache_key: str) -> Optional[Dict]:
         """
-        Check if a cache entry exists for the given key.
+        Check if a cache entry exists for the given key (in the local library,
+        else in the shared store, from which it is then adopted).
+
+        Every lookup pins the key for the lifetime of this manager, so a miss
+        that is then trained (possibly saved by a ``--jobs`` worker's own
+        manager) is not evicted by this run. A hit also counts as an access.
 
         Returns:
             Cache entry metadata if exists, None otherwise
         """
-        return self.index["entries"].get(cache_key)
+        conn = self._connect()
+        self._pinned.add(cache_key)
+        row = conn.execute(
+            "SELECT created, horizons, metadata, metrics_summary FROM entries WHERE cache_key = ?",
+            (cache_key,),
+        ).fetchone()
+        if row is None and self.adopt(cache_key):
+            row = conn.execute(
+                "SELECT created, horizons, metadata, metrics_summary FROM entries WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+        if row is None:
+            return None
+        conn.execute(
+            "UPDATE entries SET last_access = ?, access_count = access_count + 1 WHERE cache_key = ?",
+            (datetime.now().isoformat(), cache_key),
+        )
+        return self._row_entry(row)
+
+    def find_entries(
+        self,
+        model_name: Optional[str] = None,
+        target_id: Optional[str] = None,
+        data_fingerprint: Optional[str] = None,
+        strategy: Optional[str] = None,
+        column: Optional[str] = None,
+    ) -> List[Dict]:
+        """
+        Look up cache entries by any combination of indexed fields.
+
+        ``column`` selects entries whose features read that data column.
+
+        Returns:
+            Entries (newest first), each with its ``cache_key`` added
+        """
+        filters = {
+            "model_name": model_name,
+            "target_id": target_id,
+            "data_fingerprint": data_fingerprint,
+            "strategy": strategy,
+        }
+        where = [f"{col} = ?" for col, val in filters.items() if val is not None]
+        args = [v for v in filters.values() if v is not None]
+        if column is not None:
+            where.append("cache_key IN (SELECT cache_key FROM entry_columns WHERE column_name = ?)")
+            args.append(column)
+        sql = "SELECT created, horizons, metadata, metrics_summary, cache_key FROM entries"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY created DESC"
+        rows = self._connect().execute(sql, args).fetchall()
+        return [dict(self._row_entry(row), cache_key=row[4]) for row in rows]
+
+    def find_neighbours(
+        self, model_name: str, param_family: str, model_params: Dict, exclude: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Entries of the same parameter family (same model, target, features,
+        windows and data; see ``generate_cache_key(with_params=False)``) fitted
+        with other ``model_params``, nearest first. Distance sums, per
+        parameter, the log ratio of positive numbers, else the relative
+        difference, else 1 for any other change.
+
+        Returns:
+            Entries with ``cache_key`` added; each has a ``metadata["model_params"]``
+        """
+        params = self._normalize_params(model_params)
+        scored = []
+        for entry in self.find_entries(model_name=model_name):
+            metadata = entry["metadata"]
+            if entry["cache_key"] == exclude or metadata.get("param_family") != param_family:
+                continue
+            other = metadata.get("model_params")
+            if not isinstance(other, dict):
+                continue
+            scored.append((_param_distance(params, self._normalize_params(other)), entry))
+        scored.sort(key=lambda t: t[0])
+        return [entry for _, entry in scored]
+
+    def stale_entries(self, frame) -> List[str]:
+        """
+        Keys of entries built from a column whose content differs from ``frame``.
+
+        Each column is compared over the date range the entry hashed, so rows
+        appended since then do not count. Only entries that read a revised (or
+        dropped) column are reported; entries recorded before per-column hashes
+        existed are never listed.
+        """
+        current: Dict[Tuple[str, Optional[str]], str] = {}
+        stale = set()
+        for key, name, recorded, data_end in self._connect().execute(
+            "SELECT c.cache_key, c.column_name, c.column_hash, e.data_end "
+            "FROM entry_columns c JOIN entries e ON e.cache_key = c.cache_key"
+        ):
+            if (name, data_end) not in current:
+                stop = bisect_right(frame.dates, datetime.fromisoformat(data_end)) if data_end else None
+                current[(name, data_end)] = frame.column_hash(name, stop) if name in frame.columns else "missing"
+            if current[(name, data_end)] != recorded:
+                stale.add(key)
+        return sorted(stale)
+
+    def _served(self, path: str) -> str:
+        """Count ``path`` as read from the library; returns it."""
+        try:
+            self.io["bytes_read"] += os.path.getsize(path)
+        except OSError:
+            pass
+        return path
+
+    @staticmethod
+    def _read_json(path: str) -> Any:
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _write_json(path: str, data: Any) -> None:
+        # Unlink first: entries adopted from a blob store share its (immutable) files
+        if os.path.lexists(path):
+            os.unlink(path)
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+    @staticmethod
+    def _replace_file(path: str, stale_path: str) -> None:
+        """Drop the other-format copy of a file that was just (re)written at ``path``."""
+        if stale_path != path and os.path.exists(stale_path):
+            os.unlink(stale_path)
 
     def load_cached_models(self, cache_key: str) -> Dict[int, Dict]:
         """
         Load cached model parameters for all horizons.
 
+        Horizons are read on first access. Flat-array (``model_h*.bin``) and
+        legacy JSON files are both understood.
+
         Returns:
-            Dictionary mapping horizon to model parameters
+            Mapping from horizon to model parameters
         """
-        models = {}
         model_dir = os.path.join(self.models_dir, cache_key)
+        paths: Dict[int, str] = {}
 
         if not os.path.exists(model_dir):
-            return models
+            return {}
 
         for filename in os.listdir(model_dir):
-            if filename.startswith("model_h") and filename.endswith(".json"):
-                horizon = int(filename.split("model_h")[1].split(".")[0])
-                with open(os.path.join(model_dir, filename), 'r') as f:
-                    models[horizon] = json.load(f)
+            stem, ext = os.path.splitext(filename)
+            if stem.startswith("model_h") and ext in (".json", cache_codec.MODEL_SUFFIX):
+                horizon = int(stem[len("model_h"):])
+                if ext == cache_codec.MODEL_SUFFIX or horizon not in paths:
+                    paths[horizon] = os.path.join(model_dir, filename)
+
+        return cache_codec.LazyModels(paths, self._read_model)
 
-        return models
+    def _read_model(self, path: str) -> Dict:
+        self._served(path)
+        if path.endswith(cache_codec.MODEL_SUFFIX):
+            return cache_codec.read_model(path)
+        return self._read_json(path)
 
     def load_cached_results(self, cache_key: str) -> Dict:
         """
         Load cached results (metrics, forecasts, etc.).
 
+        Backtest rows are decoded on first access.
+
         Returns:
             Dictionary containing cached results
         """
@@ -221,20 +701,50 @@ class CacheManager:
         if not os.path.exists(result_dir):
             return results
 
-        # Load metrics
+        # Load metrics (JSON turns the integer horizon keys into strings)
         metrics_path = os.path.join(result_dir, "metrics.json")
         if os.path.exists(metrics_path):
-            with open(metrics_path, 'r') as f:
-                results["metrics"] = json.load(f)
+            results["metrics"] = {
+                int(h) if isinstance(h, str) and h.isdigit() else h: m
+                for h, m in self._read_json(self._served(metrics_path)).items()
+            }
 
-        # Load backtest results
+        # Load backtest results (columnar, or JSON for rows that do not fit it)
+        columnar_path = os.path.join(result_dir, cache_codec.ROWS_FILE)
         backtest_path = os.path.join(result_dir, "backtest.json")
-        if os.path.exists(backtest_path):
-            with open(backtest_path, 'r') as f:
-                results["backtest"] = json.load(f)
+        if os.path.exists(columnar_path):
+            results["backtest"] = cache_codec.LazyRows(columnar_path, lambda p: cache_codec.read_rows(self._served(p)))
+        elif os.path.exists(backtest_path):
+            results["backtest"] = cache_codec.LazyRows(backtest_path, lambda p: self._read_json(self._served(p)))
 
         return results
 
+    def export_json(self, cache_key: str, dest_dir: str) -> str:
+        """
+        Write an entry in the plain JSON layout (``model_h*.json``,
+        ``metadata.json``, ``metrics.json``, ``backtest.json``) for inspection.
+
+        Returns:
+            The directory written
+        """
+        out_dir = os.path.join(dest_dir, cache_key)
+        os.makedirs(out_dir, exist_ok=True)
+        files: Dict[str, Any] = {
+            f"model_h{h}.json": data for h, data in self.load_cached_models(cache_key).items()
+        }
+        metadata_path = os.path.join(self.models_dir, cache_key, "metadata.json")
+        if os.path.exists(metadata_path):
+            files["metadata.json"] = self._read_json(metadata_path)
+        results = self.load_cached_results(cache_key)
+        if "metrics" in results:
+            files["metrics.json"] = results["metrics"]
+        if "backtest" in results:
+            files["backtest.json"] = list(results["backtest"])
+        for filename, data in files.items():
+            with open(os.path.join(out_dir, filename), 'w') as f:
+                json.dump(data, f, indent=2)
+        return out_dir
+
     def save_to_cache(
         self,
         cache_key: str,
@@ -257,33 +767,36 @@ class CacheManager:
         model_dir = os.path.join(self.models_dir, cache_key)
         os.makedirs(model_dir, exist_ok=True)
 
+        # Models: JSON skeleton + flat arrays for any tree ensembles, compressed
         for horizon, model_data in models.items():
-            model_path = os.path.join(model_dir, f"model_h{horizon}.json")
-            with open(model_path, 'w') as f:
-                json.dump(model_data, f, indent=2)
+            model_path = os.path.join(model_dir, f"model_h{horizon}{cache_codec.MODEL_SUFFIX}")
+            cache_codec.write_model(model_path, model_data)
+            self._replace_file(model_path, os.path.join(model_dir, f"model_h{horizon}.json"))
 
         # Save metadata
-        metadata_path = os.path.join(model_dir, "metadata.json")
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        self._write_json(os.path.join(model_dir, "metadata.json"), metadata)
 
-        # Save results
+        # Save results; rendered outputs of a previous save no longer match them
         result_dir = os.path.join(self.results_dir, cache_key)
         os.makedirs(result_dir, exist_ok=True)
+        shutil.rmtree(os.path.join(result_dir, "outputs"), ignore_errors=True)
 
         # Save metrics
-        metrics_path = os.path.join(result_dir, "metrics.json")
-        with open(metrics_path, 'w') as f:
-            json.dump(metrics, f, indent=2)
+        self._write_json(os.path.join(result_dir, "metrics.json"), metrics)
 
-        # Save backtest results
+        # Save backtest results column-wise; irregular rows fall back to JSON
+        columnar_path = os.path.join(result_dir, cache_codec.ROWS_FILE)
         backtest_path = os.path.join(result_dir, "backtest.json")
-        with open(backtest_path, 'w') as f:
-            json.dump(backtest_rows, f, indent=2)
+        if cache_codec.write_rows(columnar_path, backtest_rows):
+            self._replace_file(columnar_path, backtest_path)
+        else:
+            self._write_json(backtest_path, backtest_rows)
+            self._replace_file(backtest_path, columnar_path)
 
         # Update index
-        self.index["entries"][cache_key] = {
+        entry = {
             "created": datetime.now().isoformat(),
+            "size_bytes": self._entry_size(cache_key),
             "metadata": metadata,
             "horizons": list(models.keys()),
             "metrics_summary": {
@@ -291,79 +804,342 @@ class CacheManager:
                 for h in models.keys()
             }
         }
-        self._save_index()
+        self._index_entry(cache_key, entry)
+        self._pinned.add(cache_key)
+        self.io["bytes_written"] += entry["size_bytes"]
 
         if self.verbose:
             print(f"[Cache] Saved to cache: {cache_key}")
+        self._publish_shared(cache_key)
+
+        if self.max_bytes is not None:
+            self.evict()
+
+    def _index_entry(self, cache_key: str, entry: Dict) -> None:
+        """Insert or replace an entry's index row and its column hashes."""
+        with self._transaction() as conn:
+            conn.execute(_UPSERT, self._entry_row(cache_key, entry))
+            conn.execute("DELETE FROM entry_columns WHERE cache_key = ?", (cache_key,))
+            conn.executemany(
+                "INSERT INTO entry_columns (cache_key, column_name, column_hash) VALUES (?, ?, ?)",
+                [(cache_key, c, h) for c, h in ((entry.get("metadata") or {}).get("column_hashes") or {}).items()],
+            )
 
-    def copy_from_cache(self, cache_key: str, output_dir: str):
+    # --- Blob store ---
+    def _entry_files(self, cache_key: str) -> Dict[str, str]:
+        """``relpath -> path`` for every file of an entry (relpaths as stored in blob store refs)."""
+        files = {}
+        for root_name, root_dir in zip(_ENTRY_ROOTS, (self.models_dir, self.results_dir)):
+            entry_dir = os.path.join(root_dir, cache_key)
+            for root, dirs, names in os.walk(entry_dir):
+                for name in names:
+                    path = os.path.join(root, name)
+                    rel = os.path.relpath(path, entry_dir).replace(os.sep, "/")
+                    files[f"{root_name}/{rel}"] = path
+        return files
+
+    def publish(self, cache_key: str, store: Optional[BlobStore] = None) -> bool:
+        """
+        Publish a local entry to a blob store (default: the shared store).
+
+        Returns:
+            False if there is no store or no such entry
+        """
+        store = store or self.shared
+        if store is None:
+            return False
+        row = self._connect().execute(
+            "SELECT created, horizons, metadata, metrics_summary FROM entries WHERE cache_key = ?",
+            (cache_key,),
+        ).fetchone()
+        if row is None:
+            return False
+        store.publish(cache_key, self._entry_files(cache_key), self._row_entry(row))
+        return True
+
+    def _publish_shared(self, cache_key: str) -> None:
+        # The local entry is complete either way; a shared store we cannot write is not fatal
+        if self.shared is None:
+            return
+        try:
+            self.publish(cache_key)
+        except OSError as e:
+            print(f"[Cache] Could not publish {cache_key} to {self.shared.root}: {e}")
+
+    def adopt(self, cache_key: str, store: Optional[BlobStore] = None) -> bool:
+        """
+        Materialize an entry from a blob store (default: the shared store) in
+        the local library, linking its blobs where the filesystem allows.
+
+        The store's lock is held while linking so ``gc`` cannot collect the
+        blobs midway. A store that cannot be read (or a blob that vanished)
+        is a miss: files linked so far are removed and False is returned.
+
+        Returns:
+            True if the entry was found and indexed locally
+        """
+        store = store or self.shared
+        if store is None:
+            return False
+        linked: List[str] = []
+        try:
+            with store.lock():
+                ref = store.get_ref(cache_key)
+                if ref is None:
+                    return False
+                targets = []
+                for rel, digest in ref["files"].items():
+                    root_name, _, sub = rel.partition("/")
+                    if root_name not in _ENTRY_ROOTS or not safe_relpath(sub):
+                        return False
+                    root_dir = self.models_dir if root_name == "models" else self.results_dir
+                    targets.append((store.blob_path(digest), os.path.join(root_dir, cache_key, *sub.split("/"))))
+                for src, dst in targets:
+                    os.makedirs(os.path.dirname(dst), exist_ok=True)
+                    tmp = f"{dst}.{os.getpid()}.tmp"
+                    linked.append(tmp)
+                    _link_file(src, tmp)
+                    os.replace(tmp, dst)
+                    linked[-1] = dst
+        except OSError as e:
+            for path in linked:
+                if os.path.lexists(path):
+                    os.unlink(path)
+            print(f"[Cache] Could not adopt {cache_key} from {store.root}: {e}")
+            return False
+        entry = dict(ref["entry"], size_bytes=self._entry_size(cache_key), last_access=datetime.now().isoformat())
+        self._index_entry(cache_key, entry)
+        if self.verbose:
+            print(f"[Cache] Adopted from {store.root}: {cache_key}")
+        return True
+
+    def export_tar(self, path: str) -> int:
+        """
+        Write the local entries (and, with a shared store, everything in it)
+        to a gzipped blob store tarball for ``import_tar`` on another host.
+
+        Returns:
+            Number of entries written
+        """
+        with self._transfer_store() as store:
+            for (key,) in self._connect().execute("SELECT cache_key FROM entries").fetchall():
+                self.publish(key, store)
+            return store.export_tar(path)
+
+    def import_tar(self, path: str) -> List[str]:
+        """
+        Add the entries of an ``export_tar`` tarball to the local library (and
+        to the shared store, if one is configured). Existing entries are kept.
+
+        Returns:
+            Keys now available locally
         """
-        Copy cached results to output directory.
+        conn = self._connect()
+        with self._transfer_store() as store:
+            keys = store.import_tar(path)
+            return [
+                k for k in keys
+                if conn.execute("SELECT 1 FROM entries WHERE cache_key = ?", (k,)).fetchone() or self.adopt(k, store)
+            ]
+
+    @contextmanager
+    def _transfer_store(self) -> Iterator[BlobStore]:
+        if self.shared is not None:
+            yield self.shared
+        else:
+            with scratch_store(self.base_dir) as store:
+                yield store
+
+    def evict(self, max_bytes: Optional[int] = None, policy: Optional[str] = None) -> List[str]:
+        """
+        Drop entries until the cached bytes fit the budget.
+
+        Victims are chosen by recorded access (``"lru"``: oldest access first;
+        ``"lfu"``: fewest accesses, then oldest). Entries pinned by this manager
+        are kept even if that leaves the cache over budget.
+
+        Args:
+            max_bytes: Budget to enforce (default: the manager's ``max_bytes``)
+            policy: Eviction policy (default: the manager's ``eviction``)
+
+        Returns:
+            Keys of the evicted entries
+        """
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        order = EVICTION_POLICIES[policy or self.eviction]
+        if budget is None:
+            return []
+        victims: List[str] = []
+        with self._transaction() as conn:
+            total = conn.execute("SELECT value FROM totals WHERE name = 'bytes'").fetchone()[0]
+            if total <= budget:
+                return victims
+            for key, size in conn.execute(f"SELECT cache_key, size_bytes FROM entries ORDER BY {order}").fetchall():
+                if key in self._pinned:
+                    continue
+                victims.append(key)
+                total -= size or 0
+                if total <= budget:
+                    break
+            conn.executemany("DELETE FROM entries WHERE cache_key = ?", [(k,) for k in victims])
+        for key in victims:
+            shutil.rmtree(os.path.join(self.models_dir, key), ignore_errors=True)
+            shutil.rmtree(os.path.join(self.results_dir, key), ignore_errors=True)
+        if self.verbose and victims:
+            print(f"[Cache] Evicted {len(victims)} entries ({policy or self.eviction}) to fit {budget / (1024 * 1024):.2f} MB")
+        return victims
+
+    def compact(self, min_age_seconds: float = 3600.0) -> Dict[str, int]:
+        """
+        Reconcile the index with the model/result directories.
+
+        Removes directories not referenced by the index (left by interrupted
+        saves or manual edits), drops index entries whose directories are
+        gone, re-measures entry sizes and checkpoints the index journal.
+        With a shared store, also collects its unreferenced blobs.
+        Orphans younger than ``min_age_seconds`` are kept, since a concurrent
+        run may still be about to index them.
+
+        Returns:
+            Counts of removed directories, freed bytes, dropped entries and removed blobs
+        """
+        conn = self._connect()
+        indexed = {k for (k,) in conn.execute("SELECT cache_key FROM entries")}
+        cutoff = datetime.now().timestamp() - min_age_seconds
+        removed_dirs = freed_bytes = 0
+        for root_dir in (self.models_dir, self.results_dir):
+            for name in os.listdir(root_dir):
+                path = os.path.join(root_dir, name)
+                if name in indexed or os.path.getmtime(path) > cutoff:
+                    continue
+                for root, dirs, files in os.walk(path):
+                    freed_bytes += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+                if os.path.isdir(path):
+                    shutil.rmtree(path, ignore_errors=True)
+                else:
+                    freed_bytes += os.path.getsize(path)
+                    os.unlink(path)
+                removed_dirs += 1
+
+        dangling = [
+            k for k in indexed
+            if not (os.path.isdir(os.path.join(self.models_dir, k)) and os.path.isdir(os.path.join(self.results_dir, k)))
+        ]
+        sizes = [(self._entry_size(k), k) for k in indexed.difference(dangling)]
+        with self._transaction() as conn:
+            conn.executemany("DELETE FROM entries WHERE cache_key = ?", [(k,) for k in dangling])
+            conn.executemany("UPDATE entries SET size_bytes = ? WHERE cache_key = ?", sizes)
+            # Re-derive the running totals from scratch
+            conn.execute("UPDATE totals SET value = (SELECT COUNT(*) FROM entries) WHERE name = 'entries'")
+            conn.execute("UPDATE totals SET value = (SELECT COALESCE(SUM(n_horizons), 0) FROM entries) WHERE name = 'models'")
+            conn.execute("UPDATE totals SET value = (SELECT COALESCE(SUM(size_bytes), 0) FROM entries) WHERE name = 'bytes'")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+        result = {"removed_dirs": removed_dirs, "freed_bytes": freed_bytes, "dropped_entries": len(dangling), "removed_blobs": 0}
+        if self.shared is not None:
+            gc = self.shared.gc(min_age_seconds)
+            result["removed_blobs"] = gc["removed_blobs"]
+            result["freed_bytes"] += gc["freed_bytes"]
+
+        if self.verbose:
+            print(f"[Cache] Compacted: removed {removed_dirs} orphaned paths, dropped {len(dangling)} dangling entries")
+        return result
+
+    def store_outputs(self, cache_key: str, run_dir: str) -> List[str]:
+        """
+        Keep the rendered outputs of a run (``OUTPUT_FILES`` found under
+        ``run_dir``) with an existing entry so later hits can link them
+        instead of rendering them again. Pins the entry, which may have been
+        saved by another manager (a ``--jobs`` worker).
+
+        Returns:
+            Relative paths stored
+        """
+        self._pinned.add(cache_key)
+        out_dir = os.path.join(self.results_dir, cache_key, "outputs")
+        stored = []
+        for rel in OUTPUT_FILES:
+            src = os.path.join(run_dir, rel)
+            if not os.path.isfile(src):
+                continue
+            dst = os.path.join(out_dir, rel)
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            tmp = f"{dst}.{os.getpid()}.tmp"
+            _link_file(src, tmp)
+            os.replace(tmp, dst)
+            self.io["bytes_written"] += os.path.getsize(dst)
+            stored.append(rel)
+        if stored:
+            with self._transaction() as conn:
+                conn.execute(
+                    "UPDATE entries SET size_bytes = ? WHERE cache_key = ?",
+                    (self._entry_size(cache_key), cache_key),
+                )
+            self._publish_shared(cache_key)
+        return stored
+
+    def copy_from_cache(self, cache_key: str, output_dir: str, models: bool = True) -> List[str]:
+        """
+        Materialize a cached entry in a run directory.
+
+        Stored outputs are reflinked or hardlinked where the filesystem
+        allows (copied otherwise); model parameters are written as
+        ``models/model_h{h}.json`` like ``OutputManager.save_model_params``.
+        Entries saved before outputs were stored yield only the models.
 
         Args:
             cache_key: Cache key to copy from
-            output_dir: Destination directory
+            output_dir: Destination run directory
+            models: Also write the per-horizon model files
+
+        Returns:
+            Relative paths written under ``output_dir``
         """
-        # Copy models
-        src_model_dir = os.path.join(self.models_dir, cache_key)
-        dst_model_dir = os.path.join(output_dir, "models")
-        if os.path.exists(src_model_dir):
+        written = []
+        if models:
+            dst_model_dir = os.path.join(output_dir, "models")
             os.makedirs(dst_model_dir, exist_ok=True)
-            for filename in os.listdir(src_model_dir):
-                if filename.endswith(".json"):
-                    shutil.copy2(
-                        os.path.join(src_model_dir, filename),
-                        os.path.join(dst_model_dir, filename)
-                    )
-
-        # Copy results
-        src_result_dir = os.path.join(self.results_dir, cache_key)
-        if os.path.exists(src_result_dir):
-            # Copy metrics
-            for filename in ["metrics.json", "backtest.json"]:
-                src_path = os.path.join(src_result_dir, filename)
-                if os.path.exists(src_path):
-                    if filename == "metrics.json":
-                        dst_dir = os.path.join(output_dir, "metrics")
-                        os.makedirs(dst_dir, exist_ok=True)
-                        # Convert to CSV format for compatibility
-                        with open(src_path, 'r') as f:
-                            metrics = json.load(f)
-                        # The OutputManager will handle CSV conversion
-                    elif filename == "backtest.json":
-                        dst_dir = os.path.join(output_dir, "forecasts")
-                        os.makedirs(dst_dir, exist_ok=True)
-                        # Convert to CSV format for compatibility
+            for h, model_data in self.load_cached_models(cache_key).items():
+                rel = os.path.join("models", f"model_h{h}.json")
+                dst = os.path.join(output_dir, rel)
+                if os.path.lexists(dst):
+                    os.unlink(dst)
+                with open(dst, 'w') as f:
+                    json.dump(model_data, f, indent=2)
+                written.append(rel)
+
+        src_dir = os.path.join(self.results_dir, cache_key, "outputs")
+        for rel in OUTPUT_FILES:
+            src = os.path.join(src_dir, rel)
+            if os.path.isfile(src):
+                dst = os.path.join(output_dir, rel)
+                os.makedirs(os.path.dirname(dst), exist_ok=True)
+                _link_file(self._served(src), dst)
+                written.append(rel)
 
         if self.verbose:
             print(f"[Cache] Loaded from cache: {cache_key}")
+        return written
 
     def get_cache_stats(self) -> Dict:
-        """Get statistics about the cache."""
-        total_entries = len(self.index["entries"])
-        total_models = sum(
-            len(entry.get("horizons", []))
-            for entry in self.index["entries"].values()
-        )
+        """Get statistics about the cache (O(1): totals are maintained by the index)."""
+        conn = self._connect()
+        totals = dict(conn.execute("SELECT name, value FROM totals"))
+        oldest, newest = conn.execute("SELECT MIN(created), MAX(created) FROM entries").fetchone()
 
-        # Calculate cache size
-        cache_size = 0
-        for root, dirs, files in os.walk(self.base_dir):
-            for file in files:
-                cache_size += os.path.getsize(os.path.join(root, file))
+        # Entry bytes are tracked per save; add the index files themselves
+        cache_size = totals["bytes"]
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.index_path + suffix):
+                cache_size += os.path.getsize(self.index_path + suffix)
 
         return {
-            "total_entries": total_entries,
-            "total_models": total_models,
+            "total_entries": totals["entries"],
+            "total_models": totals["models"],
             "cache_size_mb": cache_size / (1024 * 1024),
-            "oldest_entry": min(
-                (e["created"] for e in self.index["entries"].values()),
-                default=None
-            ),
-            "newest_entry": max(
-                (e["created"] for e in self.index["entries"].values()),
-                default=None
-            )
+            "max_size_mb": self.max_bytes / (1024 * 1024) if self.max_bytes is not None else None,
+            "oldest_entry": oldest,
+            "newest_entry": newest
         }
 
     def clear_cache(self, older_than_days: Optional[int] = None):
@@ -375,12 +1151,12 @@ class CacheManager:
         """
         if older_than_days is None:
             # Clear everything
-            shutil.rmtree(self.models_dir)
-            shutil.rmtree(self.results_dir)
-            os.makedirs(self.models_dir, exist_ok=True)
-            os.makedirs(self.results_dir, exist_ok=True)
-            self.index = {"entries": {}, "metadata": {"created": datetime.now().isoformat()}}
-            self._save_index()
+            with self._transaction() as conn:
+                conn.execute("DELETE FROM entries")
+                shutil.rmtree(self.models_dir)
+                shutil.rmtree(self.results_dir)
+                os.makedirs(self.models_dir, exist_ok=True)
+                os.makedirs(self.results_dir, exist_ok=True)
             if self.verbose:
                 print("[Cache] Cleared all cache entries")
         else:
@@ -388,22 +1164,20 @@ class CacheManager:
             cutoff = datetime.now().timestamp() - (older_than_days * 24 * 3600)
             keys_to_remove = []
 
-            for key, entry in self.index["entries"].items():
-                created = datetime.fromisoformat(entry["created"]).timestamp()
-                if created < cutoff:
-                    keys_to_remove.append(key)
-
-            for key in keys_to_remove:
-                # Remove from disk
-                model_dir = os.path.join(self.models_dir, key)
-                result_dir = os.path.join(self.results_dir, key)
-                if os.path.exists(model_dir):
-                    shutil.rmtree(model_dir)
-                if os.path.exists(result_dir):
-                    shutil.rmtree(result_dir)
-                # Remove from index
-                del self.index["entries"][key]
-
-            self._save_index()
+            with self._transaction() as conn:
+                for key, created in conn.execute("SELECT cache_key, created FROM entries"):
+                    if datetime.fromisoformat(created).timestamp() < cutoff:
+                        keys_to_remove.append(key)
+
+                for key in keys_to_remove:
+                    # Remove from disk
+                    model_dir = os.path.join(self.models_dir, key)
+                    result_dir = os.path.join(self.results_dir, key)
+                    if os.path.exists(model_dir):
+                        shutil.rmtree(model_dir)
+                    if os.path.exists(result_dir):
+                        shutil.rmtree(result_dir)
+
+                conn.executemany("DELETE FROM entries WHERE cache_key = ?", [(k,) for k in keys_to_remove])
             if self.verbose:
-                print(f"[Cache] Cleared {len(keys_to_remove)} old cache entries")
\ No newline at end of file
+                print(f"[Cache] Cleared {len(keys_to_remove)} old cache entries")
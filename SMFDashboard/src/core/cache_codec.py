@@ -0,0 +1,326 @@
+"""
+Compact on-disk formats for the model library.
+
+Both formats share one container: an 8-byte magic followed by a single
+zlib stream holding a little-endian header length, a JSON header and the
+raw bytes of the numeric arrays it describes, so a load is one read, one
+decompress and zero-copy ``np.frombuffer`` views.
+
+Backtest rows are stored column-wise: int64 or float64 arrays (with a null
+mask where a float field holds None) and JSON lists for strings and
+anything else. Model parameters are a JSON skeleton in which every
+serialized tree -- the nested ``{"feature", "threshold", "value", "n",
+"left", "right"}`` dicts written by the tree-based plugins -- is replaced by
+a slice of shared flat pre-order arrays. Both decode to exactly the objects
+a JSON round trip would give; rows that do not fit a columnar layout are
+left to the caller to store as JSON.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import tempfile
+import zlib
+from collections.abc import Mapping, Sequence
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+ROWS_FILE = "backtest.bin"
+MODEL_SUFFIX = ".bin"
+MAGIC = b"SMFBLOB1"
+
+_NODE_KEYS = frozenset(("feature", "threshold", "value", "n", "left", "right"))
+_TREE_REF = "__flat_tree__"
+_TREE_FIELDS = ("feature", "threshold", "value", "n", "left", "right")
+_INT64_MAX = 2 ** 63 - 1
+
+
+def write_blob(path: str, header: Dict, arrays: Dict[str, np.ndarray]) -> None:
+    """Write ``header`` plus numeric ``arrays`` as one compressed blob (atomic rename)."""
+    layout: Dict[str, List] = {}
+    chunks: List[bytes] = []
+    offset = 0
+    for name, a in arrays.items():
+        a = np.ascontiguousarray(a)
+        dtype = a.dtype.newbyteorder("<") if a.dtype.byteorder == ">" else a.dtype
+        data = a.astype(dtype, copy=False).tobytes()
+        layout[name] = [dtype.str, list(a.shape), offset, len(data)]
+        chunks.append(data)
+        offset += len(data)
+    head = json.dumps({"header": header, "arrays": layout}).encode("utf-8")
+    payload = zlib.compress(struct.pack("<Q", len(head)) + head + b"".join(chunks), 6)
+
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(path) + ".", dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC)
+            f.write(payload)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def read_blob(path: str) -> Tuple[Dict, Dict[str, np.ndarray]]:
+    """Inverse of ``write_blob``; arrays are read-only views into the decompressed buffer."""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path}: not a cache blob")
+        raw = zlib.decompress(f.read())
+    (head_len,) = struct.unpack_from("<Q", raw)
+    start = 8 + head_len
+    head = json.loads(raw[8:start].decode("utf-8"))
+    arrays = {
+        name: np.frombuffer(raw, dtype=np.dtype(dtype), count=nbytes // np.dtype(dtype).itemsize,
+                            offset=start + offset).reshape(shape)
+        for name, (dtype, shape, offset, nbytes) in head["arrays"].items()
+    }
+    return head["header"], arrays
+
+
+# --- Backtest rows ---
+def _column_kind(values: List[Any]) -> str:
+    types = {type(v) for v in values}
+    if types == {int}:
+        return "i"
+    if float in types and types <= {float, type(None)}:
+        return "f"
+    if types == {str} and not any(v.endswith("\0") for v in values):
+        return "s"
+    return "j"
+
+
+def encode_rows(rows: List[Dict]) -> Optional[Tuple[Dict, Dict[str, np.ndarray]]]:
+    """``(header, arrays)`` for ``rows``, or None if the rows are empty or not uniformly keyed."""
+    if not rows:
+        return None
+    columns = list(rows[0].keys())
+    if any(list(r.keys()) != columns for r in rows):
+        return None
+    arrays: Dict[str, np.ndarray] = {}
+    kinds: List[str] = []
+    lists: Dict[str, List] = {}
+    for j, c in enumerate(columns):
+        values = [r[c] for r in rows]
+        kind = _column_kind(values)
+        if kind == "i":
+            try:
+                arrays[f"c{j}"] = np.array(values, dtype=np.int64)
+            except OverflowError:
+                kind = "j"
+        elif kind == "f":
+            arrays[f"c{j}"] = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+            if None in values:
+                arrays[f"m{j}"] = np.array([v is None for v in values], dtype=bool)
+        if kind in ("s", "j"):
+            # Strings and other JSON values ride in the (compressed) header
+            lists[f"c{j}"] = values
+        kinds.append(kind)
+    return {"columns": columns, "kinds": kinds, "lists": lists}, arrays
+
+
+def decode_rows(header: Dict, arrays: Mapping) -> List[Dict]:
+    """Inverse of ``encode_rows``."""
+    values: List[List[Any]] = []
+    for j, kind in enumerate(header["kinds"]):
+        if kind in ("s", "j"):
+            col = header["lists"][f"c{j}"]
+        else:
+            col = arrays[f"c{j}"].tolist()
+            if kind == "f" and f"m{j}" in arrays:
+                col = [None if null else v for v, null in zip(col, arrays[f"m{j}"].tolist())]
+        values.append(col)
+    return [dict(zip(header["columns"], row)) for row in zip(*values)]
+
+
+def write_rows(path: str, rows: List[Dict]) -> bool:
+    """Write rows to ``path`` in columnar form; returns False (nothing written) if they do not fit."""
+    encoded = encode_rows(rows)
+    if encoded is None:
+        return False
+    write_blob(path, *encoded)
+    return True
+
+
+def read_rows(path: str) -> List[Dict]:
+    return decode_rows(*read_blob(path))
+
+
+class LazyRows(Sequence):
+    """Read-only row list that is decoded from disk on first access."""
+
+    def __init__(self, path: str, reader: Callable[[str], List[Dict]] = read_rows):
+        self._path = path
+        self._reader = reader
+        self._rows: Optional[List[Dict]] = None
+
+    def _load(self) -> List[Dict]:
+        if self._rows is None:
+            self._rows = self._reader(self._path)
+        return self._rows
+
+    def __getitem__(self, i):
+        return self._load()[i]
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(self._load())
+
+
+# --- Model parameters ---
+def _is_tree(node: Any) -> bool:
+    """True for a serialized tree whose values survive the flat layout exactly."""
+    if node is None:
+        return True
+    if not isinstance(node, dict) or node.keys() != _NODE_KEYS:
+        return False
+    feature, threshold = node["feature"], node["threshold"]
+    if feature is None:
+        if threshold is not None:
+            return False
+    elif type(feature) is not int or not 0 <= feature <= _INT64_MAX or type(threshold) is not float:
+        return False
+    n = node["n"]
+    if type(node["value"]) is not float or type(n) is not int or not -_INT64_MAX - 1 <= n <= _INT64_MAX:
+        return False
+    return _is_tree(node["left"]) and _is_tree(node["right"])
+
+
+def _flatten_tree(root: Dict, fields: Dict[str, List]) -> None:
+    """Append ``root`` to ``fields`` in pre-order; child indices are relative to the tree."""
+    base = len(fields["value"])
+
+    def visit(node: Dict) -> int:
+        i = len(fields["value"])
+        leaf = node["feature"] is None
+        fields["feature"].append(-1 if leaf else node["feature"])
+        fields["threshold"].append(np.nan if leaf else node["threshold"])
+        fields["value"].append(node["value"])
+        fields["n"].append(node["n"])
+        fields["left"].append(-1)
+        fields["right"].append(-1)
+        if node["left"] is not None:
+            fields["left"][i] = visit(node["left"]) - base
+        if node["right"] is not None:
+            fields["right"][i] = visit(node["right"]) - base
+        return i
+
+    visit(root)
+
+
+def _unflatten_tree(fields: Dict[str, List], start: int, stop: int) -> Dict:
+    feature, threshold = fields["feature"], fields["threshold"]
+    value, n = fields["value"], fields["n"]
+    left, right = fields["left"], fields["right"]
+    nodes: List[Optional[Dict]] = [None] * (stop - start)
+    # Pre-order: children always follow their parent, so build back to front
+    for k in range(stop - start - 1, -1, -1):
+        i = start + k
+        leaf = feature[i] < 0
+        nodes[k] = {
+            "feature": None if leaf else feature[i],
+            "threshold": None if leaf else threshold[i],
+            "value": value[i],
+            "n": n[i],
+            "left": nodes[left[i]] if left[i] >= 0 else None,
+            "right": nodes[right[i]] if right[i] >= 0 else None,
+        }
+    return nodes[0]
+
+
+_TREE_DTYPES = {
+    "feature": np.int64,
+    "threshold": np.float64,
+    "value": np.float64,
+    "n": np.int64,
+    "left": np.int32,
+    "right": np.int32,
+}
+
+
+def flatten_params(obj: Any) -> Tuple[Any, Dict[str, np.ndarray]]:
+    """
+    Split ``obj`` into a JSON skeleton and flat arrays holding every serialized
+    tree. All trees share one array per node field (``tree.<field>``);
+    ``tree.offsets`` marks where each tree starts. Objects that already use
+    the tree reference key are kept whole in the skeleton.
+    """
+    fields: Dict[str, List] = {f: [] for f in _TREE_FIELDS}
+    offsets = [0]
+    clash = []
+
+    def walk(o: Any) -> Any:
+        if isinstance(o, dict):
+            if o and _is_tree(o):
+                _flatten_tree(o, fields)
+                offsets.append(len(fields["value"]))
+                return {_TREE_REF: len(offsets) - 2}
+            if _TREE_REF in o:
+                clash.append(o)
+            return {k: walk(v) for k, v in o.items()}
+        if isinstance(o, (list, tuple)):
+            return [walk(v) for v in o]
+        return o
+
+    skeleton = walk(obj)
+    if clash:
+        return obj, {}
+    if len(offsets) == 1:
+        return skeleton, {}
+    arrays = {f"tree.{f}": np.array(fields[f], dtype=_TREE_DTYPES[f]) for f in _TREE_FIELDS}
+    arrays["tree.offsets"] = np.array(offsets, dtype=np.int64)
+    return skeleton, arrays
+
+
+def unflatten_params(skeleton: Any, arrays: Mapping) -> Any:
+    """Inverse of ``flatten_params``."""
+    if "tree.offsets" not in arrays:
+        return skeleton
+    fields = {f: arrays[f"tree.{f}"].tolist() for f in _TREE_FIELDS}
+    offsets = arrays["tree.offsets"].tolist()
+
+    def walk(o: Any) -> Any:
+        if isinstance(o, dict):
+            if len(o) == 1 and _TREE_REF in o:
+                i = o[_TREE_REF]
+                return _unflatten_tree(fields, offsets[i], offsets[i + 1])
+            return {k: walk(v) for k, v in o.items()}
+        if isinstance(o, list):
+            return [walk(v) for v in o]
+        return o
+
+    return walk(skeleton)
+
+
+def write_model(path: str, model_data: Dict) -> None:
+    write_blob(path, *flatten_params(model_data))
+
+
+def read_model(path: str) -> Dict:
+    return unflatten_params(*read_blob(path))
+
+
+class LazyModels(Mapping):
+    """``horizon -> model data`` mapping whose entries are read on first access."""
+
+    def __init__(self, paths: Dict[int, str], reader: Callable[[str], Dict]):
+        self._paths = dict(sorted(paths.items()))
+        self._reader = reader
+        self._loaded: Dict[int, Dict] = {}
+
+    def __getitem__(self, horizon: int) -> Dict:
+        if horizon not in self._loaded:
+            self._loaded[horizon] = self._reader(self._paths[horizon])
+        return self._loaded[horizon]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
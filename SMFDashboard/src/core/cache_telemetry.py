@@ -0,0 +1,149 @@
+"""
+Per-run cache telemetry.
+
+Every ``run_v2.py`` run writes one JSON-lines file under the model library's
+``telemetry/`` directory: a ``lookup`` record per model the run served or
+trained (hit or miss, bytes read from and written to the library, seconds
+spent loading vs training, and training time a hit saved), then a closing
+``run`` record with the run's totals. Records are appended as they happen,
+so an interrupted run still leaves its lookups behind. ``aggregate`` folds
+any number of these files into per-model counters for ``--cache-report``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+TELEMETRY_DIR = "telemetry"
+
+_COUNTERS = ("lookups", "hits", "misses", "bytes_read", "bytes_written", "load_seconds", "train_seconds", "saved_seconds")
+
+
+def _empty() -> Dict[str, float]:
+    return {c: 0 for c in _COUNTERS}
+
+
+def _add(totals: Dict[str, float], record: Dict) -> None:
+    if record.get("lookup"):
+        totals["lookups"] += 1
+        totals["hits" if record.get("hit") else "misses"] += 1
+    for c in _COUNTERS[3:]:
+        totals[c] += record.get(c) or 0
+
+
+def hit_rate(totals: Dict[str, float]) -> Optional[float]:
+    """Hits per lookup, or None when nothing was looked up."""
+    return totals["hits"] / totals["lookups"] if totals["lookups"] else None
+
+
+class CacheTelemetry:
+    """Appends the lookup records of one run to ``<library>/telemetry/<run>.jsonl``."""
+
+    def __init__(self, library_dir: str, mode: str):
+        self.dir = os.path.join(library_dir, TELEMETRY_DIR)
+        os.makedirs(self.dir, exist_ok=True)
+        self.run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        self.path = os.path.join(self.dir, f"{self.run_id}.jsonl")
+        self.mode = mode
+        self.started = time.time()
+        self.totals = _empty()
+        self.by_model: Dict[str, Dict[str, float]] = {}
+
+    def _write(self, record: Dict) -> None:
+        with open(self.path, "a") as f:
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def lookup(
+        self,
+        model: str,
+        cache_key: Optional[str],
+        hit: bool,
+        lookup: bool = True,
+        bytes_read: int = 0,
+        bytes_written: int = 0,
+        load_seconds: float = 0.0,
+        train_seconds: float = 0.0,
+        saved_seconds: Optional[float] = None,
+    ) -> None:
+        """
+        Record one model served (``hit``) or trained. ``lookup`` is False when
+        the cache was not consulted (``--cache rebuild``/``ignore``); such
+        records count toward bytes and times but not toward hits or misses.
+        ``saved_seconds`` is the training time a hit avoided, when known.
+        """
+        record = {
+            "event": "lookup",
+            "run_id": self.run_id,
+            "time": datetime.now().isoformat(),
+            "mode": self.mode,
+            "model": model,
+            "cache_key": cache_key,
+            "lookup": lookup,
+            "hit": hit,
+            "bytes_read": int(bytes_read),
+            "bytes_written": int(bytes_written),
+            "load_seconds": round(load_seconds, 6),
+            "train_seconds": round(train_seconds, 6),
+            "saved_seconds": None if saved_seconds is None else round(saved_seconds, 6),
+        }
+        _add(self.totals, record)
+        _add(self.by_model.setdefault(model, _empty()), record)
+        self._write(record)
+
+    def close(self) -> Dict:
+        """Write the closing ``run`` record; returns it."""
+        record = {
+            "event": "run",
+            "run_id": self.run_id,
+            "time": datetime.now().isoformat(),
+            "mode": self.mode,
+            "elapsed_seconds": round(time.time() - self.started, 6),
+            **self.totals,
+            "hit_rate": hit_rate(self.totals),
+            "by_model": self.by_model,
+        }
+        self._write(record)
+        return record
+
+
+def aggregate(library_dir: str, since: Optional[datetime] = None) -> Dict:
+    """
+    Fold every telemetry file of a library (lookups at or after ``since``)
+    into totals per model and overall.
+
+    Returns:
+        ``{"runs", "first", "last", "totals", "by_model"}``; counters are
+        lookups, hits, misses, bytes read/written and load/train/saved seconds
+    """
+    directory = os.path.join(library_dir, TELEMETRY_DIR)
+    names: List[str] = sorted(n for n in os.listdir(directory) if n.endswith(".jsonl")) if os.path.isdir(directory) else []
+    totals = _empty()
+    by_model: Dict[str, Dict[str, float]] = {}
+    runs = set()
+    times: List[str] = []
+    for name in names:
+        with open(os.path.join(directory, name), "r") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # a line cut short by an interrupted run
+                if not isinstance(record, dict) or record.get("event") != "lookup":
+                    continue
+                if since is not None and record.get("time", "") < since.isoformat():
+                    continue
+                runs.add(record.get("run_id"))
+                times.append(record.get("time", ""))
+                _add(totals, record)
+                _add(by_model.setdefault(record.get("model") or "?", _empty()), record)
+    return {
+        "runs": len(runs),
+        "first": min(times) if times else None,
+        "last": max(times) if times else None,
+        "totals": totals,
+        "by_model": dict(sorted(by_model.items())),
+    }
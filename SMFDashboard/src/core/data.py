@@ -1,40 +1,246 @@
 from __future__ import annotations
 
 import csv
+import hashlib
+from collections.abc import Mapping
+from itertools import zip_longest
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
+import numpy as np
+
+from . import frame_cache
 from .utils import parse_ymd
 
 
+class _ColumnMap(Mapping):
+    """Read-only ``name -> column view`` mapping over a frame's value block."""
+
+    def __init__(self, frame: "TimeSeriesFrame"):
+        self._frame = frame
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._frame.column(name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._frame._pos
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._frame._names)
+
+    def __len__(self) -> int:
+        return len(self._frame._names)
+
+
 class TimeSeriesFrame:
-    def __init__(self, dates: List[datetime], columns: Dict[str, List[float]]):
-        self.dates = dates
-        self.columns = columns
+    """
+    Date-indexed numeric table stored as a single float64 block.
+
+    Values live in a column-major ``(n_dates, n_columns)`` array so each column
+    is a contiguous, zero-copy view; missing observations are NaN. The index is
+    a ``datetime64[s]`` array. ``dates`` (list of datetimes) and ``columns``
+    (name -> 1-D view) keep the original access pattern for plugins.
+    """
+
+    def __init__(self, dates: Sequence[datetime], columns: Dict[str, Sequence[float]]):
+        names = list(columns.keys())
+        values = np.empty((len(dates), len(names)), dtype=np.float64, order="F")
+        for j, c in enumerate(names):
+            values[:, j] = np.asarray(columns[c], dtype=np.float64)
+        self._set_block(np.asarray(dates, dtype="datetime64[s]"), names, values)
+        self._dates = list(dates)
+
+    def _set_block(self, index: np.ndarray, names: List[str], values: np.ndarray) -> None:
+        self._index = index
+        self._names = names
+        self._pos = {c: j for j, c in enumerate(names)}
+        self._values = values
+        self._dates: Optional[List[datetime]] = None
+        self._columns = _ColumnMap(self)
+        self._hashes: Dict[Tuple[str, int], str] = {}
+
+    @classmethod
+    def from_block(cls, index: np.ndarray, names: List[str], values: np.ndarray) -> "TimeSeriesFrame":
+        """Wrap an existing index and 2-D value block without copying when possible."""
+        values = np.asfortranarray(values, dtype=np.float64)
+        if values.ndim != 2 or values.shape != (len(index), len(names)):
+            raise ValueError(f"Block shape {values.shape} does not match index/names ({len(index)}, {len(names)})")
+        frame = cls.__new__(cls)
+        frame._set_block(np.asarray(index, dtype="datetime64[s]"), list(names), values)
+        return frame
+
+    # --- Array accessors ---
+    @property
+    def index(self) -> np.ndarray:
+        return self._index
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._names)
+
+    def column(self, name: str) -> np.ndarray:
+        """Zero-copy 1-D view of a single column."""
+        return self._values[:, self._pos[name]]
+
+    def nan_mask(self, name: Optional[str] = None) -> np.ndarray:
+        """Boolean mask of missing values for one column, or the whole block."""
+        if name is None:
+            return np.isnan(self._values)
+        return np.isnan(self.column(name))
+
+    def column_hash(self, name: str, stop: Optional[int] = None) -> str:
+        """
+        Content hash of one column together with the date index (memoized per
+        frame). ``stop`` restricts it to the leading rows ``[0, stop)``.
+        """
+        n = len(self._index) if stop is None else min(int(stop), len(self._index))
+        h = self._hashes.get((name, n))
+        if h is None:
+            h = self._hashes[(name, n)] = _column_digest(self._index[:n], self.column(name)[:n])
+        return h
+
+    def slice_rows(self, start: Optional[int] = None, stop: Optional[int] = None) -> "TimeSeriesFrame":
+        """Zero-copy view over rows ``[start, stop)``."""
+        return TimeSeriesFrame.from_block(self._index[start:stop], self._names, self._values[start:stop])
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    # --- Compatibility layer (list/dict access used by plugins) ---
+    @property
+    def dates(self) -> List[datetime]:
+        if self._dates is None:
+            self._dates = self._index.astype(datetime).tolist()
+        return self._dates
+
+    @property
+    def columns(self) -> Mapping:
+        return self._columns
 
     @staticmethod
-    def from_csv(path: str, date_col: str, select_cols: Optional[List[str]] = None, as_of_date: Optional[datetime] = None) -> "TimeSeriesFrame":
-        dates: List[datetime] = []
-        cols: Dict[str, List[float]] = {}
-        with open(path, "r", newline="") as f:
-            r = csv.DictReader(f)
-            if select_cols is None:
-                select_cols = [c for c in r.fieldnames if c != date_col]
-            for c in select_cols:
-                cols[c] = []
-            for row in r:
-                dt = parse_ymd(row[date_col])
-                if as_of_date is not None and dt > as_of_date:
-                    break
-                dates.append(dt)
-                for c in select_cols:
-                    try:
-                        v = float(row[c])
-                    except Exception:
-                        v = float('nan')
-                    cols[c].append(v)
-        return TimeSeriesFrame(dates, cols)
+    def from_csv(
+        path: str,
+        date_col: str,
+        select_cols: Optional[List[str]] = None,
+        as_of_date: Optional[datetime] = None,
+        use_cache: bool = True,
+    ) -> "TimeSeriesFrame":
+        """
+        Load a date-indexed CSV in bulk.
+
+        With ``use_cache`` the whole file is kept in a memory-mapped binary
+        sidecar (see ``core.frame_cache``) that is rebuilt whenever the CSV
+        changes; columns and rows are then selected from the mapped block.
+        Cells that are empty or non-numeric become NaN; selected columns
+        missing from the file are all-NaN.
+        """
+        if not use_cache:
+            return TimeSeriesFrame.from_block(*_read_csv(path, date_col, select_cols, as_of_date))
+        block = frame_cache.load_block(path, date_col)
+        if block is None:
+            index, names, values = _read_csv(path, date_col)
+            hashes = {c: _column_digest(index, values[:, j]) for j, c in enumerate(names)}
+            frame_cache.save_block(path, date_col, index, names, values, column_hashes=hashes)
+        else:
+            index, names, values, hashes = block
+        if as_of_date is not None:
+            past = index > np.datetime64(as_of_date, "s")
+            if past.any():
+                n = int(np.argmax(past))
+                index, values = index[:n], values[:n]
+                hashes = {}  # the memoized hashes cover the full file only
+        if select_cols is None:
+            frame = TimeSeriesFrame.from_block(index, names, values)
+        else:
+            pos = {c: j for j, c in enumerate(names)}
+            out = np.full((len(index), len(select_cols)), np.nan, dtype=np.float64, order="F")
+            for j, c in enumerate(select_cols):
+                if c in pos:
+                    out[:, j] = values[:, pos[c]]
+            frame = TimeSeriesFrame.from_block(index, list(select_cols), out)
+        frame._hashes.update(((c, len(frame)), h) for c, h in hashes.items() if c in frame._pos)
+        return frame
 
     def subset(self, keep_cols: List[str]) -> "TimeSeriesFrame":
-        return TimeSeriesFrame(self.dates[:], {c: self.columns[c][:] for c in keep_cols})
+        """Copy the selected columns into a new compact block (row index is shared)."""
+        idx = [self._pos[c] for c in keep_cols]
+        return TimeSeriesFrame.from_block(self._index, list(keep_cols), self._values[:, idx])
+
+
+def _read_csv(
+    path: str,
+    date_col: str,
+    select_cols: Optional[List[str]] = None,
+    as_of_date: Optional[datetime] = None,
+) -> Tuple[np.ndarray, List[str], np.ndarray]:
+    """
+    Parse a CSV into ``(index, names, values)``.
+
+    Rows are tokenized once, the date column is parsed as a whole array and
+    truncated at the first date after ``as_of_date``; only the selected columns
+    of the remaining rows are converted to float64.
+    """
+    with open(path, "r", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None) or []
+        body = [row for row in reader if row]
+    if select_cols is None:
+        select_cols = [c for c in header if c != date_col]
+    pos = {c: j for j, c in enumerate(header)}
+
+    fields = list(zip_longest(*body, fillvalue="")) if body else []
+    n = len(body)
+    index = _parse_dates(fields[pos[date_col]] if n else ())
+    if as_of_date is not None and n:
+        past = index > np.datetime64(as_of_date, "s")
+        if past.any():
+            n = int(np.argmax(past))
+            index = index[:n]
+
+    values = np.full((n, len(select_cols)), np.nan, dtype=np.float64, order="F")
+    for j, c in enumerate(select_cols):
+        k = pos.get(c)
+        if k is not None and k < len(fields):
+            values[:, j] = _parse_floats(fields[k][:n])
+    return index, list(select_cols), values
+
+
+def _column_digest(index: np.ndarray, column: np.ndarray) -> str:
+    """blake2b-128 over the int64 date index followed by the float64 column bytes."""
+    d = hashlib.blake2b(digest_size=16)
+    d.update(np.ascontiguousarray(index).view("<i8").tobytes())
+    d.update(np.ascontiguousarray(column, dtype="<f8").tobytes())
+    return d.hexdigest()
+
+
+def _parse_dates(raw: Sequence[str]) -> np.ndarray:
+    """Parse a column of ``YYYY-MM-DD`` strings into datetime64[s] (``parse_ymd`` fallback)."""
+    arr = np.char.strip(np.asarray(raw, dtype=str))
+    if np.all(np.char.str_len(arr) == 10):
+        try:
+            return arr.astype("datetime64[s]")
+        except ValueError:
+            pass
+    return np.asarray([parse_ymd(s) for s in raw], dtype="datetime64[s]")
+
 
+def _parse_floats(raw: Sequence[str]) -> np.ndarray:
+    """Convert a column of strings to float64 at once; empty/invalid cells become NaN."""
+    arr = np.asarray(raw, dtype=str)
+    empty = arr == ""
+    try:
+        out = np.where(empty, "0", arr).astype(np.float64)
+    except ValueError:
+        out = np.empty(len(raw), dtype=np.float64)
+        for i, v in enumerate(raw):
+            try:
+                out[i] = float(v)
+            except Exception:
+                out[i] = float("nan")
+        return out
+    out[empty] = np.nan
+    return out
@@ -1,158 +1,286 @@
 from __future__ import annotations
 
-from typing import Dict, List, Tuple, Optional
-import math
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Tuple, Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 from .data import TimeSeriesFrame
 
 
-def build_lagged_columns(frame: TimeSeriesFrame, spec: Dict[str, List[int]]) -> Dict[str, List[float | None]]:
+# A feature series is a pair (values, present): ``present`` is False where the
+# value is unavailable (the list-based engine's None). NaN/inf are kept as
+# values so they propagate through rolling sums exactly as before.
+Series = Tuple[np.ndarray, np.ndarray]
+
+
+class ColumnCache:
     """
-    Build lagged series for a dict spec: { col_name: [lags...] }.
-    Returns a dict mapping synthetic column names 'col__lag{K}' to values with Nones for unavailable positions.
+    In-process LRU cache of computed feature series, bounded by total bytes.
+
+    Keys are nested tuples rooted at a source column's content hash, e.g.
+    ``((("col", h), "lag", 3), "zscore", 12)``, so variants of a sweep that
+    share a transform of the same data reuse one computation. Cached arrays
+    are read-only.
     """
-    out: Dict[str, List[float | None]] = {}
-    n = len(frame.dates)
+
+    def __init__(self, max_bytes: int = 256 << 20):
+        self.max_bytes = int(max_bytes)
+        self._entries: "OrderedDict[tuple, Series]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(self, key: tuple, compute: Callable[[], "Series"]) -> "Series":
+        with self._lock:
+            s = self._entries.get(key)
+            if s is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return s
+            self.misses += 1
+        s = compute()
+        for a in s:
+            a.flags.writeable = False
+        size = s[0].nbytes + s[1].nbytes
+        with self._lock:
+            if size > self.max_bytes or key in self._entries:
+                return s
+            self._entries[key] = s
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, old = self._entries.popitem(last=False)
+                self.bytes -= old[0].nbytes + old[1].nbytes
+                self.evictions += 1
+        return s
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+
+COLUMN_CACHE = ColumnCache()
+
+
+def _root_key(frame: TimeSeriesFrame, col: str) -> tuple:
+    return ("col", frame.column_hash(col))
+
+
+def _column_series(frame: TimeSeriesFrame, col: str) -> Series:
+    v = np.asarray(frame.columns[col], dtype=np.float64)
+    return v, np.ones(len(v), dtype=bool)
+
+
+def _lag(s: Series, k: int) -> Series:
+    v, p = s
+    n = len(v)
+    out_v = np.zeros(n)
+    out_p = np.zeros(n, dtype=bool)
+    if k >= 0:
+        if k < n:
+            out_v[k:] = v[: n - k]
+            out_p[k:] = p[: n - k]
+    elif -k < n:
+        out_v[: n + k] = v[-k:]
+        out_p[: n + k] = p[-k:]
+    return out_v, out_p
+
+
+def _lagged_arrays(
+    frame: TimeSeriesFrame, spec: Dict[str, List[int]], keys: Optional[Dict[str, tuple]] = None
+) -> Dict[str, Series]:
+    """Lagged series via ``COLUMN_CACHE``; ``keys`` (if given) receives each column's cache key."""
+    out: Dict[str, Series] = {}
     for col, lags in spec.items():
-        base = frame.columns.get(col)
-        if base is None:
+        if col not in frame.columns:
             continue
+        base = _column_series(frame, col)
+        root = _root_key(frame, col)
         for k in sorted(set(int(l) for l in lags)):
-            name = f"{col}__lag{k}"
-            vals: List[float | None] = [None] * n
-            for i in range(n):
-                j = i - k
-                if 0 <= j < n:
-                    vals[i] = base[j]
-            out[name] = vals
+            key = (root, "lag", k)
+            out[f"{col}__lag{k}"] = COLUMN_CACHE.get_or_compute(key, lambda: _lag(base, k))
+            if keys is not None:
+                keys[f"{col}__lag{k}"] = key
     return out
 
-def _rolling_mean(vals: List[Optional[float]], window: int) -> List[Optional[float]]:
-    out: List[Optional[float]] = [None] * len(vals)
-    if window <= 1:
-        return [float(v) if v is not None else None for v in vals]
-    s = 0.0
-    cnt = 0
-    for i in range(len(vals)):
-        v = vals[i]
-        if v is not None:
-            s += v
-            cnt += 1
-        if i >= window:
-            old = vals[i - window]
-            if old is not None:
-                s -= old
-                cnt -= 1
-        if i >= window - 1 and cnt > 0:
-            out[i] = s / cnt
-    return out
 
+def _to_list(s: Series) -> List[Optional[float]]:
+    return [x if ok else None for x, ok in zip(s[0].tolist(), s[1].tolist())]
 
-def _rolling_std(vals: List[Optional[float]], window: int) -> List[Optional[float]]:
-    out: List[Optional[float]] = [None] * len(vals)
-    if window <= 1:
-        return [0.0 if v is not None else None for v in vals]
-    for i in range(len(vals)):
-        j0 = i - window + 1
-        if j0 < 0:
-            continue
-        seg = [vals[j] for j in range(j0, i + 1) if vals[j] is not None]
-        if len(seg) < window:
-            continue
-        m = sum(seg) / len(seg)
-        var = sum((x - m) ** 2 for x in seg) / len(seg)
-        out[i] = math.sqrt(var)
-    return out
+
+def build_lagged_columns(frame: TimeSeriesFrame, spec: Dict[str, List[int]]) -> Dict[str, List[float | None]]:
+    """
+    Build lagged series for a dict spec: { col_name: [lags...] }.
+    Returns a dict mapping synthetic column names 'col__lag{K}' to values with Nones for unavailable positions.
+    """
+    return {name: _to_list(s) for name, s in _lagged_arrays(frame, spec).items()}
 
 
-def _ema(vals: List[Optional[float]], span: int) -> List[Optional[float]]:
-    out: List[Optional[float]] = [None] * len(vals)
-    if not vals:
-        return out
+def _rolling_mean(s: Series, window: int) -> Series:
+    v, p = s
+    n = len(v)
+    if window <= 1:
+        return v.copy(), p.copy()
+    # Running sum replayed as one cumulative sum over the add/drop sequence
+    # (+a0 .. +a[w-1], +a[w], -a0, +a[w+1], -a1, ...) so rounding matches a scalar loop.
+    a = np.where(p, v, 0.0)
+    if n > window:
+        e = np.empty(window + 2 * (n - window))
+        e[:window] = a[:window]
+        e[window::2] = a[window:]
+        e[window + 1::2] = -a[: n - window]
+        with np.errstate(invalid="ignore", over="ignore"):
+            cs = np.cumsum(e)
+        total = np.concatenate((cs[:window], cs[window + 1::2]))
+    else:
+        total = np.cumsum(a)
+    c = np.cumsum(p)
+    cnt = c.copy()
+    cnt[window:] -= c[:-window]
+    ok = cnt > 0
+    ok[: window - 1] = False
+    out = np.zeros(n)
+    np.divide(total, cnt, out=out, where=ok)
+    return out, ok
+
+
+def _rolling_std(s: Series, window: int) -> Series:
+    v, p = s
+    n = len(v)
+    if window <= 1:
+        return np.zeros(n), p.copy()
+    out = np.zeros(n)
+    ok = np.zeros(n, dtype=bool)
+    if n < window:
+        return out, ok
+    # Population std over full windows. Terms are accumulated in window order
+    # (one vector pass per offset) and squared with libm pow (float_power), like
+    # the scalar `(x - m) ** 2`, so results stay bit-identical.
+    wv = sliding_window_view(np.where(p, v, 0.0), window)
+    with np.errstate(invalid="ignore", over="ignore"):
+        total = wv[:, 0].copy()
+        for k in range(1, window):
+            total += wv[:, k]
+        m = total / window
+        ss = np.float_power(wv[:, 0] - m, 2.0)
+        for k in range(1, window):
+            ss += np.float_power(wv[:, k] - m, 2.0)
+        out[window - 1:] = np.sqrt(ss / window)
+    ok[window - 1:] = sliding_window_view(p, window).all(axis=1)
+    return out, ok
+
+
+def _ema(s: Series, span: int) -> Series:
+    # Sequential recurrence; kept as a scalar scan to preserve rounding.
+    vals = s[0].tolist()
+    present = s[1].tolist()
+    n = len(vals)
+    out = [0.0] * n
+    ok = [False] * n
     alpha = 2.0 / (span + 1.0) if span > 0 else 1.0
     ema_val: Optional[float] = None
-    for i, v in enumerate(vals):
-        if v is None:
+    for i in range(n):
+        if present[i]:
+            ema_val = vals[i] if ema_val is None else alpha * vals[i] + (1 - alpha) * ema_val
+        if ema_val is not None:
             out[i] = ema_val
-            continue
-        if ema_val is None:
-            ema_val = v
-        else:
-            ema_val = alpha * v + (1 - alpha) * ema_val
-        out[i] = ema_val
-    return out
+            ok[i] = True
+    return np.asarray(out, dtype=np.float64), np.asarray(ok, dtype=bool)
 
 
-def _zscore(vals: List[Optional[float]], window: int) -> List[Optional[float]]:
-    mu = _rolling_mean(vals, window)
-    sd = _rolling_std(vals, window)
-    out: List[Optional[float]] = [None] * len(vals)
-    for i in range(len(vals)):
-        v = vals[i]
-        if v is None or mu[i] is None or sd[i] is None or sd[i] == 0:
-            continue
-        out[i] = (v - mu[i]) / sd[i]
-    return out
+def _zscore(s: Series, window: int) -> Series:
+    v, p = s
+    mu, mu_ok = _rolling_mean(s, window)
+    sd, sd_ok = _rolling_std(s, window)
+    ok = p & mu_ok & sd_ok & (sd != 0)
+    out = np.zeros(len(v))
+    with np.errstate(invalid="ignore", over="ignore"):
+        np.divide(v - mu, sd, out=out, where=ok)
+    return out, ok
 
 
-def _diff(vals: List[Optional[float]], k: int) -> List[Optional[float]]:
-    out: List[Optional[float]] = [None] * len(vals)
-    for i in range(len(vals)):
-        j = i - k
-        if j >= 0 and vals[i] is not None and vals[j] is not None:
-            out[i] = vals[i] - vals[j]
-    return out
+def _shifted_pair(s: Series, k: int) -> Tuple[Series, np.ndarray]:
+    """Return series shifted by k (value at i is s[i-k]) and the in-range mask."""
+    lagged = _lag(s, k)
+    n = len(s[0])
+    idx = np.arange(n) - k
+    return lagged, (idx >= 0) & (idx < n)
 
 
-def _pct_change(vals: List[Optional[float]], k: int) -> List[Optional[float]]:
-    out: List[Optional[float]] = [None] * len(vals)
-    eps = 1e-12
-    for i in range(len(vals)):
-        j = i - k
-        if j >= 0 and vals[i] is not None and vals[j] is not None and abs(vals[j]) > eps:
-            out[i] = (vals[i] - vals[j]) / abs(vals[j]) * 100.0
-    return out
+def _diff(s: Series, k: int) -> Series:
+    v, p = s
+    (vj, pj), in_range = _shifted_pair(s, k)
+    ok = in_range & p & pj
+    with np.errstate(invalid="ignore", over="ignore"):
+        out = np.where(ok, v - vj, 0.0)
+    return out, ok
 
 
-def _apply_derived(frame: TimeSeriesFrame, spec_list: List[Dict]) -> Dict[str, List[Optional[float]]]:
-    out: Dict[str, List[Optional[float]]] = {}
-    n = len(frame.dates)
+def _pct_change(s: Series, k: int) -> Series:
+    v, p = s
+    eps = 1e-12
+    (vj, pj), in_range = _shifted_pair(s, k)
+    ok = in_range & p & pj & (np.abs(vj) > eps)
+    out = np.zeros(len(v))
+    with np.errstate(invalid="ignore", over="ignore"):
+        np.divide(v - vj, np.abs(vj), out=out, where=ok)
+        out *= 100.0
+    return out, ok
+
+
+# op -> (transform, output column suffix)
+_DERIVED_OPS = {
+    "diff": (_diff, "diff"),
+    "pct_change": (_pct_change, "pctchg"),
+    "rolling_mean": (_rolling_mean, "ma"),
+    "rolling_std": (_rolling_std, "std"),
+    "ema": (_ema, "ema"),
+    "zscore": (_zscore, "z"),
+}
+
+
+def _apply_derived(
+    frame: TimeSeriesFrame, spec_list: List[Dict], keys: Optional[Dict[str, tuple]] = None
+) -> Dict[str, Series]:
+    """Derived series via ``COLUMN_CACHE``; ``keys`` (if given) receives each column's cache key."""
+    out: Dict[str, Series] = {}
     for spec in (spec_list or []):
         on = spec.get("on")
         op = (spec.get("op") or "").lower()
         if not on or on not in frame.columns:
             continue
-        base = [float(v) if v is not None else None for v in frame.columns[on]]
-        name = None
-        vals: List[Optional[float]] = [None] * n
-        if op == "diff":
-            k = int(spec.get("k", 1))
-            vals = _diff(base, k)
-            name = f"{on}__diff{k}"
-        elif op == "pct_change":
-            k = int(spec.get("k", 1))
-            vals = _pct_change(base, k)
-            name = f"{on}__pctchg{k}"
-        elif op == "rolling_mean":
-            w = int(spec.get("window", 3))
-            vals = _rolling_mean(base, w)
-            name = f"{on}__ma{w}"
-        elif op == "rolling_std":
-            w = int(spec.get("window", 3))
-            vals = _rolling_std(base, w)
-            name = f"{on}__std{w}"
+        if op in ("diff", "pct_change"):
+            param = int(spec.get("k", 1))
+        elif op in ("rolling_mean", "rolling_std"):
+            param = int(spec.get("window", 3))
         elif op == "ema":
-            span = int(spec.get("span", 6))
-            vals = _ema(base, span)
-            name = f"{on}__ema{span}"
+            param = int(spec.get("span", 6))
         elif op == "zscore":
-            w = int(spec.get("window", 12))
-            vals = _zscore(base, w)
-            name = f"{on}__z{w}"
+            param = int(spec.get("window", 12))
         else:
             continue
-        if name:
-            out[name] = vals
+        fn, suffix = _DERIVED_OPS[op]
+        base = _column_series(frame, on)
+        key = (_root_key(frame, on), op, param)
+        name = f"{on}__{suffix}{param}"
+        out[name] = COLUMN_CACHE.get_or_compute(key, lambda: fn(base, param))
+        if keys is not None:
+            keys[name] = key
     return out
 
 
@@ -179,6 +307,45 @@ def _pack_to_derived(pack: str, target_id: str, exog: Dict[str, Dict]) -> List[D
     return derived
 
 
+class FeatureBlock:
+    """
+    Horizon-independent supervised features for one (frame, features_cfg).
+
+    The feature matrix and the per-origin validity mask do not depend on the
+    horizon; ``for_horizon`` only shifts the target and drops origins whose
+    target falls past the end of the frame.
+    """
+
+    def __init__(self, dates: List, columns: List[str], matrix: np.ndarray, valid: np.ndarray, y_series: np.ndarray):
+        self.dates = dates
+        self.columns = columns
+        self.matrix = matrix
+        self.valid = valid
+        self.y_series = y_series
+
+    def rows(self, horizon: int) -> np.ndarray:
+        """Indices of usable origins for ``horizon``."""
+        n = len(self.valid)
+        ok = self.valid.copy()
+        ok[max(0, n - horizon):] = False
+        return np.flatnonzero(ok)
+
+    def for_horizon(self, horizon: int) -> Tuple[List, List[List[float]], List[float], List[float]]:
+        """Return (origin_dates, X, y, y_t) exactly as ``assemble_supervised_v2`` does."""
+        rows = self.rows(horizon)
+        dates = self.dates
+        origin_dates: List = [dates[i] for i in rows.tolist()]
+        X: List[List[float]] = self.matrix[rows].tolist()
+        y: List[float] = self.y_series[rows + horizon].tolist()
+        y_t: List[float] = self.y_series[rows].tolist()
+        return origin_dates, X, y, y_t
+
+    def first_origin_index(self, horizon: int = 1) -> Optional[int]:
+        """Frame index of the first usable origin (burn-in length), or None."""
+        rows = self.rows(horizon)
+        return int(rows[0]) if len(rows) else None
+
+
 def assemble_supervised_v2(
     frame: TimeSeriesFrame,
     target_id: str,
@@ -189,23 +356,32 @@ def assemble_supervised_v2(
     Assemble X and y for a given horizon using extended feature config.
     features_cfg may contain: target_lags, exog, derived, pack, normalize, max_features.
     """
+    return build_feature_block(frame, target_id, features_cfg).for_horizon(horizon)
+
+
+def _expand_exog(frame: TimeSeriesFrame, target_id: str, exog_cfg: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Expand the ``__all__`` shorthand to all columns except target_id."""
+    if "__all__" not in exog_cfg:
+        return exog_cfg
+    spec_all = exog_cfg.get("__all__") or {}
+    expanded: Dict[str, Dict] = {}
+    for col in sorted(frame.columns.keys()):
+        if col == target_id:
+            continue
+        expanded[col] = {"lags": list(spec_all.get("lags", []))}
+    # Explicitly specified exogs override __all__ for those keys
+    for k, v in exog_cfg.items():
+        if k == "__all__":
+            continue
+        expanded[k] = v
+    return expanded
+
+
+def build_feature_block(frame: TimeSeriesFrame, target_id: str, features_cfg: Dict) -> FeatureBlock:
+    """Build the horizon-independent feature block once; see ``FeatureBlock``."""
     n = len(frame.dates)
     target_lags: List[int] = list((features_cfg or {}).get("target_lags", []))
-    exog_cfg: Dict[str, Dict] = (features_cfg or {}).get("exog", {}) or {}
-    # Expand __all__ shorthand to all columns except target_id
-    if "__all__" in exog_cfg:
-        spec_all = exog_cfg.get("__all__") or {}
-        expanded: Dict[str, Dict] = {}
-        for col in sorted(frame.columns.keys()):
-            if col == target_id:
-                continue
-            expanded[col] = {"lags": list(spec_all.get("lags", []))}
-        # Explicitly specified exogs override __all__ for those keys
-        for k, v in exog_cfg.items():
-            if k == "__all__":
-                continue
-            expanded[k] = v
-        exog_cfg = expanded
+    exog_cfg = _expand_exog(frame, target_id, (features_cfg or {}).get("exog", {}) or {})
 
     # Build lag specs (baseline features)
     lag_spec: Dict[str, List[int]] = {target_id: list(target_lags)}
@@ -213,7 +389,8 @@ def assemble_supervised_v2(
         lags = list(cfg.get("lags", []))
         if lags:
             lag_spec[ex_name] = lags
-    lagged = build_lagged_columns(frame, lag_spec)
+    keys: Dict[str, tuple] = {}
+    lagged = _lagged_arrays(frame, lag_spec, keys)
 
     # Derived transforms (optional)
     derived_spec: List[Dict] = []
@@ -221,17 +398,17 @@ def assemble_supervised_v2(
         derived_spec.extend(_pack_to_derived(features_cfg.get("pack"), target_id, exog_cfg))
     if features_cfg and features_cfg.get("derived"):
         derived_spec.extend(features_cfg.get("derived"))
-    derived_cols = _apply_derived(frame, derived_spec)
+    derived_cols = _apply_derived(frame, derived_spec, keys)
 
     # Optionally normalize all features via rolling z-score
     norm = (features_cfg or {}).get("normalize") or {}
     if norm and (norm.get("method") == "zscore"):
         w = int(norm.get("window", 12))
         # apply to both lagged and derived feature columns
-        for name in list(lagged.keys()):
-            lagged[name] = _zscore(lagged[name], w)
-        for name in list(derived_cols.keys()):
-            derived_cols[name] = _zscore(derived_cols[name], w)
+        for group in (lagged, derived_cols):
+            for name in list(group.keys()):
+                src = group[name]
+                group[name] = COLUMN_CACHE.get_or_compute((keys[name], "zscore", w), lambda: _zscore(src, w))
 
     # Column order: lags first (target then exogs), then derived sorted
     target_cols = [f"{target_id}__lag{k}" for k in sorted(set(target_lags))]
@@ -265,38 +442,22 @@ def assemble_supervised_v2(
         if lags:
             max_lag = max(max_lag, max(lags))
 
-    origin_dates: List = []
-    X: List[List[float]] = []
-    y: List[float] = []
-    y_t: List[float] = []
-
-    y_series = frame.columns.get(target_id, [])
-    for i in range(n):
-        # must have features at t and target at t+h
-        j_target = i + horizon
-        if i < max_lag or j_target >= n:
+    # Row validity in one pass: every feature present and finite at t
+    cols = [lagged.get(c) or derived_cols.get(c) for c in col_order]
+    M = np.empty((n, len(col_order)), dtype=np.float64)
+    valid = np.ones(n, dtype=bool)
+    valid[: max(0, max_lag)] = False
+    for j, series in enumerate(cols):
+        if series is None:
+            valid[:] = False
+            M[:, j] = 0.0
             continue
-        # Check that no feature is None
-        row_vals: List[float] = []
-        ok = True
-        for cname in col_order:
-            vals = lagged.get(cname)
-            if vals is None:
-                # maybe from derived
-                vals = derived_cols.get(cname)
-            v = None if vals is None else vals[i]
-            if v is None or (isinstance(v, float) and not math.isfinite(v)):
-                ok = False
-                break
-            row_vals.append(float(v))
-        if not ok:
-            continue
-        origin_dates.append(frame.dates[i])
-        X.append(row_vals)
-        y.append(float(y_series[j_target]))
-        y_t.append(float(y_series[i]))
+        v, p = series
+        M[:, j] = v
+        valid &= p & np.isfinite(v)
 
-    return origin_dates, X, y, y_t
+    y_series = np.asarray(frame.columns[target_id], dtype=np.float64) if target_id in frame.columns else np.full(n, np.nan)
+    return FeatureBlock(frame.dates, col_order, M, valid, y_series)
 
 
 # Backward-compatible wrapper used by earlier code in v2
@@ -311,6 +472,26 @@ def assemble_supervised(
     return assemble_supervised_v2(frame, target_id, features_cfg, horizon)
 
 
+def _feature_inputs(frame: TimeSeriesFrame, target_id: str, features_cfg: Dict) -> Tuple[List[str], int]:
+    """
+    Raw frame columns a feature config reads (target, exog and derived/pack
+    inputs) and how many rows past an origin it looks (negative lags/shifts).
+    """
+    exog_cfg = _expand_exog(frame, target_id, features_cfg.get("exog", {}) or {})
+    derived_spec: List[Dict] = list(features_cfg.get("derived") or [])
+    if features_cfg.get("pack"):
+        derived_spec.extend(_pack_to_derived(features_cfg.get("pack"), target_id, exog_cfg))
+    cols = {target_id, *exog_cfg.keys()}
+    cols.update(spec["on"] for spec in derived_spec if spec.get("on"))
+    shifts = [int(k) for k in features_cfg.get("target_lags", [])]
+    for cfg in exog_cfg.values():
+        shifts.extend(int(k) for k in (cfg or {}).get("lags", []))
+    for spec in derived_spec:
+        if (spec.get("op") or "").lower() in ("diff", "pct_change"):
+            shifts.append(int(spec.get("k", 1)))
+    return sorted(cols), max([0] + [-k for k in shifts])
+
+
 def build_feature_manifest(frame: TimeSeriesFrame, target_id: str, features_cfg: Dict) -> Dict:
     """Return a manifest dict summarizing feature config and the final column names used.
     Does not depend on horizon (column order is horizon-agnostic)."""
@@ -381,4 +562,6 @@ def build_feature_manifest(frame: TimeSeriesFrame, target_id: str, features_cfg:
         "columns_count": len(col_order),
         "columns": col_order,
     }
+    # Data dependencies: every row up to (origin + max_lead) of these columns may be read
+    manifest["source_columns"], manifest["max_lead"] = _feature_inputs(frame, target_id, features_cfg)
     return manifest
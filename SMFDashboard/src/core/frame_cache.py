@@ -0,0 +1,125 @@
+"""
+Binary sidecar cache for TimeSeriesFrame CSV loads.
+
+The first load of ``data.csv`` writes ``data.csv.tsf`` next to it: an 8-byte
+magic, a little-endian header length, a JSON header and then two raw blocks
+(the int64 epoch-second index and the column-major float64 values). Later
+loads validate the header against the source file's size, mtime and sha256
+and memory-map both blocks instead of re-parsing the CSV. The header also
+memoizes per-column content hashes (``TimeSeriesFrame.column_hash``) so cache
+fingerprints over the full file are free until the file changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+MAGIC = b"TSFRAME1"
+FORMAT_VERSION = 2
+SUFFIX = ".tsf"
+_ALIGN = 64
+
+
+def sidecar_path(path: str) -> str:
+    return path + SUFFIX
+
+
+def source_signature(path: str) -> Dict:
+    """Size, mtime and content hash of the source file."""
+    st = os.stat(path)
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": h.hexdigest()}
+
+
+def load_block(path: str, date_col: str) -> Optional[Tuple[np.ndarray, List[str], np.ndarray, Dict[str, str]]]:
+    """
+    Return ``(index, names, values, column_hashes)`` memory-mapped from the
+    sidecar, or None when it is missing, unreadable or stale for the current
+    source file.
+    """
+    cache_path = sidecar_path(path)
+    try:
+        with open(cache_path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                return None
+            (header_len,) = struct.unpack("<Q", f.read(8))
+            header = json.loads(f.read(header_len).decode("utf-8"))
+    except (OSError, ValueError, struct.error):
+        return None
+    if header.get("version") != FORMAT_VERSION or header.get("date_col") != date_col:
+        return None
+    try:
+        if header.get("source") != source_signature(path):
+            return None
+    except OSError:
+        return None
+
+    n = int(header["n_rows"])
+    names = list(header["names"])
+    hashes = dict(header.get("column_hashes") or {})
+    if n == 0:
+        return np.empty(0, dtype="datetime64[s]"), names, np.empty((0, len(names)), dtype=np.float64, order="F"), hashes
+    index = np.memmap(cache_path, dtype="<i8", mode="r", offset=int(header["index_offset"]), shape=(n,))
+    values = np.memmap(cache_path, dtype="<f8", mode="r", offset=int(header["values_offset"]), shape=(n, len(names)), order="F")
+    return index.view("datetime64[s]"), names, values, hashes
+
+
+def save_block(
+    path: str,
+    date_col: str,
+    index: np.ndarray,
+    names: List[str],
+    values: np.ndarray,
+    column_hashes: Optional[Dict[str, str]] = None,
+) -> bool:
+    """Write the sidecar atomically; returns False if the directory is not writable."""
+    index_bytes = np.ascontiguousarray(np.asarray(index, dtype="datetime64[s]").view("<i8")).tobytes()
+    values_bytes = np.asfortranarray(values, dtype="<f8").tobytes(order="F")
+    header = {
+        "version": FORMAT_VERSION,
+        "date_col": date_col,
+        "names": list(names),
+        "n_rows": int(len(index)),
+        "source": source_signature(path),
+        "column_hashes": dict(column_hashes or {}),
+    }
+    # Offsets depend on the header length, so size the header with placeholders first
+    header["index_offset"] = header["values_offset"] = 0
+    base = len(MAGIC) + 8 + len(json.dumps(header).encode("utf-8")) + 64
+    index_offset = -(-base // _ALIGN) * _ALIGN
+    header["index_offset"] = index_offset
+    header["values_offset"] = -(-(index_offset + len(index_bytes)) // _ALIGN) * _ALIGN
+    header_bytes = json.dumps(header).encode("utf-8")
+    header_bytes += b" " * (index_offset - len(MAGIC) - 8 - len(header_bytes))
+
+    cache_path = sidecar_path(path)
+    try:
+        fd, tmp = tempfile.mkstemp(prefix=os.path.basename(cache_path) + ".", dir=os.path.dirname(cache_path) or ".")
+    except OSError:
+        return False
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<Q", len(header_bytes)))
+            f.write(header_bytes)
+            f.write(index_bytes)
+            f.write(b"\0" * (header["values_offset"] - index_offset - len(index_bytes)))
+            f.write(values_bytes)
+        os.replace(tmp, cache_path)
+        return True
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        return False
@@ -6,6 +6,13 @@ import csv
 from typing import Dict, List
 
 
+def _fresh(path: str) -> str:
+    """Unlink ``path`` before it is rewritten: it may be hardlinked from the model library."""
+    if os.path.lexists(path):
+        os.unlink(path)
+    return path
+
+
 class OutputManager:
     def __init__(self, base_dir: str, run_id: str):
         self.base_dir = base_dir
@@ -29,7 +36,7 @@ class OutputManager:
 
     def save_backtest_csv(self, rows: List[Dict]):
         path = os.path.join(self.forecasts_dir, "backtest.csv")
-        with open(path, "w", newline="") as f:
+        with open(_fresh(path), "w", newline="") as f:
             w = csv.writer(f)
             w.writerow(["origin_date", "target_date", "horizon", "y_t", "forecast", "actual", "error"])
             for r in rows:
@@ -45,7 +52,7 @@ class OutputManager:
 
     def save_metrics_csv(self, metrics_by_h: Dict[int, Dict[str, float]]):
         path = os.path.join(self.metrics_dir, "metrics.csv")
-        with open(path, "w", newline="") as f:
+        with open(_fresh(path), "w", newline="") as f:
             w = csv.writer(f)
             w.writerow(["horizon", "rmse", "mae"])  # header
             for h in sorted(metrics_by_h.keys()):
@@ -60,7 +67,9 @@ class OutputManager:
             if not name.startswith(prefix):
                 continue
             full = os.path.join(self.base_dir, name)
-            if os.path.isdir(os.path.join(full, "models")):
+            models_dir = os.path.join(full, "models")
+            # Every run dir has a models/ folder; predict runs leave it empty
+            if os.path.isdir(models_dir) and any(f.startswith("model_h") for f in os.listdir(models_dir)):
                 candidates.append((os.path.getmtime(full), full))
         if not candidates:
             return None
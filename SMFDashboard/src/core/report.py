@@ -13,7 +13,8 @@ def generate_comparison_report_html(
     """
     Build a tabular comparison report only (no charts).
     metrics_rows: list of rows each containing:
-      - model_name, strategy, run_dir
+      - model_name, strategy (canonical label, e.g. "rolling:60,refit_every:3"), run_dir
+      - strategy_params: {"mode", "window", "refit_every"} as parsed by core.backtest.parse_strategy (optional)
       - rmse: {h: val}, mae: {h: val}  (optional)
       - ext: {h: {n, rmse, mae, r2, mape_pct, smape_pct, bias, direction_accuracy_pct, pct_up, pct_down, hit_rate_up_pct, hit_rate_down_pct}}
     """
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Dict, List
 
 from core.base import BaseModel
+from ..linear.model import _linear_batch
 
 
 NAME = "ARp"
@@ -52,6 +53,9 @@ class _ARp(BaseModel):
             z += [0.0] * (len(self.coef) - len(z))
         return sum(c * v for c, v in zip(self.coef, z))
 
+    def predict_batch(self, X: List[List[float]]) -> List[float]:
+        return _linear_batch(self.coef, X, pad=True)
+
     def get_params(self) -> Dict:
         return {"coef": self.coef[:]}
 
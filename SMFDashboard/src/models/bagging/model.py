@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 import random as _random
 
 from core.base import BaseModel
-from ..tree.model import _TreeRegressor
+from ..tree.model import _FlatTrees, _TreeRegressor
 
 
 NAME = "Bagging"
@@ -35,9 +35,11 @@ class _Bagging(BaseModel):
         self.random_state = int(random_state)
         self.trees: List[_TreeRegressor] = []
         self._rng = _random.Random(self.random_state)
+        self._flat: Optional[_FlatTrees] = None
 
     def fit(self, X: List[List[float]], y: List[float]) -> None:
         self.trees = []
+        self._flat = None
         if not X or not y or len(X) != len(y):
             return
         n = len(y)
@@ -63,6 +65,15 @@ class _Bagging(BaseModel):
             s += t.predict_row(x_row)
         return s / len(self.trees)
 
+    def predict_batch(self, X: List[List[float]]) -> List[float]:
+        if not self.trees:
+            return [0.0] * len(X)
+        if len(X) == 0:
+            return []
+        if self._flat is None:
+            self._flat = _FlatTrees([t.root for t in self.trees])
+        return self._flat.mean(X)
+
     def get_params(self) -> Dict:
         return {
             "n_estimators": self.n_estimators,
@@ -83,6 +94,7 @@ class _Bagging(BaseModel):
         self.random_state = int(params.get("random_state", self.random_state))
         self._rng = _random.Random(self.random_state)
         self.trees = []
+        self._flat = None
         for tp in params.get("trees", []) or []:
             t = _TreeRegressor()
             t.set_params(tp)
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 from typing import Dict, List
+
+import numpy as np
+
 from core.base import BaseModel
+from ..tree.hist import BinnedFeatures, grow_oblivious, oblivious_leaf
 
 
 NAME = "CatBoost"
@@ -9,60 +13,116 @@ NAME = "CatBoost"
 SPEC = {
     "frequency": "any",
     "input": {"target": {"lags": [0]}, "exog": {}},
-    "strategies": ["frozen"],
+    "strategies": ["frozen", "refit"],
     "supports_horizons": "any",
+    "params_schema": {
+        "iterations": {"type": "int", "default": 100, "min": 1},
+        "learning_rate": {"type": "float", "default": 0.1, "min": 0.0},
+        "depth": {"type": "int", "default": 6, "min": 1},
+        "l2_leaf_reg": {"type": "float", "default": 3.0, "min": 0.0},
+        "max_bins": {"type": "int", "default": 255, "min": 2},
+    },
 }
 
 
 class _CatBoost(BaseModel):
     """
-    CatBoost gradient boosting - simplified fallback implementation.
-    Note: Full CatBoost requires 'catboost' package installation.
-    Falls back to simple linear combination.
+    CatBoost-style gradient boosting for squared loss on oblivious trees:
+    every level of a tree splits on one shared ``(feature, threshold)``, so a
+    tree is ``depth`` comparisons building a leaf index plus a table of
+    ``2 ** depth`` leaf values. Plain (not ordered) boosting; features are
+    numeric, so there are no categorical statistics.
     """
 
-    def __init__(self, iterations: int = 100, learning_rate: float = 0.1):
-        self.iterations = iterations
-        self.learning_rate = learning_rate
-        self.slope = 0.0
-        self.intercept = 0.0
+    def __init__(self, iterations: int = 100, learning_rate: float = 0.1, depth: int = 6,
+                 l2_leaf_reg: float = 3.0, max_bins: int = 255):
+        self.iterations = int(iterations)
+        self.learning_rate = float(learning_rate)
+        self.depth = int(depth)
+        self.l2_leaf_reg = float(l2_leaf_reg)
+        self.max_bins = int(max_bins)
+        self.base_score: float = 0.0
+        # One dict per tree: split "features", "thresholds" and leaf "values"
+        self.trees: List[Dict] = []
 
     def fit(self, X: List[List[float]], y: List[float]) -> None:
-        if not X or not y:
+        self.trees = []
+        if not X or not y or len(X) != len(y):
+            self.base_score = 0.0
             return
-        # Simple linear regression as fallback
-        n = len(X)
-        sum_x = sum(row[0] if row else 0 for row in X)
-        sum_y = sum(y)
-        sum_xy = sum((row[0] if row else 0) * val for row, val in zip(X, y))
-        sum_x2 = sum((row[0] if row else 0) ** 2 for row in X)
-        
-        if sum_x2 == 0:
-            self.slope = 0.0
-            self.intercept = sum_y / n if n > 0 else 0.0
-        else:
-            self.slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x ** 2)
-            self.intercept = (sum_y - self.slope * sum_x) / n
+        n = len(y)
+        self.base_score = sum(y) / n
+        n_features = len(X[0]) if X[0] else 0
+        if n_features == 0:
+            return
+        ya = np.asarray(y, dtype=float)
+        binned = BinnedFeatures(np.asarray(X, dtype=float), self.max_bins)
+        rows = np.arange(n)
+        features = list(range(n_features))
+        predictions = np.full(n, self.base_score)
+        hessians = np.full(n, 2.0)  # Constant for squared loss
+        for _ in range(self.iterations):
+            gradients = 2.0 * (predictions - ya)
+            feats, thresholds, values, leaf = grow_oblivious(binned, features, rows, gradients, hessians,
+                                                             self.depth, self.l2_leaf_reg)
+            # A table lookup per row updates the training predictions
+            predictions += self.learning_rate * values[leaf]
+            self.trees.append({"features": feats, "thresholds": thresholds, "values": values.tolist()})
 
     def predict_row(self, x_row: List[float]) -> float:
-        if not x_row:
-            return self.intercept
-        return float(self.slope * x_row[0] + self.intercept)
+        prediction = self.base_score
+        for tree in self.trees:
+            prediction += self.learning_rate * tree["values"][oblivious_leaf(tree["features"], tree["thresholds"], x_row)]
+        return prediction
+
+    def predict_batch(self, X: List[List[float]]) -> List[float]:
+        n = len(X)
+        prediction = np.full(n, self.base_score)
+        if not self.trees or n == 0:
+            return prediction.tolist()
+        Xa = np.asarray(X, dtype=float).reshape(n, -1)
+        for tree in self.trees:
+            leaf = np.zeros(n, dtype=np.intp)
+            for d, (j, t) in enumerate(zip(tree["features"], tree["thresholds"])):
+                leaf |= (Xa[:, j] > t).astype(np.intp) << d
+            prediction += self.learning_rate * np.asarray(tree["values"])[leaf]
+        return prediction.tolist()
 
     def get_params(self) -> Dict:
-        return {"iterations": self.iterations, "learning_rate": self.learning_rate,
-                "slope": self.slope, "intercept": self.intercept}
+        return {
+            "iterations": self.iterations,
+            "learning_rate": self.learning_rate,
+            "depth": self.depth,
+            "l2_leaf_reg": self.l2_leaf_reg,
+            "max_bins": self.max_bins,
+            "base_score": self.base_score,
+            "trees": self.trees,
+        }
 
     def set_params(self, params: Dict) -> None:
-        self.iterations = params.get("iterations", 100)
-        self.learning_rate = params.get("learning_rate", 0.1)
-        self.slope = params.get("slope", 0.0)
-        self.intercept = params.get("intercept", 0.0)
+        self.iterations = int(params.get("iterations", self.iterations))
+        self.learning_rate = float(params.get("learning_rate", self.learning_rate))
+        self.depth = int(params.get("depth", self.depth))
+        self.l2_leaf_reg = float(params.get("l2_leaf_reg", self.l2_leaf_reg))
+        self.max_bins = int(params.get("max_bins", self.max_bins))
+        self.base_score = float(params.get("base_score", self.base_score))
+        self.trees = [
+            {"features": [int(j) for j in t["features"]], "thresholds": [float(v) for v in t["thresholds"]],
+             "values": [float(v) for v in t["values"]]}
+            for t in params.get("trees", [])
+        ]
 
 
 def create(params: Dict) -> BaseModel:
+    p = SPEC.get("params_schema", {})
+
+    def get(name: str):
+        return params.get(name, p.get(name, {}).get("default"))
+
     return _CatBoost(
-        iterations=params.get("iterations", 100),
-        learning_rate=params.get("learning_rate", 0.1)
+        iterations=int(get("iterations")),
+        learning_rate=float(get("learning_rate")),
+        depth=int(get("depth")),
+        l2_leaf_reg=float(get("l2_leaf_reg")),
+        max_bins=int(get("max_bins")),
     )
-
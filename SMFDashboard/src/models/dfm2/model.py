@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from typing import Dict, List
 
+import numpy as np
+
 from core.base import BaseModel
+from ..linear.model import _as_matrix, _dot_columns
 
 
 NAME = "DFM2"
@@ -148,6 +151,27 @@ class _DFM2(BaseModel):
             z += [0.0] * (len(self.coef) - len(z))
         return sum(c * v for c, v in zip(self.coef, z)) if self.coef else 0.0
 
+    def predict_batch(self, X: List[List[float]]) -> List[float]:
+        n = len(X)
+        if not self.coef:
+            return [0.0] * n
+        Xa = _as_matrix(X)
+        p = Xa.shape[1]
+        tcols = min(self.target_cols, p)
+        factors: List = []
+        if self.factor_weights and p > tcols:
+            m = min(p - tcols, len(self.exog_means), len(self.exog_stds))
+            z = [(Xa[:, tcols + j] - self.exog_means[j]) / (self.exog_stds[j] if self.exog_stds[j] > 1e-12 else 1.0) for j in range(m)]
+            for w in self.factor_weights:
+                f = np.zeros(n)
+                for j in range(min(len(w), m)):
+                    f += z[j] * w[j]
+                factors.append(f)
+        else:
+            factors = [0.0] * (len(self.factor_weights) if self.factor_weights else 1)
+        columns = [1.0] + [Xa[:, j] for j in range(tcols)] + factors
+        return _dot_columns(self.coef, columns + [0.0] * (len(self.coef) - len(columns)), n).tolist()
+
     def get_params(self) -> Dict:
         return {
             "target_cols": self.target_cols,
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from core.base import BaseModel
+from ..linear.model import _linear_batch
 
 
 NAME = "ElasticNetGrid"
@@ -38,7 +39,7 @@ class _ENetSolver:
         self.tol = float(tol)
         self.coef: List[float] = []  # [b0, b1..bp]
 
-    def fit(self, X: List[List[float]], y: List[float]) -> None:
+    def fit(self, X: List[List[float]], y: List[float], init: Optional[List[float]] = None) -> None:
         n = len(y)
         if not X or n == 0 or len(X) != n:
             self.coef = [0.0]
@@ -50,10 +51,14 @@ class _ENetSolver:
         Sj = [0.0] * p
         for j in range(p):
             Sj[j] = sum(float(X[i][j]) ** 2 for i in range(n))
-        # initialize
-        b0 = sum(float(v) for v in y) / n
-        b = [0.0] * p
-        y_hat = [b0 for _ in range(n)]
+        # initialize (from ``init`` when it fits the design)
+        if init is not None and len(init) == p + 1:
+            b0, b = init[0], list(init[1:])
+        else:
+            b0 = sum(float(v) for v in y) / n
+            b = [0.0] * p
+        nz = [(j, bj) for j, bj in enumerate(b) if bj != 0.0]
+        y_hat = [b0 + sum(bj * float(row[j]) for j, bj in nz) for row in X]
         for _ in range(self.max_iter):
             max_change = 0.0
             for j in range(p):
@@ -106,8 +111,10 @@ class _ElasticNetGrid(BaseModel):
         self.tol = float(tol)
         self.best_params: Dict[str, float] = {}
         self.best_coef: List[float] = []
+        self._init: Optional[List[float]] = None  # warm-start coefficients for the next fit
 
     def fit(self, X: List[List[float]], y: List[float]) -> None:
+        init, self._init = self._init, None
         if not X or not y or len(X) != len(y):
             self.best_coef = [0.0]
             self.best_params = {}
@@ -132,7 +139,7 @@ class _ElasticNetGrid(BaseModel):
         for a in self.alpha_grid:
             for r in self.l1_ratio_grid:
                 solver = _ENetSolver(alpha=a, l1_ratio=r, max_iter=self.max_iter, tol=self.tol)
-                solver.fit(X_tr, y_tr)
+                solver.fit(X_tr, y_tr, init)
                 preds = [solver.predict_row(x) for x in X_val]
                 score = mse(y_val, preds)
                 if score < best[0]:
@@ -154,6 +161,18 @@ class _ElasticNetGrid(BaseModel):
                 s += self.best_coef[j + 1] * float(v)
         return s
 
+    def predict_batch(self, X: List[List[float]]) -> List[float]:
+        return _linear_batch(self.best_coef, X, pad=False)
+
+    def warm_start(self, params: Dict) -> bool:
+        # The neighbour's best coefficients were fit on the same training split
+        # (for the same val_frac); every grid point starts from them
+        coef = params.get("coef") or []
+        if len(coef) < 2:
+            return False
+        self._init = [float(v) for v in coef]
+        return True
+
     def get_params(self) -> Dict:
         return {"best_params": self.best_params, "coef": self.best_coef[:], "alpha_grid": self.alpha_grid, "l1_ratio_grid": self.l1_ratio_grid, "val_frac": self.val_frac, "max_iter": self.max_iter, "tol": self.tol}
 
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from core.base import BaseModel
-from ..tree.model import _TreeRegressor
+from ..tree.model import _FlatTrees, _TreeRegressor
 
 
 NAME = "GradientBoosting"
@@ -32,9 +32,13 @@ class _GradientBoosting(BaseModel):
         self.random_state = int(random_state)
         self.init_: float = 0.0
         self.trees: List[_TreeRegressor] = []
+        self._flat: Optional[_FlatTrees] = None
+        self._warm: Optional[Dict] = None  # fitted params to take leading trees from
 
     def fit(self, X: List[List[float]], y: List[float]) -> None:
         self.trees = []
+        self._flat = None
+        warm, self._warm = self._warm, None
         if not X or not y or len(X) != len(y):
             self.init_ = 0.0
             return
@@ -43,8 +47,19 @@ class _GradientBoosting(BaseModel):
         self.init_ = sum(float(v) for v in y) / n
         # Residuals
         residual = [float(y[i]) - self.init_ for i in range(n)]
+        # Tree m depends only on the rows, the residuals of trees < m and random_state + m, so a
+        # neighbour fitted on the same rows (same init_) with the same tree settings has already
+        # grown our first trees: replay them instead of refitting
+        if warm is not None and warm.get("init_") == self.init_:
+            for tp in warm["trees"][:self.n_estimators]:
+                tree = _TreeRegressor()
+                tree.set_params(tp)
+                preds = [tree.predict_row(row) for row in X]
+                for i in range(n):
+                    residual[i] -= self.learning_rate * preds[i]
+                self.trees.append(tree)
         # Sequentially fit trees to residuals
-        for m in range(self.n_estimators):
+        for m in range(len(self.trees), self.n_estimators):
             tree = _TreeRegressor(max_depth=self.max_depth, min_samples_split=self.min_samples_split, max_features=None, random_state=self.random_state + m)
             tree.fit(X, residual)
             # Update residuals
@@ -60,6 +75,23 @@ class _GradientBoosting(BaseModel):
             yhat += lr * t.predict_row(x_row)
         return yhat
 
+    def predict_batch(self, X: List[List[float]]) -> List[float]:
+        if not self.trees or len(X) == 0:
+            return [self.init_] * len(X)
+        if self._flat is None:
+            self._flat = _FlatTrees([t.root for t in self.trees])
+        return self._flat.boost(X, self.init_, self.learning_rate)
+
+    def warm_start(self, params: Dict) -> bool:
+        same = all(
+            params.get(k) == getattr(self, k)
+            for k in ("learning_rate", "max_depth", "min_samples_split", "random_state")
+        )
+        if not same or not params.get("trees") or "init_" not in params:
+            return False
+        self._warm = params
+        return True
+
     def get_params(self) -> Dict:
         return {
             "n_estimators": self.n_estimators,
@@ -79,6 +111,7 @@ class _GradientBoosting(BaseModel):
         self.random_state = int(params.get("random_state", self.random_state))
         self.init_ = float(params.get("init_", self.init_))
         self.trees = []
+        self._flat = None
         for tp in params.get("trees", []) or []:
             t = _TreeRegressor()
             t.set_params(tp)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Dict, List
 
 from core.base import BaseModel
+from ..linear.model import _linear_batch
 
 
 NAME = "Huber"
@@ -110,6 +111,9 @@ class _Huber(BaseModel):
                 s += self.coef[j + 1] * float(v)
         return s
 
+    def predict_batch(self, X: List[List[float]]) -> List[float]:
+        return _linear_batch(self.coef, X, pad=False)
+
     def get_params(self) -> Dict:
         return {"delta": self.delta, "coef": self.coef[:], "max_iter": self.max_iter, "tol": self.tol}
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from core.base import BaseModel
+from ..linear.model import _linear_batch
 
 
 NAME = "Lasso"
@@ -28,6 +29,12 @@ def _soft_threshold(x: float, lam: float) -> float:
     return 0.0
 
 
+def _fitted(X: List[List[float]], b0: float, b: List[float]) -> List[float]:
+    """y_hat = b0 + X b, skipping zero coefficients (all of them on a cold start)."""
+    nz = [(j, bj) for j, bj in enumerate(b) if bj != 0.0]
+    return [b0 + sum(bj * float(row[j]) for j, bj in nz) for row in X]
+
+
 class _Lasso(BaseModel):
     """
     Lasso regression via coordinate descent with unpenalized intercept.
@@ -42,6 +49,7 @@ class _Lasso(BaseModel):
         self.max_iter = int(max_iter)
         self.tol = float(tol)
         self.coef: List[float] = []  # includes intercept at index 0
+        self._init: Optional[List[float]] = None  # warm-start coefficients for the next fit
 
     def fit(self, X: List[List[float]], y: List[float]) -> None:
         n = len(y)
@@ -59,12 +67,16 @@ class _Lasso(BaseModel):
                 s += float(X[i][j]) ** 2
             Sj[j] = s
 
-        # Initialize coefficients: intercept = mean(y), others = 0
-        b0 = sum(float(v) for v in y) / n
-        b = [0.0] * p
+        # Initialize coefficients: intercept = mean(y), others = 0, unless warm-started
+        init, self._init = self._init, None
+        if init is not None and len(init) == p + 1:
+            b0, b = init[0], init[1:]
+        else:
+            b0 = sum(float(v) for v in y) / n
+            b = [0.0] * p
 
         # Maintain fitted values y_hat = b0 + X b
-        y_hat = [b0 for _ in range(n)]
+        y_hat = _fitted(X, b0, b)
 
         # Coordinate descent
         for _ in range(self.max_iter):
@@ -123,6 +135,17 @@ class _Lasso(BaseModel):
                 s += self.coef[j + 1] * float(v)
         return s
 
+    def predict_batch(self, X: List[List[float]]) -> List[float]:
+        return _linear_batch(self.coef, X, pad=False)
+
+    def warm_start(self, params: Dict) -> bool:
+        # Coordinate descent converges from any start; a neighbour's solution is usually close
+        coef = params.get("coef") or []
+        if len(coef) < 2:
+            return False
+        self._init = [float(v) for v in coef]
+        return True
+
     def get_params(self) -> Dict:
         return {"alpha": self.alpha, "coef": self.coef[:], "max_iter": self.max_iter, "tol": self.tol}
 
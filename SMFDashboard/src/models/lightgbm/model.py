@@ -1,7 +1,12 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+import numpy as np
+
 from core.base import BaseModel
+from ..tree.model import _FlatTrees, _TreeNode
+from ..tree.hist import BinnedFeatures, grow_leafwise, node_from_dict, node_to_dict, predict_node
 
 
 NAME = "LightGBM"
@@ -9,60 +14,117 @@ NAME = "LightGBM"
 SPEC = {
     "frequency": "any",
     "input": {"target": {"lags": [0]}, "exog": {}},
-    "strategies": ["frozen"],
+    "strategies": ["frozen", "refit"],
     "supports_horizons": "any",
+    "params_schema": {
+        "n_estimators": {"type": "int", "default": 100, "min": 1},
+        "learning_rate": {"type": "float", "default": 0.1, "min": 0.0},
+        "num_leaves": {"type": "int", "default": 31, "min": 2},
+        # -1: no depth limit, trees are bounded by num_leaves only
+        "max_depth": {"type": "int", "default": -1, "min": -1},
+        "min_child_samples": {"type": "int", "default": 20, "min": 1},
+        "reg_lambda": {"type": "float", "default": 0.0, "min": 0.0},
+        "max_bins": {"type": "int", "default": 255, "min": 2},
+    },
 }
 
 
 class _LightGBM(BaseModel):
     """
-    LightGBM gradient boosting - simplified fallback implementation.
-    Note: Full LightGBM requires 'lightgbm' package installation.
-    Falls back to simple linear combination.
+    LightGBM-style gradient boosting for squared loss: histogram trees grown
+    leaf-wise (best-first) up to ``num_leaves`` leaves per tree.
     """
 
-    def __init__(self, n_estimators: int = 100, learning_rate: float = 0.1):
-        self.n_estimators = n_estimators
-        self.learning_rate = learning_rate
-        self.slope = 0.0
-        self.intercept = 0.0
+    def __init__(self, n_estimators: int = 100, learning_rate: float = 0.1, num_leaves: int = 31,
+                 max_depth: int = -1, min_child_samples: int = 20, reg_lambda: float = 0.0,
+                 max_bins: int = 255):
+        self.n_estimators = int(n_estimators)
+        self.learning_rate = float(learning_rate)
+        self.num_leaves = int(num_leaves)
+        self.max_depth = int(max_depth)
+        self.min_child_samples = int(min_child_samples)
+        self.reg_lambda = float(reg_lambda)
+        self.max_bins = int(max_bins)
+        self.base_score: float = 0.0
+        self.trees: List[_TreeNode] = []
+        self._flat: Optional[_FlatTrees] = None
 
     def fit(self, X: List[List[float]], y: List[float]) -> None:
-        if not X or not y:
+        self.trees = []
+        self._flat = None
+        if not X or not y or len(X) != len(y):
+            self.base_score = 0.0
             return
-        # Simple linear regression as fallback
-        n = len(X)
-        sum_x = sum(row[0] if row else 0 for row in X)
-        sum_y = sum(y)
-        sum_xy = sum((row[0] if row else 0) * val for row, val in zip(X, y))
-        sum_x2 = sum((row[0] if row else 0) ** 2 for row in X)
-        
-        if sum_x2 == 0:
-            self.slope = 0.0
-            self.intercept = sum_y / n if n > 0 else 0.0
-        else:
-            self.slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x ** 2)
-            self.intercept = (sum_y - self.slope * sum_x) / n
+        n = len(y)
+        self.base_score = sum(y) / n
+        n_features = len(X[0]) if X[0] else 0
+        if n_features == 0:
+            return
+        ya = np.asarray(y, dtype=float)
+        binned = BinnedFeatures(np.asarray(X, dtype=float), self.max_bins)
+        rows = np.arange(n)
+        features = list(range(n_features))
+        predictions = np.full(n, self.base_score)
+        hessians = np.full(n, 2.0)  # Constant for squared loss
+        for _ in range(self.n_estimators):
+            gradients = 2.0 * (predictions - ya)
+            root, leaves = grow_leafwise(binned, features, rows, gradients, hessians, self.num_leaves,
+                                         self.max_depth, self.min_child_samples, self.reg_lambda)
+            for leaf_rows, value in leaves:
+                predictions[leaf_rows] += self.learning_rate * value
+            self.trees.append(root)
 
     def predict_row(self, x_row: List[float]) -> float:
-        if not x_row:
-            return self.intercept
-        return float(self.slope * x_row[0] + self.intercept)
+        prediction = self.base_score
+        for tree in self.trees:
+            prediction += self.learning_rate * predict_node(tree, x_row)
+        return prediction
+
+    def predict_batch(self, X: List[List[float]]) -> List[float]:
+        if not self.trees or len(X) == 0:
+            return [self.base_score] * len(X)
+        if self._flat is None:
+            self._flat = _FlatTrees(self.trees)
+        return self._flat.boost(X, self.base_score, self.learning_rate)
 
     def get_params(self) -> Dict:
-        return {"n_estimators": self.n_estimators, "learning_rate": self.learning_rate,
-                "slope": self.slope, "intercept": self.intercept}
+        return {
+            "n_estimators": self.n_estimators,
+            "learning_rate": self.learning_rate,
+            "num_leaves": self.num_leaves,
+            "max_depth": self.max_depth,
+            "min_child_samples": self.min_child_samples,
+            "reg_lambda": self.reg_lambda,
+            "max_bins": self.max_bins,
+            "base_score": self.base_score,
+            "trees": [node_to_dict(t) for t in self.trees],
+        }
 
     def set_params(self, params: Dict) -> None:
-        self.n_estimators = params.get("n_estimators", 100)
-        self.learning_rate = params.get("learning_rate", 0.1)
-        self.slope = params.get("slope", 0.0)
-        self.intercept = params.get("intercept", 0.0)
+        self.n_estimators = int(params.get("n_estimators", self.n_estimators))
+        self.learning_rate = float(params.get("learning_rate", self.learning_rate))
+        self.num_leaves = int(params.get("num_leaves", self.num_leaves))
+        self.max_depth = int(params.get("max_depth", self.max_depth))
+        self.min_child_samples = int(params.get("min_child_samples", self.min_child_samples))
+        self.reg_lambda = float(params.get("reg_lambda", self.reg_lambda))
+        self.max_bins = int(params.get("max_bins", self.max_bins))
+        self.base_score = float(params.get("base_score", self.base_score))
+        self.trees = [node_from_dict(t) for t in params.get("trees", [])]
+        self._flat = None
 
 
 def create(params: Dict) -> BaseModel:
+    p = SPEC.get("params_schema", {})
+
+    def get(name: str):
+        return params.get(name, p.get(name, {}).get("default"))
+
     return _LightGBM(
-        n_estimators=params.get("n_estimators", 100),
-        learning_rate=params.get("learning_rate", 0.1)
+        n_estimators=int(get("n_estimators")),
+        learning_rate=float(get("learning_rate")),
+        num_leaves=int(get("num_leaves")),
+        max_depth=int(get("max_depth")),
+        min_child_samples=int(get("min_child_samples")),
+        reg_lambda=float(get("reg_lambda")),
+        max_bins=int(get("max_bins")),
     )
-
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
 
 from core.base import BaseModel
 
@@ -25,29 +27,40 @@ class _OLS(BaseModel):
 
     def __init__(self):
         self.coef: List[float] = []  # includes intercept as coef[0]
+        self._G: Optional[List[List[float]]] = None
+        self._g: List[float] = []
 
     def fit(self, X: List[List[float]], y: List[float]) -> None:
         if not X or not y or len(X) != len(y):
             self.coef = [0.0]
+            self._G = None
             return
-        n = len(X)
         p = len(X[0])
-        # Build design matrix with intercept: Z = [1, X]
-        Z = [[1.0] + [float(v) for v in row] for row in X]
-        # Compute G = Z^T Z and g = Z^T y
-        G = [[0.0 for _ in range(p + 1)] for _ in range(p + 1)]
-        g = [0.0 for _ in range(p + 1)]
-        for i in range(n):
-            zi = Z[i]
-            yi = float(y[i])
-            for a in range(p + 1):
-                g[a] += zi[a] * yi
-                za = zi[a]
-                for b in range(p + 1):
-                    G[a][b] += za * zi[b]
+        # Compute G = Z^T Z and g = Z^T y, with Z = [1, X]
+        self._G = [[0.0 for _ in range(p + 1)] for _ in range(p + 1)]
+        self._g = [0.0 for _ in range(p + 1)]
+        _accumulate(self._G, self._g, X, y)
         # Solve G b = g via Gaussian elimination with partial pivoting
-        b = _solve_linear_system(G, g)
-        self.coef = b
+        self.coef = _solve_linear_system(self._G, self._g)
+
+    def update(
+        self,
+        X_new: List[List[float]],
+        y_new: List[float],
+        X_drop: Optional[List[List[float]]] = None,
+        y_drop: Optional[List[float]] = None,
+    ) -> bool:
+        # Rank-one Gram updates in the same order as fit, so an expanding window
+        # matches a full refit exactly; dropped rows are subtracted back out.
+        X_drop, y_drop = X_drop or [], y_drop or []
+        if self._G is None or len(X_new) != len(y_new) or len(X_drop) != len(y_drop):
+            return False
+        if any(len(r) + 1 != len(self._G) for r in X_new + X_drop):
+            return False
+        _accumulate(self._G, self._g, X_new, y_new)
+        _accumulate(self._G, self._g, X_drop, y_drop, sign=-1.0)
+        self.coef = _solve_linear_system(self._G, self._g)
+        return True
 
     def predict_row(self, x_row: List[float]) -> float:
         if not self.coef:
@@ -58,11 +71,30 @@ class _OLS(BaseModel):
             z += [0.0] * (len(self.coef) - len(z))
         return sum(c * v for c, v in zip(self.coef, z))
 
+    def predict_batch(self, X: List[List[float]]) -> List[float]:
+        return _linear_batch(self.coef, X, pad=True)
+
     def get_params(self) -> Dict:
         return {"coef": self.coef[:]}  # copy
 
     def set_params(self, params: Dict) -> None:
         self.coef = [float(v) for v in params.get("coef", [])]
+        self._G = None
+
+
+def _accumulate(
+    G: List[List[float]], g: List[float], X: List[List[float]], y: List[float], sign: float = 1.0
+) -> None:
+    """Add (sign=-1: remove) z z^T and z y for each row z = [1, x] to G and g in place."""
+    n = len(G)
+    for row, yv in zip(X, y):
+        zi = [1.0] + [float(v) for v in row]
+        yi = sign * float(yv)
+        for a in range(n):
+            g[a] += zi[a] * yi
+            za = sign * zi[a]
+            for b in range(n):
+                G[a][b] += za * zi[b]
 
 
 def _solve_linear_system(A: List[List[float]], b: List[float]) -> List[float]:
@@ -94,5 +126,45 @@ def _solve_linear_system(A: List[List[float]], b: List[float]) -> List[float]:
     return x
 
 
+def _as_matrix(X: List[List[float]]) -> np.ndarray:
+    """Rows of ``X`` as a 2-D float array (``(0, 0)`` when there are none)."""
+    Xa = np.asarray(X, dtype=float)
+    return Xa.reshape(len(X), -1) if len(X) else Xa.reshape(0, 0)
+
+
+def _dot_columns(coef: List[float], columns: Sequence[Union[float, np.ndarray]], n: int) -> np.ndarray:
+    """
+    ``sum(c * v for c, v in zip(coef, z))`` for ``n`` rows at once, where
+    ``columns[k]`` holds ``z[k]`` of every row (or one scalar for all rows).
+    Terms are added in the order the per-row sum adds them, so each result
+    is exactly the per-row value.
+    """
+    s = np.zeros(n)
+    for c, v in zip(coef, columns):
+        s += c * v
+    return s
+
+
+def _linear_batch(coef: List[float], X: List[List[float]], pad: bool) -> List[float]:
+    """
+    Batch form of the linear plugins' ``predict_row``: intercept ``coef[0]``
+    plus ``coef[j + 1] * x_j``, accumulated column by column. With ``pad``
+    it follows ``sum(zip(coef, [1.0] + x + [0.0, ...]))``; without, the
+    ``s = coef[0]; s += ...`` loop that skips features beyond ``coef``.
+    """
+    n = len(X)
+    if not coef:
+        return [0.0] * n
+    Xa = _as_matrix(X)
+    p = Xa.shape[1]
+    if pad:
+        columns = [1.0] + [Xa[:, j] for j in range(p)] + [0.0] * (len(coef) - 1 - p)
+        return _dot_columns(coef, columns, n).tolist()
+    s = np.full(n, coef[0], dtype=float)
+    for j in range(min(p, len(coef) - 1)):
+        s += coef[j + 1] * Xa[:, j]
+    return s.tolist()
+
+
 def create(params: Dict) -> BaseModel:
     return _OLS()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from core.base import BaseModel
 
@@ -28,6 +28,16 @@ class _MovingAverage(BaseModel):
         # No parameters to fit
         return
 
+    def update(
+        self,
+        X_new: List[List[float]],
+        y_new: List[float],
+        X_drop: Optional[List[List[float]]] = None,
+        y_drop: Optional[List[float]] = None,
+    ) -> bool:
+        # Nothing is learned from training rows
+        return True
+
     def predict_row(self, x_row: List[float]) -> float:
         if not x_row:
             return 0.0
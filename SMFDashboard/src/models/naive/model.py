@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from core.base import BaseModel
 
@@ -25,6 +25,16 @@ class _Naive(BaseModel):
         # No parameters
         return
 
+    def update(
+        self,
+        X_new: List[List[float]],
+        y_new: List[float],
+        X_drop: Optional[List[List[float]]] = None,
+        y_drop: Optional[List[float]] = None,
+    ) -> bool:
+        # Nothing is learned from training rows
+        return True
+
     def predict_row(self, x_row: List[float]) -> float:
         return 0.0 if not x_row else float(x_row[0])
 
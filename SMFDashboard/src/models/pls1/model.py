@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from typing import Dict, List
 
+import numpy as np
+
 from core.base import BaseModel
+from ..linear.model import _as_matrix, _dot_columns
 
 
 NAME = "PLS1"
@@ -131,6 +134,22 @@ class _PLS1(BaseModel):
             z += [0.0] * (len(self.coef) - len(z))
         return sum(c * v for c, v in zip(self.coef, z)) if self.coef else 0.0
 
+    def predict_batch(self, X: List[List[float]]) -> List[float]:
+        n = len(X)
+        if not self.coef:
+            return [0.0] * n
+        Xa = _as_matrix(X)
+        p = Xa.shape[1]
+        tcols = min(self.target_cols, p)
+        t = np.zeros(n)
+        if self.weight and p > tcols:
+            m = min(p - tcols, len(self.exog_means), len(self.exog_stds), len(self.weight))
+            for j in range(m):
+                sd = self.exog_stds[j] if self.exog_stds[j] > 1e-12 else 1.0
+                t += (Xa[:, tcols + j] - self.exog_means[j]) / sd * self.weight[j]
+        columns = [1.0] + [Xa[:, j] for j in range(tcols)] + [t]
+        return _dot_columns(self.coef, columns + [0.0] * (len(self.coef) - len(columns)), n).tolist()
+
     def get_params(self) -> Dict:
         return {
             "target_cols": self.target_cols,
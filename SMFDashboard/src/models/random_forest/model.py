@@ -4,7 +4,7 @@ from typing import Dict, List, Optional, Union
 import random as _random
 
 from core.base import BaseModel
-from ..tree.model import _TreeRegressor
+from ..tree.model import _FlatTrees, _TreeRegressor
 
 
 NAME = "RandomForest"
@@ -35,9 +35,11 @@ class _RandomForest(BaseModel):
         self.random_state = int(random_state)
         self.trees: List[_TreeRegressor] = []
         self._rng = _random.Random(self.random_state)
+        self._flat: Optional[_FlatTrees] = None
 
     def fit(self, X: List[List[float]], y: List[float]) -> None:
         self.trees = []
+        self._flat = None
         if not X or not y or len(X) != len(y):
             return
         n = len(y)
@@ -67,6 +69,15 @@ class _RandomForest(BaseModel):
             s += t.predict_row(x_row)
         return s / len(self.trees)
 
+    def predict_batch(self, X: List[List[float]]) -> List[float]:
+        if not self.trees:
+            return [0.0] * len(X)
+        if len(X) == 0:
+            return []
+        if self._flat is None:
+            self._flat = _FlatTrees([t.root for t in self.trees])
+        return self._flat.mean(X)
+
     def get_params(self) -> Dict:
         return {
             "n_estimators": self.n_estimators,
@@ -87,6 +98,7 @@ class _RandomForest(BaseModel):
         self.random_state = int(params.get("random_state", self.random_state))
         self._rng = _random.Random(self.random_state)
         self.trees = []
+        self._flat = None
         for tp in params.get("trees", []) or []:
             t = _TreeRegressor()
             t.set_params(tp)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from core.base import BaseModel
+from ..linear.model import _accumulate, _linear_batch
 
 
 NAME = "Ridge"
@@ -25,29 +26,45 @@ class _Ridge(BaseModel):
     def __init__(self, alpha: float = 1.0):
         self.alpha = float(alpha)
         self.coef: List[float] = []
+        self._G: Optional[List[List[float]]] = None
+        self._g: List[float] = []
 
     def fit(self, X: List[List[float]], y: List[float]) -> None:
         if not X or not y or len(X) != len(y):
             self.coef = [0.0]
+            self._G = None
             return
-        n = len(X)
         p = len(X[0])
-        Z = [[1.0] + [float(v) for v in row] for row in X]
-        G = [[0.0 for _ in range(p + 1)] for _ in range(p + 1)]
-        g = [0.0 for _ in range(p + 1)]
-        for i in range(n):
-            zi = Z[i]
-            yi = float(y[i])
-            for a in range(p + 1):
-                g[a] += zi[a] * yi
-                za = zi[a]
-                for b in range(p + 1):
-                    G[a][b] += za * zi[b]
+        self._G = [[0.0 for _ in range(p + 1)] for _ in range(p + 1)]
+        self._g = [0.0 for _ in range(p + 1)]
+        _accumulate(self._G, self._g, X, y)
+        self._solve_coef()
+
+    def update(
+        self,
+        X_new: List[List[float]],
+        y_new: List[float],
+        X_drop: Optional[List[List[float]]] = None,
+        y_drop: Optional[List[float]] = None,
+    ) -> bool:
+        # Rank-one Gram updates in the same order as fit, so an expanding window
+        # matches a full refit exactly; dropped rows are subtracted back out.
+        X_drop, y_drop = X_drop or [], y_drop or []
+        if self._G is None or len(X_new) != len(y_new) or len(X_drop) != len(y_drop):
+            return False
+        if any(len(r) + 1 != len(self._G) for r in X_new + X_drop):
+            return False
+        _accumulate(self._G, self._g, X_new, y_new)
+        _accumulate(self._G, self._g, X_drop, y_drop, sign=-1.0)
+        self._solve_coef()
+        return True
+
+    def _solve_coef(self) -> None:
         # Add ridge penalty to non-intercept diagonal
-        for j in range(1, p + 1):
+        G = [row[:] for row in self._G]
+        for j in range(1, len(G)):
             G[j][j] += self.alpha
-        b = _solve(G, g)
-        self.coef = b
+        self.coef = _solve(G, self._g)
 
     def predict_row(self, x_row: List[float]) -> float:
         if not self.coef:
@@ -57,12 +74,16 @@ class _Ridge(BaseModel):
             z += [0.0] * (len(self.coef) - len(z))
         return sum(c * v for c, v in zip(self.coef, z))
 
+    def predict_batch(self, X: List[List[float]]) -> List[float]:
+        return _linear_batch(self.coef, X, pad=True)
+
     def get_params(self) -> Dict:
         return {"alpha": self.alpha, "coef": self.coef[:]}
 
     def set_params(self, params: Dict) -> None:
         self.alpha = float(params.get("alpha", self.alpha))
         self.coef = [float(v) for v in params.get("coef", [])]
+        self._G = None
 
 
 def _solve(A: List[List[float]], b: List[float]) -> List[float]:
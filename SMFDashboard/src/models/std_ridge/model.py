@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Dict, List
 
 from core.base import BaseModel
+from ..linear.model import _linear_batch
 
 
 NAME = "StandardizedRidge"
@@ -104,6 +105,9 @@ class _StdRidge(BaseModel):
                 s += self.coef[j + 1] * float(v)
         return s
 
+    def predict_batch(self, X: List[List[float]]) -> List[float]:
+        return _linear_batch(self.coef, X, pad=False)
+
     def get_params(self) -> Dict:
         return {"alpha": self.alpha, "coef": self.coef[:], "mu": self.mu[:], "sig": self.sig[:]}
 
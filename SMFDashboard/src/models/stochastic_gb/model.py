@@ -4,7 +4,7 @@ from typing import Dict, List, Optional, Union
 import random as _random
 
 from core.base import BaseModel
-from ..tree.model import _TreeRegressor
+from ..tree.model import _FlatTrees, _TreeRegressor
 
 
 NAME = "StochasticGB"
@@ -37,10 +37,14 @@ class _StochasticGB(BaseModel):
         self.random_state = int(random_state)
         self.init_: float = 0.0
         self.trees: List[_TreeRegressor] = []
+        self._flat: Optional[_FlatTrees] = None
         self._rng = _random.Random(self.random_state)
+        self._warm: Optional[Dict] = None  # fitted params to take leading trees from
 
     def fit(self, X: List[List[float]], y: List[float]) -> None:
         self.trees = []
+        self._flat = None
+        warm, self._warm = self._warm, None
         if not X or not y or len(X) != len(y):
             self.init_ = 0.0
             return
@@ -49,7 +53,9 @@ class _StochasticGB(BaseModel):
         self.init_ = sum(float(v) for v in y) / n
         residual = [float(y[i]) - self.init_ for i in range(n)]
         msize = max(1, min(n, int(round(self.subsample * n))))
-        for m in range(self.n_estimators):
+        if warm is not None and warm.get("init_") == self.init_:
+            self._replay(warm["trees"][:self.n_estimators], X, residual)
+        for m in range(len(self.trees), self.n_estimators):
             # sample without replacement indices for fitting
             idx = list(range(n))
             self._rng.shuffle(idx)
@@ -64,6 +70,27 @@ class _StochasticGB(BaseModel):
                 residual[i] -= lr * t.predict_row(row)
             self.trees.append(t)
 
+    def _replay(self, tree_params: List[Dict], X: List[List[float]], residual: List[float]) -> None:
+        """
+        Take a neighbour's leading trees (same rows, same settings) as our own:
+        draw the same subsamples and seeds from the rng, but skip the fits.
+        Stops at the first tree whose seed differs from the draw.
+        """
+        n = len(X)
+        for tp in tree_params:
+            state = self._rng.getstate()
+            idx = list(range(n))
+            self._rng.shuffle(idx)
+            if self._rng.randrange(0, 1_000_000) != tp.get("random_state"):
+                self._rng.setstate(state)
+                return
+            t = _TreeRegressor()
+            t.set_params(tp)
+            lr = self.learning_rate
+            for i, row in enumerate(X):
+                residual[i] -= lr * t.predict_row(row)
+            self.trees.append(t)
+
     def predict_row(self, x_row: List[float]) -> float:
         yhat = self.init_
         lr = self.learning_rate
@@ -71,6 +98,23 @@ class _StochasticGB(BaseModel):
             yhat += lr * t.predict_row(x_row)
         return yhat
 
+    def predict_batch(self, X: List[List[float]]) -> List[float]:
+        if not self.trees or len(X) == 0:
+            return [self.init_] * len(X)
+        if self._flat is None:
+            self._flat = _FlatTrees([t.root for t in self.trees])
+        return self._flat.boost(X, self.init_, self.learning_rate)
+
+    def warm_start(self, params: Dict) -> bool:
+        same = all(
+            params.get(k) == getattr(self, k)
+            for k in ("learning_rate", "subsample", "max_depth", "min_samples_split", "max_features", "random_state")
+        )
+        if not same or not params.get("trees") or "init_" not in params:
+            return False
+        self._warm = params
+        return True
+
     def get_params(self) -> Dict:
         return {
             "n_estimators": self.n_estimators,
@@ -95,6 +139,7 @@ class _StochasticGB(BaseModel):
         self.init_ = float(params.get("init_", self.init_))
         self._rng = _random.Random(self.random_state)
         self.trees = []
+        self._flat = None
         for tp in params.get("trees", []) or []:
             t = _TreeRegressor()
             t.set_params(tp)
@@ -0,0 +1,388 @@
+"""
+Histogram split finding for the boosting plugins.
+
+Features are quantised once per fit (``BinnedFeatures``); a node's gradient
+statistics are then accumulated per bin with one ``bincount`` and every
+candidate split of every feature is scored from prefix sums of those bins.
+Growing a node's children needs the histogram of the smaller child only:
+the larger one is the parent's minus it.
+
+Thresholds are midpoints between consecutive distinct training values, so
+with at most ``max_bins`` distinct values per feature the candidates are
+exactly those of an exhaustive search; only wider features are bucketed
+at quantiles.
+
+Three growth policies share these primitives: depth-wise (XGBoost),
+best-first leaf-wise under a ``num_leaves`` budget (LightGBM) and oblivious
+trees that apply one split per level to every node (CatBoost).
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .model import _TreeNode
+
+
+class BinnedFeatures:
+    """
+    Training matrix quantised to at most ``max_bins`` bins per feature.
+    ``codes[i, j]`` is the bin of row ``i`` in feature ``j``: the number of
+    ``cuts[j]`` below ``X[i, j]``, so ``code <= b`` exactly when
+    ``X[i, j] <= cuts[j][b]``.
+    """
+
+    def __init__(self, X: np.ndarray, max_bins: int = 256):
+        self.max_bins = max(2, int(max_bins))
+        self.cuts: List[np.ndarray] = [_cuts(X[:, j], self.max_bins) for j in range(X.shape[1])]
+        self.n_bins = 1 + max((len(c) for c in self.cuts), default=0)
+        self.codes = np.empty(X.shape, dtype=np.intp)
+        for j, c in enumerate(self.cuts):
+            self.codes[:, j] = np.searchsorted(c, X[:, j], side="left")
+
+    def threshold(self, feature: int, b: int) -> float:
+        return float(self.cuts[feature][b])
+
+
+def _cuts(x: np.ndarray, max_bins: int) -> np.ndarray:
+    u = np.unique(x)
+    if len(u) <= max_bins:
+        return 0.5 * (u[:-1] + u[1:])
+    # Quantile positions, snapped to the gap between the distinct values around them
+    q = np.quantile(x, np.linspace(0.0, 1.0, max_bins + 1)[1:-1])
+    i = np.clip(np.searchsorted(u, q, side="right"), 1, len(u) - 1)
+    i = np.unique(i)
+    return 0.5 * (u[i - 1] + u[i])
+
+
+def histogram(codes: np.ndarray, rows: np.ndarray, g: np.ndarray, h: np.ndarray, n_bins: int) -> np.ndarray:
+    """
+    Per-bin sums of gradients, hessians and row counts of ``rows``, as an
+    array of shape ``(3, n_features, n_bins)`` over the columns of ``codes``.
+    """
+    k = codes.shape[1]
+    flat = (codes[rows] + np.arange(k) * n_bins).ravel()
+    size = k * n_bins
+    hist = np.empty((3, size))
+    hist[0] = np.bincount(flat, weights=np.repeat(g[rows], k), minlength=size)
+    hist[1] = np.bincount(flat, weights=np.repeat(h[rows], k), minlength=size)
+    hist[2] = np.bincount(flat, minlength=size)
+    return hist.reshape(3, k, n_bins)
+
+
+def _score(G: np.ndarray, H: np.ndarray, reg_lambda: float) -> np.ndarray:
+    d = H + reg_lambda
+    if reg_lambda > 0:
+        # Hessian sums are non-negative (up to subtraction round-off), so d > 0
+        out = G * G
+        out /= d
+        return out
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(d > 0, G * G / np.where(d > 0, d, 1.0), 0.0)
+
+
+def split_gains(hist: np.ndarray, reg_lambda: float, reg_alpha: float, min_child: int = 1) -> np.ndarray:
+    """
+    Gain ``0.5 * (score(L) + score(R) - score(parent)) - reg_alpha`` of
+    splitting after each bin, shape ``(n_features, n_bins - 1)`` (with any
+    leading node axes of ``hist`` kept), with ``score = G^2 / (H + reg_lambda)``;
+    ``-inf`` where a side would hold fewer than ``min_child`` rows.
+    """
+    left = np.cumsum(hist, axis=-1)[..., :-1]
+    total = hist.sum(axis=-1, keepdims=True)
+    right = total - left
+    gain = 0.5 * (_score(left[0], left[1], reg_lambda) + _score(right[0], right[1], reg_lambda)
+                  - _score(total[0], total[1], reg_lambda)) - reg_alpha
+    return np.where((left[2] >= min_child) & (right[2] >= min_child), gain, -np.inf)
+
+
+def leaf_value(g: np.ndarray, h: np.ndarray, reg_lambda: float) -> float:
+    """Newton step ``-G / (H + reg_lambda)`` of a leaf's rows (0 when undefined)."""
+    G = float(g.sum())
+    d = float(h.sum()) + reg_lambda
+    return -G / d if d > 0 else 0.0
+
+
+def grow_depthwise(
+    binned: BinnedFeatures,
+    features: List[int],
+    rows: np.ndarray,
+    g: np.ndarray,
+    h: np.ndarray,
+    max_depth: int,
+    reg_lambda: float,
+    reg_alpha: float,
+) -> Tuple[_TreeNode, List[Tuple[np.ndarray, float]]]:
+    """
+    Grow one tree level by level over ``features`` (indices into ``binned``),
+    splitting each node at its best positive gain until ``max_depth``.
+
+    Returns:
+        The root, with original feature indices and thresholds, and the
+        ``(rows, value)`` of every leaf, so callers can update their
+        training predictions without walking the tree
+    """
+    feats = np.asarray(features, dtype=np.intp)
+    codes = binned.codes[:, feats]
+    leaves: List[Tuple[np.ndarray, float]] = []
+
+    def leaf(node: _TreeNode, node_rows: np.ndarray) -> None:
+        node.n = len(node_rows)
+        node.value = leaf_value(g[node_rows], h[node_rows], reg_lambda)
+        leaves.append((node_rows, node.value))
+
+    root = _TreeNode()
+    # Work list of (node, rows, histogram or None when its children are leaves anyway)
+    level = [(root, rows, histogram(codes, rows, g, h, binned.n_bins) if max_depth > 0 else None)]
+    for depth in range(max_depth + 1):
+        nxt = []
+        for node, node_rows, hist in level:
+            if hist is None or len(node_rows) < 2:
+                leaf(node, node_rows)
+                continue
+            gains = split_gains(hist, reg_lambda, reg_alpha)
+            if gains.size == 0:
+                # Every feature is constant (one bin): no cut to choose from
+                leaf(node, node_rows)
+                continue
+            best = int(np.argmax(gains))
+            r, b = divmod(best, gains.shape[1])
+            if not gains[r, b] > 0:
+                leaf(node, node_rows)
+                continue
+            node.n = len(node_rows)
+            node.feature = int(feats[r])
+            node.threshold = binned.threshold(node.feature, b)
+            go_left = codes[node_rows, r] <= b
+            rows_l, rows_r = node_rows[go_left], node_rows[~go_left]
+            node.left, node.right = _TreeNode(), _TreeNode()
+            hist_l: Optional[np.ndarray] = None
+            hist_r: Optional[np.ndarray] = None
+            if depth + 1 < max_depth:
+                # Accumulate the smaller child; the sibling is the difference
+                if len(rows_l) <= len(rows_r):
+                    hist_l = histogram(codes, rows_l, g, h, binned.n_bins)
+                    hist_r = hist - hist_l
+                else:
+                    hist_r = histogram(codes, rows_r, g, h, binned.n_bins)
+                    hist_l = hist - hist_r
+            nxt.append((node.left, rows_l, hist_l))
+            nxt.append((node.right, rows_r, hist_r))
+        level = nxt
+        if not level:
+            break
+    return root, leaves
+
+
+def _best(gains: np.ndarray) -> Tuple[float, int, int]:
+    """``(gain, feature position, bin)`` of the first maximum of ``gains`` (gain -inf if there are none)."""
+    if gains.size == 0:
+        return float("-inf"), 0, 0
+    best = int(np.argmax(gains))
+    r, b = divmod(best, gains.shape[1])
+    return float(gains[r, b]), r, b
+
+
+def grow_leafwise(
+    binned: BinnedFeatures,
+    features: List[int],
+    rows: np.ndarray,
+    g: np.ndarray,
+    h: np.ndarray,
+    num_leaves: int,
+    max_depth: int,
+    min_child: int,
+    reg_lambda: float,
+) -> Tuple[_TreeNode, List[Tuple[np.ndarray, float]]]:
+    """
+    Grow one tree best-first: always split the leaf with the largest gain,
+    until ``num_leaves`` leaves exist or no split gains anything. Leaves at
+    ``max_depth`` (when positive) are not split, and no split may leave a
+    child with fewer than ``min_child`` rows. Returns what
+    ``grow_depthwise`` does.
+    """
+    feats = np.asarray(features, dtype=np.intp)
+    codes = binned.codes[:, feats]
+    heap: List[Tuple] = []
+    grown: List[Tuple[_TreeNode, np.ndarray]] = []  # every node, in creation order
+    count = 0
+    n_leaves = 1
+
+    def consider(node: _TreeNode, node_rows: np.ndarray, hist: np.ndarray, depth: int) -> None:
+        nonlocal count
+        node.n = len(node_rows)
+        grown.append((node, node_rows))
+        if (max_depth > 0 and depth >= max_depth) or len(node_rows) < 2 * max(1, min_child):
+            return
+        gain, r, b = _best(split_gains(hist, reg_lambda, 0.0, max(1, min_child)))
+        if gain > 0:
+            # The counter breaks gain ties by creation order
+            heapq.heappush(heap, (-gain, count, node, node_rows, hist, depth, r, b))
+            count += 1
+
+    root = _TreeNode()
+    consider(root, rows, histogram(codes, rows, g, h, binned.n_bins), 0)
+    while heap and n_leaves < num_leaves:
+        _, _, node, node_rows, hist, depth, r, b = heapq.heappop(heap)
+        node.feature = int(feats[r])
+        node.threshold = binned.threshold(node.feature, b)
+        go_left = codes[node_rows, r] <= b
+        rows_l, rows_r = node_rows[go_left], node_rows[~go_left]
+        if len(rows_l) <= len(rows_r):
+            hist_l = histogram(codes, rows_l, g, h, binned.n_bins)
+            hist_r = hist - hist_l
+        else:
+            hist_r = histogram(codes, rows_r, g, h, binned.n_bins)
+            hist_l = hist - hist_r
+        node.left, node.right = _TreeNode(), _TreeNode()
+        consider(node.left, rows_l, hist_l, depth + 1)
+        consider(node.right, rows_r, hist_r, depth + 1)
+        n_leaves += 1
+
+    leaves: List[Tuple[np.ndarray, float]] = []
+    for node, node_rows in grown:
+        if node.feature is None:
+            node.value = leaf_value(g[node_rows], h[node_rows], reg_lambda)
+            leaves.append((node_rows, node.value))
+    return root, leaves
+
+
+def grow_oblivious(
+    binned: BinnedFeatures,
+    features: List[int],
+    rows: np.ndarray,
+    g: np.ndarray,
+    h: np.ndarray,
+    depth: int,
+    reg_lambda: float,
+) -> Tuple[List[int], List[float], np.ndarray, np.ndarray]:
+    """
+    Grow one oblivious tree: level ``d`` splits every node on the same
+    ``(feature, threshold)``, the one whose gains summed over the level's
+    nodes are largest; growth stops early once no split gains anything.
+    Row ``x`` lands in leaf ``sum((x[f_d] > t_d) << d)``. A level's nodes
+    are handled as one stacked histogram: the smaller child of every node is
+    accumulated in a single ``bincount`` and the siblings are subtracted.
+
+    Returns:
+        ``(features, thresholds, leaf values, leaf of each of rows)``,
+        features as original indices; there are ``2 ** len(features)``
+        leaves, empty ones valued 0
+    """
+    feats = np.asarray(features, dtype=np.intp)
+    codes = binned.codes[rows][:, feats]
+    gr, hr = g[rows], h[rows]
+    split_features: List[int] = []
+    thresholds: List[float] = []
+    leaf = np.zeros(len(rows), dtype=np.intp)
+    hists = _node_histograms(codes, leaf, 1, gr, hr, binned.n_bins)
+    for d in range(depth):
+        # Parent scores are the same for every candidate: add them once per level
+        left = np.cumsum(hists, axis=-1)
+        total = left[..., -1:]
+        right = total[:2] - left[:2]
+        children = _score(left[0], left[1], reg_lambda).sum(axis=0)
+        children += _score(right[0], right[1], reg_lambda).sum(axis=0)
+        parents = float(_score(total[0, :, 0, 0], total[1, :, 0, 0], reg_lambda).sum())
+        # Only cuts that put rows of some node on both sides
+        splits = ((left[2] > 0) & (left[2] < total[2])).any(axis=0)
+        gain, r, b = _best(np.where(splits, 0.5 * (children - parents), -np.inf)[:, :-1])
+        if not gain > 0:
+            break
+        split_features.append(int(feats[r]))
+        thresholds.append(binned.threshold(int(feats[r]), b))
+        bit = codes[:, r] > b
+        m = 1 << d
+        if d + 1 < depth:
+            n_right = np.bincount(leaf, weights=bit, minlength=m)
+            small_right = n_right <= np.bincount(leaf, minlength=m) - n_right
+            small = bit == small_right[leaf]
+            hist_small = _node_histograms(codes[small], leaf[small], m, gr[small], hr[small], binned.n_bins)
+            # Bit d of the leaf index is the level-d decision: right children follow the left ones
+            nxt = np.empty((3, 2 * m) + hists.shape[2:])
+            np.subtract(hists, hist_small, out=nxt[:, :m])
+            nxt[:, m:] = hist_small
+            swap = np.flatnonzero(~small_right)
+            nxt[:, np.concatenate([swap, swap + m])] = nxt[:, np.concatenate([swap + m, swap])]
+            hists = nxt
+        leaf = leaf + bit * m
+    n_leaves = 1 << len(split_features)
+    G = np.bincount(leaf, weights=gr, minlength=n_leaves)
+    den = np.bincount(leaf, weights=hr, minlength=n_leaves) + reg_lambda
+    values = np.where(den > 0, -G / np.where(den > 0, den, 1.0), 0.0)
+    return split_features, thresholds, values, leaf
+
+
+def _node_histograms(codes: np.ndarray, node: np.ndarray, n_nodes: int, g: np.ndarray, h: np.ndarray,
+                     n_bins: int) -> np.ndarray:
+    """``histogram`` of many nodes at once, shape ``(3, n_nodes, n_features, n_bins)``; ``node`` labels each row of ``codes``."""
+    k = codes.shape[1]
+    flat = (codes + (node * k)[:, None] * n_bins + np.arange(k) * n_bins).ravel()
+    size = n_nodes * k * n_bins
+    hist = np.empty((3, size))
+    hist[0] = np.bincount(flat, weights=np.repeat(g, k), minlength=size)
+    hist[1] = np.bincount(flat, weights=np.repeat(h, k), minlength=size)
+    hist[2] = np.bincount(flat, minlength=size)
+    return hist.reshape(3, n_nodes, k, n_bins)
+
+
+def oblivious_leaf(features: List[int], thresholds: List[float], x_row: List[float]) -> int:
+    """Leaf index of ``x_row`` in an oblivious tree."""
+    leaf = 0
+    for d, (j, t) in enumerate(zip(features, thresholds)):
+        if x_row[j] > t:
+            leaf |= 1 << d
+    return leaf
+
+
+def predict_rows(root: _TreeNode, X: np.ndarray) -> np.ndarray:
+    """Leaf value of every row of ``X``, partitioning row indices node by node."""
+    out = np.zeros(len(X))
+    stack = [(root, np.arange(len(X)))]
+    while stack:
+        node, rows = stack.pop()
+        if node.feature is None or node.left is None or node.right is None:
+            out[rows] = node.value
+            continue
+        go_left = X[rows, node.feature] <= node.threshold
+        stack.append((node.left, rows[go_left]))
+        stack.append((node.right, rows[~go_left]))
+    return out
+
+
+def predict_node(root: _TreeNode, x_row: List[float]) -> float:
+    """Leaf value of one row."""
+    node = root
+    while node.feature is not None and node.left is not None and node.right is not None:
+        node = node.left if x_row[node.feature] <= node.threshold else node.right
+    return node.value
+
+
+def node_to_dict(node: Optional[_TreeNode]) -> Optional[Dict]:
+    """Nested ``{"feature", "threshold", "value", "n", "left", "right"}`` form the cache codec flattens."""
+    if node is None:
+        return None
+    return {
+        "feature": node.feature,
+        "threshold": node.threshold,
+        "value": node.value,
+        "n": node.n,
+        "left": node_to_dict(node.left),
+        "right": node_to_dict(node.right),
+    }
+
+
+def node_from_dict(obj: Optional[Dict]) -> Optional[_TreeNode]:
+    if obj is None:
+        return None
+    node = _TreeNode()
+    node.feature = obj.get("feature")
+    node.threshold = obj.get("threshold")
+    node.value = float(obj.get("value", 0.0))
+    node.n = int(obj.get("n", 0))
+    node.left = node_from_dict(obj.get("left"))
+    node.right = node_from_dict(obj.get("right"))
+    return node
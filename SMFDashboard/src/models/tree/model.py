@@ -4,6 +4,8 @@ from typing import Dict, List, Optional, Tuple, Union
 import math
 import random as _random
 
+import numpy as np
+
 from core.base import BaseModel
 
 
@@ -36,6 +38,155 @@ class _TreeNode:
         self.n: int = 0
 
 
+class _FlatTrees:
+    """
+    Fitted trees compiled into flat arrays for batch inference. Node ``i``
+    sends a row to ``left[i]`` if ``x[feature[i]] <= threshold[i]`` and to
+    ``right[i]`` otherwise; leaves have ``feature == -1`` and hold ``value``.
+    All trees share the arrays (``roots`` are their first nodes), so a batch
+    is scored by moving every (tree, row) pair down one level per step.
+    Routing matches ``_TreeRegressor.predict_row``: a missing threshold is
+    0, and features beyond a row's length read as 0.
+    """
+
+    def __init__(self, roots: List[Optional[_TreeNode]]):
+        feature: List[int] = []
+        threshold: List[float] = []
+        left: List[int] = []
+        right: List[int] = []
+        value: List[float] = []
+        self.depth = 0
+
+        def add(node: Optional[_TreeNode], depth: int) -> int:
+            # Pre-order; a leaf points at itself so extra steps leave it in place
+            i = len(feature)
+            internal = node is not None and node.feature is not None and node.left is not None and node.right is not None
+            feature.append(int(node.feature) if internal else -1)
+            threshold.append(float(node.threshold) if internal and node.threshold is not None else 0.0)
+            value.append(float(node.value) if node is not None else 0.0)
+            left.append(i)
+            right.append(i)
+            if internal:
+                self.depth = max(self.depth, depth + 1)
+                left[i] = add(node.left, depth + 1)
+                right[i] = add(node.right, depth + 1)
+            return i
+
+        self.roots = np.array([add(root, 0) for root in roots], dtype=np.intp)
+        self.feature = np.array(feature, dtype=np.intp)
+        self.threshold = np.array(threshold, dtype=float)
+        self.left = np.array(left, dtype=np.intp)
+        self.right = np.array(right, dtype=np.intp)
+        self.value = np.array(value, dtype=float)
+        self.n_features = int(self.feature.max()) + 1 if len(self.feature) else 0
+
+    def leaf_values(self, X: List[List[float]]) -> np.ndarray:
+        """Leaf value of every tree for every row, shape ``(n_trees, n_rows)``."""
+        Xa = np.asarray(X, dtype=float).reshape(len(X), -1)
+        if Xa.shape[1] < self.n_features:
+            Xa = np.hstack([Xa, np.zeros((len(Xa), self.n_features - Xa.shape[1]))])
+        node = np.repeat(self.roots[:, None], len(Xa), axis=1)
+        cols = np.arange(len(Xa))[None, :]
+        for _ in range(self.depth):
+            # Leaves read column 0 and step to themselves either way
+            go_left = Xa[cols, np.maximum(self.feature[node], 0)] <= self.threshold[node]
+            node = np.where(go_left, self.left[node], self.right[node])
+        return self.value[node]
+
+    def mean(self, X: List[List[float]]) -> List[float]:
+        """Ensemble average per row, summing trees in order as the per-row loops do."""
+        values = self.leaf_values(X)
+        s = np.zeros(values.shape[1])
+        for v in values:
+            s += v
+        return (s / len(values)).tolist()
+
+    def boost(self, X: List[List[float]], base: float, learning_rate: float) -> List[float]:
+        """Boosted prediction ``base + learning_rate * leaf`` per row, adding trees in order as ``predict_row`` does."""
+        values = self.leaf_values(X)
+        s = np.full(values.shape[1], base, dtype=float)
+        for v in values:
+            s += learning_rate * v
+        return s.tolist()
+
+
+class _PresortedRows:
+    """
+    Training rows of one fit as arrays, with every feature's row order
+    computed once. ``order[j]`` lists row indices by ``(x_j, y)``, the order
+    a per-node sort of ``(x, y)`` pairs gives (rows equal in both contribute
+    identical values, so their relative order never matters). A node owns
+    the same ``[start, stop)`` slice of every row of ``order``; splitting a
+    node stably partitions those slices in place, so each child's slices are
+    again sorted and no feature rows are copied.
+    """
+
+    def __init__(self, X: List[List[float]], y: List[float]):
+        self.X = np.asarray(X, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.y_raw = list(y)
+        self.order = np.empty((self.X.shape[1], len(self.y)), dtype=np.intp)
+        for j in range(self.X.shape[1]):
+            self.order[j] = np.lexsort((self.y, self.X[:, j]))
+        self._goes_left = np.zeros(len(self.y), dtype=bool)
+
+    def best_split(self, start: int, stop: int, features: List[int], min_samples_split: int,
+                   y_node: List[float]) -> Optional[Tuple[int, float, int]]:
+        """
+        Least-SSE split of the node's rows over ``features``, as
+        ``(feature, threshold, n_left)``. Prefix sums are summed in sorted
+        order and candidates are scanned in the given feature order, left
+        sizes ascending, taking only improvements by more than 1e-12, so trees
+        are identical to those of a per-node sort-and-scan.
+        """
+        n = stop - start
+        if n < 2 * min_samples_split or not features:
+            return None
+        ks = np.arange(min_samples_split, n - min_samples_split + 1)
+        nL = ks.astype(float)
+        nR = n - nL
+        feats = np.asarray(features, dtype=np.intp)
+        idx = self.order[feats, start:stop]
+        xs = self.X[idx, feats[:, None]]
+        ys = self.y[idx]
+        # Row-wise cumsum is a sequential (not pairwise) sum
+        ps = np.cumsum(ys, axis=1)
+        pss = np.cumsum(ys * ys, axis=1)
+        sumL = ps[:, ks - 1]
+        ssL = pss[:, ks - 1]
+        sumR = ps[:, -1:] - sumL
+        ssR = pss[:, -1:] - ssL
+        score = (ssL - (sumL * sumL) / nL) + (ssR - (sumR * sumR) / nR)
+        # Only splits between distinct x values
+        valid = xs[:, ks - 1] != xs[:, ks]
+
+        best_feat, best_thr, best_k = -1, 0.0, 0
+        best_score = float("inf")
+        candidates = valid & (score + 1e-12 < best_score)
+        for r in np.flatnonzero(candidates.any(axis=1)).tolist():
+            for t in np.flatnonzero(candidates[r] & (score[r] + 1e-12 < best_score)).tolist():
+                s = float(score[r, t])
+                if s + 1e-12 < best_score:
+                    k = int(ks[t])
+                    best_score = s
+                    best_feat = int(feats[r])
+                    best_thr = 0.5 * (float(xs[r, k - 1]) + float(xs[r, k]))
+                    best_k = k
+        # Require improvement
+        if best_feat == -1 or best_score >= _sse(y_node) - 1e-12:
+            return None
+        return best_feat, best_thr, best_k
+
+    def partition(self, start: int, stop: int, feature: int, n_left: int) -> None:
+        """Stably move the first ``n_left`` rows by ``feature`` to the front of every feature's slice."""
+        split = self.order[feature, start:stop]
+        self._goes_left[split[:n_left]] = True
+        self._goes_left[split[n_left:]] = False
+        seg = self.order[:, start:stop]
+        perm = np.argsort(~self._goes_left[seg], axis=1, kind="stable")
+        self.order[:, start:stop] = np.take_along_axis(seg, perm, axis=1)
+
+
 class _TreeRegressor(BaseModel):
     def __init__(self, max_depth: int = 4, min_samples_split: int = 8, max_features: Optional[Union[int, str]] = "sqrt", random_state: int = 42):
         self.max_depth = int(max_depth)
@@ -44,15 +195,18 @@ class _TreeRegressor(BaseModel):
         self.random_state = int(random_state)
         self.root: Optional[_TreeNode] = None
         self._rng = _random.Random(self.random_state)
+        self._flat: Optional[_FlatTrees] = None
 
     # --- Public API ---
     def fit(self, X: List[List[float]], y: List[float]) -> None:
+        self._flat = None
         if not X or not y or len(X) != len(y):
             self.root = None
             return
-        # Build tree recursively
+        # Build tree recursively over presorted index arrays
         n_features = len(X[0]) if X else 0
-        self.root = self._build_node(X, y, depth=0, feature_indices=list(range(n_features)))
+        rows = _PresortedRows(X, y)
+        self.root = self._build_node(rows, np.arange(len(y)), 0, len(y), depth=0, feature_indices=list(range(n_features)))
 
     def predict_row(self, x_row: List[float]) -> float:
         if self.root is None:
@@ -65,6 +219,13 @@ class _TreeRegressor(BaseModel):
             node = node.left if xj <= thr else node.right
         return node.value if node else 0.0
 
+    def predict_batch(self, X: List[List[float]]) -> List[float]:
+        if len(X) == 0:
+            return []
+        if self._flat is None:
+            self._flat = _FlatTrees([self.root])
+        return self._flat.leaf_values(X)[0].tolist()
+
     def get_params(self) -> Dict:
         return {
             "max_depth": self.max_depth,
@@ -81,10 +242,18 @@ class _TreeRegressor(BaseModel):
         self.random_state = int(params.get("random_state", self.random_state))
         self._rng = _random.Random(self.random_state)
         self.root = self._deserialize_node(params.get("tree"))
+        self._flat = None
 
     # --- Tree building helpers ---
-    def _build_node(self, X: List[List[float]], y: List[float], depth: int, feature_indices: List[int]) -> _TreeNode:
+    def _build_node(self, rows: _PresortedRows, node_rows: np.ndarray, start: int, stop: int,
+                    depth: int, feature_indices: List[int]) -> _TreeNode:
+        """
+        Grow the node holding ``rows.order[:, start:stop]``; ``node_rows`` lists
+        its rows in the order the parent's split feature sorted them, which
+        fixes the summation order of the node's mean.
+        """
         node = _TreeNode()
+        y = [rows.y_raw[i] for i in node_rows.tolist()]
         node.n = len(y)
         node.value = _mean(y)
         if depth >= self.max_depth or len(y) < self.min_samples_split:
@@ -97,23 +266,22 @@ class _TreeRegressor(BaseModel):
         self._rng.shuffle(features)
         features = features[:k]
 
-        best = self._best_split(X, y, features)
+        best = rows.best_split(start, stop, features, self.min_samples_split, y)
         if best is None:
             return node
-        feat, thr, left_idx, right_idx = best
-        if len(left_idx) == 0 or len(right_idx) == 0:
+        feat, thr, n_left = best
+        if n_left == 0 or n_left == len(y):
             return node
 
         node.feature = feat
         node.threshold = thr
 
-        X_left = [X[i] for i in left_idx]
-        y_left = [y[i] for i in left_idx]
-        X_right = [X[i] for i in right_idx]
-        y_right = [y[i] for i in right_idx]
-
-        node.left = self._build_node(X_left, y_left, depth + 1, feature_indices)
-        node.right = self._build_node(X_right, y_right, depth + 1, feature_indices)
+        # Children split further only below max_depth; leaves need no partitioned slices
+        if depth + 1 < self.max_depth:
+            rows.partition(start, stop, feat, n_left)
+        mid = start + n_left
+        node.left = self._build_node(rows, rows.order[feat, start:mid], start, mid, depth + 1, feature_indices)
+        node.right = self._build_node(rows, rows.order[feat, mid:stop], mid, stop, depth + 1, feature_indices)
         return node
 
     def _resolve_max_features(self, m: int) -> int:
@@ -129,59 +297,6 @@ class _TreeRegressor(BaseModel):
             return max(1, int(math.log2(m)))
         return m
 
-    def _best_split(self, X: List[List[float]], y: List[float], features: List[int]) -> Optional[Tuple[int, float, List[int], List[int]]]:
-        n = len(y)
-        if n < 2 * self.min_samples_split:
-            return None
-        best_feat = -1
-        best_thr = 0.0
-        best_score = float("inf")
-        best_left_idx: List[int] = []
-        best_right_idx: List[int] = []
-
-        # Precompute total SSE to ensure the split improves
-        total_sse = _sse(y)
-
-        for j in features:
-            pairs = sorted(((float(row[j]), float(y[i])), i) for i, row in enumerate(X))
-            x_sorted = [p[0][0] for p in pairs]
-            y_sorted = [p[0][1] for p in pairs]
-            idx_sorted = [p[1] for p in pairs]
-            # Skip if all x are equal
-            if x_sorted[0] == x_sorted[-1]:
-                continue
-            # Prefix sums
-            ps = [0.0]
-            pss = [0.0]
-            for v in y_sorted:
-                ps.append(ps[-1] + v)
-                pss.append(pss[-1] + v * v)
-            # Try splits between distinct x values
-            for k in range(self.min_samples_split, n - self.min_samples_split + 1):
-                if x_sorted[k - 1] == x_sorted[k]:
-                    continue
-                nL = k
-                nR = n - k
-                sumL = ps[k]
-                ssL = pss[k]
-                sumR = ps[n] - ps[k]
-                ssR = pss[n] - pss[k]
-                sseL = ssL - (sumL * sumL) / nL
-                sseR = ssR - (sumR * sumR) / nR
-                score = sseL + sseR
-                if score + 1e-12 < best_score:
-                    best_score = score
-                    best_feat = j
-                    best_thr = 0.5 * (x_sorted[k - 1] + x_sorted[k])
-                    left_idx = idx_sorted[:k]
-                    right_idx = idx_sorted[k:]
-                    best_left_idx = left_idx
-                    best_right_idx = right_idx
-        # Require improvement
-        if best_feat == -1 or best_score >= total_sse - 1e-12:
-            return None
-        return best_feat, best_thr, best_left_idx, best_right_idx
-
     # --- Serialization helpers ---
     def _serialize_node(self, node: Optional[_TreeNode]) -> Optional[Dict]:
         if node is None:
@@ -6,7 +6,7 @@ a state space framework with Kalman filtering.
 """
 
 import numpy as np
-from typing import Dict, List
+from typing import Dict, List, Optional
 from sklearn.linear_model import LinearRegression
 import sys
 from pathlib import Path
@@ -86,6 +86,31 @@ class TVPModel(BaseModel):
             )
         
         self.fitted = True
+
+    def update(
+        self,
+        X_new: List[List[float]],
+        y_new: List[float],
+        X_drop: Optional[List[List[float]]] = None,
+        y_drop: Optional[List[float]] = None,
+    ) -> bool:
+        """Continue the Kalman filter from the current state over the new rows."""
+        if not self.fitted or self.state_mean is None or X_drop:
+            # A filtered state cannot forget old observations
+            return False
+        if len(X_new) != len(y_new):
+            return False
+        if not X_new:
+            return True
+        X_array = np.array(X_new)
+        y_array = np.array(y_new)
+        if X_array.ndim != 2 or X_array.shape[1] != len(self.state_mean):
+            return False
+        for i in range(len(y_array)):
+            self.state_mean, self.state_cov = self._kalman_update(
+                y_array[i], X_array[i], self.state_mean, self.state_cov
+            )
+        return True
         
     def predict_row(self, x_row: List[float]) -> float:
         """Predict next value using TVP model."""
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 from typing import Dict, List, Optional
-import math
-import random
+import random as _random
+
+import numpy as np
 
 from core.base import BaseModel
+from ..tree.model import _FlatTrees, _TreeNode
+from ..tree.hist import BinnedFeatures, grow_depthwise, node_from_dict, node_to_dict, predict_node, predict_rows
 
 NAME = "XGBoost"
 
@@ -22,11 +25,14 @@ SPEC = {
         "reg_alpha": {"type": "float", "default": 0.0, "min": 0.0},
         "reg_lambda": {"type": "float", "default": 1.0, "min": 0.0},
         "random_state": {"type": "int", "default": 42},
+        # "hist": quantile-binned histogram splits; "exact": exhaustive search over unique values
+        "tree_method": {"type": "str", "default": "hist"},
+        "max_bins": {"type": "int", "default": 256, "min": 2},
     },
 }
 
 class _XGBoostTree:
-    """Single tree in XGBoost ensemble with regularization"""
+    """Single tree in XGBoost ensemble with regularization (``tree_method="exact"``)"""
     def __init__(self, max_depth: int = 6, reg_alpha: float = 0.0, reg_lambda: float = 1.0):
         self.max_depth = max_depth
         self.reg_alpha = reg_alpha
@@ -38,11 +44,14 @@ class _XGBoostTree:
         self.value: float = 0.0
         self.depth: int = 0
 
-    def fit(self, X: List[List[float]], gradients: List[float], hessians: List[float], 
-            depth: int = 0, indices: Optional[List[int]] = None) -> None:
-        """Fit tree using gradients and hessians (Newton's method)"""
+    def fit(self, X: List[List[float]], gradients: List[float], hessians: List[float],
+            depth: int = 0, indices: Optional[List[int]] = None,
+            features: Optional[List[int]] = None) -> None:
+        """Fit tree using gradients and hessians (Newton's method) over ``features`` (default all)"""
         if indices is None:
             indices = list(range(len(X)))
+        if features is None:
+            features = list(range(len(X[0]) if X and X[0] else 0))
         
         self.depth = depth
         
@@ -59,10 +68,8 @@ class _XGBoostTree:
         best_left_indices = []
         best_right_indices = []
         
-        n_features = len(X[0]) if X and X[0] else 0
-        
         # Try each feature
-        for feature_idx in range(n_features):
+        for feature_idx in features:
             # Get unique values for this feature
             values = sorted(set(X[i][feature_idx] for i in indices))
             
@@ -100,8 +107,8 @@ class _XGBoostTree:
         self.left = _XGBoostTree(self.max_depth, self.reg_alpha, self.reg_lambda)
         self.right = _XGBoostTree(self.max_depth, self.reg_alpha, self.reg_lambda)
         
-        self.left.fit(X, gradients, hessians, depth + 1, best_left_indices)
-        self.right.fit(X, gradients, hessians, depth + 1, best_right_indices)
+        self.left.fit(X, gradients, hessians, depth + 1, best_left_indices, features)
+        self.right.fit(X, gradients, hessians, depth + 1, best_right_indices, features)
     
     def _calculate_gain(self, gradients: List[float], hessians: List[float], 
                        parent_indices: List[int], left_indices: List[int], 
@@ -128,100 +135,156 @@ class _XGBoostTree:
         else:
             return self.right.predict(x_row) if self.right else 0.0
 
+    def to_node(self) -> _TreeNode:
+        node = _TreeNode()
+        node.feature = self.feature
+        node.threshold = self.threshold
+        node.value = self.value
+        if self.feature is not None:
+            node.left = self.left.to_node() if self.left else None
+            node.right = self.right.to_node() if self.right else None
+        return node
+
+
 class _XGBoost(BaseModel):
     """XGBoost implementation with gradient boosting and regularization"""
-    
+
     def __init__(self, n_estimators: int = 100, max_depth: int = 6, learning_rate: float = 0.3,
-                 subsample: float = 1.0, colsample_bytree: float = 1.0, 
-                 reg_alpha: float = 0.0, reg_lambda: float = 1.0, random_state: int = 42):
-        self.n_estimators = n_estimators
-        self.max_depth = max_depth
-        self.learning_rate = learning_rate
-        self.subsample = subsample
-        self.colsample_bytree = colsample_bytree
-        self.reg_alpha = reg_alpha
-        self.reg_lambda = reg_lambda
-        self.random_state = random_state
-        
-        self.trees: List[_XGBoostTree] = []
+                 subsample: float = 1.0, colsample_bytree: float = 1.0,
+                 reg_alpha: float = 0.0, reg_lambda: float = 1.0, random_state: int = 42,
+                 tree_method: str = "hist", max_bins: int = 256):
+        self.n_estimators = int(n_estimators)
+        self.max_depth = int(max_depth)
+        self.learning_rate = float(learning_rate)
+        self.subsample = float(subsample)
+        self.colsample_bytree = float(colsample_bytree)
+        self.reg_alpha = float(reg_alpha)
+        self.reg_lambda = float(reg_lambda)
+        self.random_state = int(random_state)
+        self.tree_method = str(tree_method)
+        self.max_bins = int(max_bins)
+
+        self.trees: List[_TreeNode] = []
+        self._flat: Optional[_FlatTrees] = None
         self.base_score: float = 0.0
-        
-        # Set random seed
-        random.seed(random_state)
-    
+
     def fit(self, X: List[List[float]], y: List[float]) -> None:
+        self.trees = []
+        self._flat = None
         if not X or not y or len(X) != len(y):
+            self.base_score = 0.0
             return
-        
+
         n = len(X)
+        n_features = len(X[0]) if X[0] else 0
         self.base_score = sum(y) / n  # Initial prediction
-        
-        # Initialize predictions with base score
-        predictions = [self.base_score] * n
-        
-        self.trees = []
-        
-        for round_num in range(self.n_estimators):
-            # Calculate gradients and hessians (for squared loss)
-            gradients = [2 * (predictions[i] - y[i]) for i in range(n)]
-            hessians = [2.0] * n  # Constant for squared loss
-            
-            # Subsample data
+        rng = _random.Random(self.random_state)
+        exact = self.tree_method == "exact"
+
+        Xa = np.asarray(X, dtype=float)
+        ya = np.asarray(y, dtype=float)
+        # Bin once per fit; every tree reuses the codes
+        binned = None if exact or n_features == 0 else BinnedFeatures(Xa, self.max_bins)
+        predictions = np.full(n, self.base_score)
+        hessians = np.full(n, 2.0)  # Constant for squared loss
+
+        for _ in range(self.n_estimators):
+            # Gradients of squared loss
+            gradients = 2.0 * (predictions - ya)
+
+            # Subsample rows
             if self.subsample < 1.0:
-                sample_size = int(n * self.subsample)
-                sample_indices = random.sample(range(n), sample_size)
-                X_sample = [X[i] for i in sample_indices]
-                grad_sample = [gradients[i] for i in sample_indices]
-                hess_sample = [hessians[i] for i in sample_indices]
+                sample = rng.sample(range(n), int(n * self.subsample))
             else:
-                X_sample = X
-                grad_sample = gradients
-                hess_sample = hessians
-            
-            # Feature subsampling
-            n_features = len(X[0]) if X and X[0] else 0
-            if self.colsample_bytree < 1.0:
-                n_features_sample = max(1, int(n_features * self.colsample_bytree))
-                feature_indices = random.sample(range(n_features), n_features_sample)
-                X_sample = [[row[i] for i in feature_indices] for row in X_sample]
-            
-            # Fit tree
-            tree = _XGBoostTree(self.max_depth, self.reg_alpha, self.reg_lambda)
-            tree.fit(X_sample, grad_sample, hess_sample)
-            self.trees.append(tree)
-            
-            # Update predictions
-            for i in range(n):
-                if self.colsample_bytree < 1.0:
-                    x_sample = [X[i][j] for j in feature_indices]
+                sample = list(range(n))
+
+            # Feature subsampling; trees keep the original feature indices
+            if self.colsample_bytree < 1.0 and n_features:
+                features = rng.sample(range(n_features), max(1, int(n_features * self.colsample_bytree)))
+            else:
+                features = list(range(n_features))
+
+            if exact:
+                tree = _XGBoostTree(self.max_depth, self.reg_alpha, self.reg_lambda)
+                tree.fit(X, gradients.tolist(), hessians.tolist(), indices=sample, features=features)
+                root = tree.to_node()
+                predictions += self.learning_rate * predict_rows(root, Xa)
+            elif binned is None:
+                root = _TreeNode()
+                root.value = -float(gradients[sample].sum()) / (2.0 * len(sample) + self.reg_lambda)
+                predictions += self.learning_rate * root.value
+            else:
+                rows = np.asarray(sample, dtype=np.intp)
+                root, leaves = grow_depthwise(binned, features, rows, gradients, hessians,
+                                              self.max_depth, self.reg_lambda, self.reg_alpha)
+                if len(rows) == n:
+                    # Leaves partition the training rows: no tree walk needed
+                    for leaf_rows, value in leaves:
+                        predictions[leaf_rows] += self.learning_rate * value
                 else:
-                    x_sample = X[i]
-                
-                tree_pred = tree.predict(x_sample)
-                predictions[i] += self.learning_rate * tree_pred
-    
+                    predictions += self.learning_rate * predict_rows(root, Xa)
+            self.trees.append(root)
+
     def predict_row(self, x_row: List[float]) -> float:
         prediction = self.base_score
-        
         for tree in self.trees:
-            tree_pred = tree.predict(x_row)
-            prediction += self.learning_rate * tree_pred
-        
+            prediction += self.learning_rate * predict_node(tree, x_row)
         return prediction
-    
+
+    def predict_batch(self, X: List[List[float]]) -> List[float]:
+        if not self.trees or len(X) == 0:
+            return [self.base_score] * len(X)
+        if self._flat is None:
+            self._flat = _FlatTrees(self.trees)
+        return self._flat.boost(X, self.base_score, self.learning_rate)
+
     def get_params(self) -> Dict:
         return {
             "n_estimators": self.n_estimators,
             "max_depth": self.max_depth,
             "learning_rate": self.learning_rate,
+            "subsample": self.subsample,
+            "colsample_bytree": self.colsample_bytree,
+            "reg_alpha": self.reg_alpha,
+            "reg_lambda": self.reg_lambda,
+            "random_state": self.random_state,
+            "tree_method": self.tree_method,
+            "max_bins": self.max_bins,
             "base_score": self.base_score,
+            "trees": [node_to_dict(t) for t in self.trees],
         }
-    
+
     def set_params(self, params: Dict) -> None:
-        self.n_estimators = params.get("n_estimators", self.n_estimators)
-        self.max_depth = params.get("max_depth", self.max_depth)
-        self.learning_rate = params.get("learning_rate", self.learning_rate)
-        self.base_score = params.get("base_score", self.base_score)
+        self.n_estimators = int(params.get("n_estimators", self.n_estimators))
+        self.max_depth = int(params.get("max_depth", self.max_depth))
+        self.learning_rate = float(params.get("learning_rate", self.learning_rate))
+        self.subsample = float(params.get("subsample", self.subsample))
+        self.colsample_bytree = float(params.get("colsample_bytree", self.colsample_bytree))
+        self.reg_alpha = float(params.get("reg_alpha", self.reg_alpha))
+        self.reg_lambda = float(params.get("reg_lambda", self.reg_lambda))
+        self.random_state = int(params.get("random_state", self.random_state))
+        self.tree_method = str(params.get("tree_method", self.tree_method))
+        self.max_bins = int(params.get("max_bins", self.max_bins))
+        self.base_score = float(params.get("base_score", self.base_score))
+        self.trees = [node_from_dict(t) for t in params.get("trees", [])]
+        self._flat = None
+
 
 def create(params: Dict) -> BaseModel:
-    return _XGBoost(**params)
+    p = SPEC.get("params_schema", {})
+
+    def get(name: str):
+        return params.get(name, p.get(name, {}).get("default"))
+
+    return _XGBoost(
+        n_estimators=int(get("n_estimators")),
+        max_depth=int(get("max_depth")),
+        learning_rate=float(get("learning_rate")),
+        subsample=float(get("subsample")),
+        colsample_bytree=float(get("colsample_bytree")),
+        reg_alpha=float(get("reg_alpha")),
+        reg_lambda=float(get("reg_lambda")),
+        random_state=int(get("random_state")),
+        tree_method=str(get("tree_method")),
+        max_bins=int(get("max_bins")),
+    )
@@ -0,0 +1,55 @@
+"""
+Seeding in ``backtest_direct``: fits are reseeded from (seed, horizon, origin)
+so forecasts do not depend on the pool, and the caller's global generators
+are left as they were.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from core.backtest import backtest_direct
+from core.data import TimeSeriesFrame
+from models.lstm.model import create as create_lstm
+
+LSTM_PARAMS = {"hidden_size": 8, "epochs": 10}
+
+
+def _frame(n: int = 48) -> TimeSeriesFrame:
+    dates = [datetime(2000 + i // 12, i % 12 + 1, 1) for i in range(n)]
+    return TimeSeriesFrame(dates, {"y": [math.sin(i / 3.0) + 0.1 * i for i in range(n)]})
+
+
+def _forecasts(strategy: str, n_jobs: int, executor: str = "process"):
+    _, rows = backtest_direct(
+        create_lstm, LSTM_PARAMS, _frame(), "y", "M", {"target_lags": [1, 2]}, [1, 2],
+        (None, datetime(2002, 12, 1)), (datetime(2003, 1, 1), None),
+        strategy=strategy, n_jobs=n_jobs, executor=executor,
+    )
+    return [r["forecast"] for r in rows]
+
+
+@pytest.mark.parametrize("strategy", ["frozen", "refit_every:4"])
+@pytest.mark.parametrize("n_jobs, executor", [(1, "process"), (2, "thread"), (2, "process")])
+def test_caller_rng_state_is_kept(strategy, n_jobs, executor):
+    random.seed(123)
+    np.random.seed(7)
+    _forecasts(strategy, n_jobs, executor)
+    after = random.random(), float(np.random.rand())
+    random.seed(123)
+    np.random.seed(7)
+    assert after == (random.random(), float(np.random.rand()))
+
+
+@pytest.mark.parametrize("strategy", ["frozen", "refit_every:4"])
+def test_forecasts_do_not_depend_on_pool_or_caller_seed(strategy):
+    random.seed(1)
+    serial = _forecasts(strategy, 1)
+    random.seed(2)
+    assert _forecasts(strategy, 2, "process") == serial
+    assert _forecasts(strategy, 1) == serial
@@ -0,0 +1,47 @@
+"""
+Boosting plugins on degenerate training windows: a window in which every
+feature is constant has no split to choose, so each tree is a single leaf
+and the model predicts the training mean.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from models.catboost.model import create as create_catboost
+from models.lightgbm.model import create as create_lightgbm
+from models.xgboost.model import create as create_xgboost
+
+CONSTANT_X = [[1.0, 2.0]] * 10
+Y = [float(i) for i in range(10)]
+
+
+@pytest.mark.parametrize("params", [{}, {"tree_method": "exact"}, {"max_bins": 2}])
+def test_xgboost_constant_features(params):
+    model = create_xgboost(params)
+    model.fit(CONSTANT_X, Y)
+    assert model.predict_row([1.0, 2.0]) == pytest.approx(4.5)
+    assert model.predict_batch([[1.0, 2.0], [5.0, -1.0]]) == pytest.approx([4.5, 4.5])
+
+
+@pytest.mark.parametrize(
+    "create, params",
+    [
+        (create_catboost, {}),
+        (create_catboost, {"depth": 1}),
+        (create_lightgbm, {}),
+        (create_lightgbm, {"min_child_samples": 1}),
+    ],
+)
+def test_catboost_lightgbm_constant_features(create, params):
+    model = create(params)
+    model.fit(CONSTANT_X, Y)
+    assert model.predict_row([1.0, 2.0]) == pytest.approx(4.5)
+    assert model.predict_batch([[1.0, 2.0], [5.0, -1.0]]) == pytest.approx([4.5, 4.5])
+
+
+def test_xgboost_one_constant_feature():
+    X = [[1.0, float(i % 3)] for i in range(10)]
+    model = create_xgboost({})
+    model.fit(X, Y)
+    assert model.predict_batch(X) == [model.predict_row(x) for x in X]
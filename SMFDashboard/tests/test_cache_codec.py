@@ -0,0 +1,220 @@
+"""
+Round trips of the model-library codec: every encoded object must decode to
+exactly what ``json.loads(json.dumps(obj))`` gives, and entries written in
+the legacy JSON layout must still load.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import random
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from core import cache_codec
+from core.cache import CacheManager
+
+
+def _json_round_trip(obj: Any) -> Any:
+    return json.loads(json.dumps(obj))
+
+
+def _same(a: Any, b: Any) -> bool:
+    """Structural equality with NaN == NaN, and float/int and -0.0/0.0 kept distinct."""
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, float):
+        return (math.isnan(a) and math.isnan(b)) or (a == b and math.copysign(1.0, a) == math.copysign(1.0, b))
+    if isinstance(a, dict):
+        return list(a) == list(b) and all(_same(a[k], b[k]) for k in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def _rows_round_trip(rows: List[Dict], tmp_path) -> Optional[List[Dict]]:
+    encoded = cache_codec.encode_rows(rows)
+    if encoded is None:
+        return None
+    path = os.path.join(str(tmp_path), cache_codec.ROWS_FILE)
+    cache_codec.write_blob(path, *encoded)
+    return cache_codec.read_rows(path)
+
+
+def _params_round_trip(params: Any, tmp_path) -> Any:
+    path = os.path.join(str(tmp_path), "model_h1" + cache_codec.MODEL_SUFFIX)
+    cache_codec.write_model(path, params)
+    return cache_codec.read_model(path)
+
+
+# --- Backtest rows ---
+def _backtest_rows(rng: random.Random, n: int) -> List[Dict]:
+    rows = []
+    for i in range(n):
+        forecast = rng.choice([None, float("nan"), float("inf"), -0.0, rng.gauss(0, 1)])
+        rows.append({
+            "origin_date": f"2020-{i % 12 + 1:02d}-01",
+            "target_date": f"2021-{i % 12 + 1:02d}-01",
+            "horizon": rng.randint(1, 12),
+            "y_t": rng.gauss(0, 1),
+            "forecast": forecast,
+            "actual": rng.choice([None, rng.gauss(0, 1)]),
+            "error": None if forecast is None else rng.gauss(0, 1),
+        })
+    return rows
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_rows_round_trip(seed, tmp_path):
+    rows = _backtest_rows(random.Random(seed), random.Random(seed).randint(1, 50))
+    assert _same(_rows_round_trip(rows, tmp_path), _json_round_trip(rows))
+
+
+@pytest.mark.parametrize(
+    "column",
+    [
+        [1, 2, 3],
+        [1, 2.5, None],                   # mixed int/float stays JSON
+        [None, None, None],               # all None: no float to type the column
+        [float("nan"), None, 1.0],
+        [True, False, True],              # bools are not ints here
+        [2 ** 70, 1, -(2 ** 70)],         # outside int64
+        ["a", "", "c\0"],                 # NUL-terminated strings would not survive a char array
+        ["x", 1, None],
+        [[1, 2], {"k": (1, 2)}, (3,)],    # tuples come back as lists, like JSON
+    ],
+)
+def test_rows_round_trip_column_kinds(column, tmp_path):
+    rows = [{"horizon": 1, "v": v} for v in column]
+    assert _same(_rows_round_trip(rows, tmp_path), _json_round_trip(rows))
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        [],
+        [{"a": 1, "b": 2.0}, {"a": 1}],            # ragged
+        [{"a": 1, "b": 2.0}, {"b": 2.0, "a": 1}],  # same keys, other order
+        [{"a": 1}, {"a": 2, "b": 3}],
+    ],
+)
+def test_irregular_rows_are_left_to_json(rows):
+    assert cache_codec.encode_rows(rows) is None
+
+
+def test_lazy_rows_decode_once(tmp_path):
+    rows = _backtest_rows(random.Random(0), 5)
+    path = os.path.join(str(tmp_path), cache_codec.ROWS_FILE)
+    assert cache_codec.write_rows(path, rows)
+    calls = []
+    lazy = cache_codec.LazyRows(path, lambda p: calls.append(p) or cache_codec.read_rows(p))
+    assert not calls
+    assert _same(list(lazy), _json_round_trip(rows)) and len(lazy) == 5 and _same(lazy[0], _json_round_trip(rows[0]))
+    assert len(calls) == 1
+
+
+# --- Model parameters ---
+def _tree(rng: random.Random, depth: int) -> Dict:
+    if depth == 0 or rng.random() < 0.3:
+        return {"feature": None, "threshold": None, "value": rng.gauss(0, 1), "n": rng.randint(1, 50),
+                "left": None, "right": None}
+    return {
+        "feature": rng.randint(0, 40),
+        "threshold": rng.choice([rng.gauss(0, 1), -0.0, float("inf")]),
+        "value": rng.choice([rng.gauss(0, 1), float("nan")]),
+        "n": rng.randint(2, 500),
+        "left": _tree(rng, depth - 1),
+        "right": _tree(rng, depth - 1),
+    }
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_tree_params_round_trip(seed, tmp_path):
+    rng = random.Random(seed)
+    params = {
+        "trees": [_tree(rng, rng.randint(0, 6)) for _ in range(rng.randint(1, 8))],
+        "root": _tree(rng, 3),
+        "nested": {"forest": [[_tree(rng, 2)], {"inner": _tree(rng, 2)}]},
+        "base_score": rng.gauss(0, 1),
+        "learning_rate": 0.1,
+        "n_features": 12,
+        "feature_names": ["a", "b"],
+        "missing": None,
+        "bad": float("nan"),
+    }
+    skeleton, arrays = cache_codec.flatten_params(params)
+    assert arrays, "the trees should have been flattened"
+    assert _same(_params_round_trip(params, tmp_path), _json_round_trip(params))
+
+
+@pytest.mark.parametrize(
+    "node",
+    [
+        # Tree-shaped dicts whose values do not survive the typed arrays stay in the JSON skeleton
+        {"feature": 1, "threshold": 2, "value": 0.5, "n": 3, "left": None, "right": None},
+        {"feature": True, "threshold": 0.5, "value": 0.5, "n": 3, "left": None, "right": None},
+        {"feature": -1, "threshold": 0.5, "value": 0.5, "n": 3, "left": None, "right": None},
+        {"feature": None, "threshold": 0.5, "value": 0.5, "n": 3, "left": None, "right": None},
+        {"feature": None, "threshold": None, "value": 1, "n": 3, "left": None, "right": None},
+        {"feature": None, "threshold": None, "value": 0.5, "n": 2 ** 63, "left": None, "right": None},
+        {"feature": 2 ** 63, "threshold": 0.5, "value": 0.5, "n": 3, "left": None, "right": None},
+        {"feature": None, "threshold": None, "value": 0.5, "n": 3, "left": None, "right": None, "extra": 1},
+        {"feature": 0, "threshold": 0.5, "value": 0.5, "n": 3, "left": {"feature": None}, "right": None},
+    ],
+)
+def test_non_tree_dicts_round_trip(node, tmp_path):
+    leaf = {"feature": None, "threshold": None, "value": 0.25, "n": 1, "left": None, "right": None}
+    params = {"odd": node, "trees": [leaf], "listed": [node, leaf]}
+    assert _same(_params_round_trip(params, tmp_path), _json_round_trip(params))
+
+
+def test_params_without_trees(tmp_path):
+    params = {"coef": [0.1, -0.0, float("nan")], "intercept": 1.5, "meta": {"1": [1, 2], "flag": True}, "empty": {}}
+    assert cache_codec.flatten_params(params)[1] == {}
+    assert _same(_params_round_trip(params, tmp_path), _json_round_trip(params))
+
+
+def test_params_with_placeholder_key(tmp_path):
+    # A user dict that looks like the skeleton's tree reference must not be resolved as one
+    leaf = {"feature": None, "threshold": None, "value": 0.25, "n": 1, "left": None, "right": None}
+    params = {"ref": {"__flat_tree__": 0}, "trees": [leaf]}
+    assert _same(_params_round_trip(params, tmp_path), _json_round_trip(params))
+
+
+# --- Legacy JSON entries ---
+def test_legacy_json_entry_loads(tmp_path):
+    mgr = CacheManager(base_dir=str(tmp_path))
+    rng = random.Random(7)
+    models = {1: {"trees": [_tree(rng, 3)], "base_score": 0.5}, 3: {"coef": [1.0, 2.0]}}
+    rows = _backtest_rows(rng, 6)
+    metrics = {1: {"rmse": 1.0, "mae": 0.5}, 3: {"rmse": 2.0, "mae": 1.5}}
+    mgr.save_to_cache("legacy", models, metrics, rows, {"model_name": "x"})
+
+    # Rewrite the entry in the layout saved before the binary codec
+    model_dir = os.path.join(mgr.models_dir, "legacy")
+    result_dir = os.path.join(mgr.results_dir, "legacy")
+    for h, data in models.items():
+        os.unlink(os.path.join(model_dir, f"model_h{h}{cache_codec.MODEL_SUFFIX}"))
+        with open(os.path.join(model_dir, f"model_h{h}.json"), "w") as f:
+            json.dump(data, f)
+    os.unlink(os.path.join(result_dir, cache_codec.ROWS_FILE))
+    with open(os.path.join(result_dir, "backtest.json"), "w") as f:
+        json.dump(rows, f)
+
+    loaded = mgr.load_cached_models("legacy")
+    assert sorted(loaded) == [1, 3]
+    assert all(_same(loaded[h], _json_round_trip(models[h])) for h in models)
+    results = mgr.load_cached_results("legacy")
+    assert _same(list(results["backtest"]), _json_round_trip(rows))
+    assert results["metrics"] == metrics
+
+
+def test_binary_model_preferred_over_stale_json(tmp_path):
+    mgr = CacheManager(base_dir=str(tmp_path))
+    mgr.save_to_cache("k", {1: {"coef": [1.0]}}, {1: {"rmse": 1.0, "mae": 1.0}}, _backtest_rows(random.Random(1), 2), {})
+    with open(os.path.join(mgr.models_dir, "k", "model_h1.json"), "w") as f:
+        json.dump({"coef": [9.0]}, f)
+    assert mgr.load_cached_models("k")[1] == {"coef": [1.0]}
@@ -0,0 +1,156 @@
+"""
+Parity of the vectorized feature ops with the list-based engine they
+replaced (kept in ``legacy_features``). Outputs must match bit for bit,
+including where values are unavailable (None) or non-finite.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import struct
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+import numpy as np
+import pytest
+
+import legacy_features as legacy
+from core import features
+from core.data import TimeSeriesFrame
+
+# The reference engine does its arithmetic on numpy scalars taken from the frame
+pytestmark = pytest.mark.filterwarnings("ignore::RuntimeWarning")
+
+SEEDS = range(40)
+SPECIALS = (None, float("nan"), float("inf"), float("-inf"), 0.0, -0.0, 1e-13)
+
+
+def _values(rng: random.Random, n: int, allow_none: bool = True) -> List[Optional[float]]:
+    out: List[Optional[float]] = []
+    for _ in range(n):
+        r = rng.random()
+        if r < 0.15:
+            v = rng.choice(SPECIALS)
+            out.append(float("nan") if v is None and not allow_none else v)
+        elif r < 0.25:
+            out.append(float(rng.randint(-3, 3)))
+        else:
+            out.append(rng.gauss(0.0, 10.0) * 10 ** rng.randint(-3, 3))
+    return out
+
+
+def _series(vals: List[Optional[float]]) -> features.Series:
+    present = np.array([v is not None for v in vals], dtype=bool)
+    values = np.array([0.0 if v is None else v for v in vals], dtype=np.float64)
+    return values, present
+
+
+def _bits(v) -> Optional[bytes]:
+    return None if v is None else struct.pack("<d", float(v))
+
+
+def _assert_same(new: List[Optional[float]], old: List[Optional[float]]) -> None:
+    assert len(new) == len(old)
+    for i, (a, b) in enumerate(zip(new, old)):
+        assert _bits(a) == _bits(b), f"position {i}: {a!r} != {b!r}"
+
+
+def _frame(rng: random.Random, n: int, names: List[str]) -> TimeSeriesFrame:
+    start = datetime(2000, 1, 31)
+    dates = [start + timedelta(days=31 * i) for i in range(n)]
+    return TimeSeriesFrame(dates, {c: _values(rng, n, allow_none=False) for c in names})
+
+
+@pytest.fixture(autouse=True)
+def _fresh_column_cache():
+    features.COLUMN_CACHE.clear()
+    yield
+    features.COLUMN_CACHE.clear()
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_build_lagged_columns(seed):
+    rng = random.Random(seed)
+    n = rng.randint(0, 30)
+    frame = _frame(rng, n, ["a", "b"])
+    spec = {"a": [rng.randint(0, n + 2) for _ in range(3)], "b": [0, 1], "missing": [1]}
+    new = features.build_lagged_columns(frame, spec)
+    old = legacy.build_lagged_columns(frame, spec)
+    assert list(new) == list(old)
+    for name in old:
+        _assert_same(new[name], old[name])
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize(
+    "op, lo, hi",
+    [
+        ("_diff", 0, 4),
+        ("_pct_change", 0, 4),
+        ("_rolling_mean", 0, 8),
+        ("_rolling_std", 0, 8),
+        ("_ema", 0, 8),
+        ("_zscore", 0, 8),
+    ],
+)
+def test_derived_op(seed, op, lo, hi):
+    rng = random.Random(seed)
+    vals = _values(rng, rng.randint(0, 40))
+    for param in range(lo, hi + 1):
+        new = features._to_list(getattr(features, op)(_series(vals), param))
+        old = getattr(legacy, op)(list(vals), param)
+        _assert_same(new, old)
+
+
+def test_rolling_ops_window_longer_than_series():
+    vals = [1.0, None, 3.0]
+    for op in ("_rolling_mean", "_rolling_std", "_zscore"):
+        _assert_same(features._to_list(getattr(features, op)(_series(vals), 5)), getattr(legacy, op)(vals, 5))
+
+
+def _configs(rng: random.Random):
+    yield {"target_lags": [1, 2], "exog": {"x1": {"lags": [0, 1]}}}
+    yield {"target_lags": [1, 12], "exog": {"__all__": {"lags": [0]}}, "pack": "ta_basic"}
+    yield {
+        "target_lags": [1],
+        "exog": {"__all__": {"lags": [0, 2]}, "x2": {"lags": [3]}},
+        "derived": [
+            {"on": "y", "op": "diff", "k": rng.randint(1, 3)},
+            {"on": "x1", "op": "pct_change", "k": 1},
+            {"on": "x2", "op": "rolling_std", "window": rng.randint(2, 5)},
+            {"on": "x1", "op": "zscore", "window": rng.randint(2, 6)},
+            {"on": "nope", "op": "ema", "span": 3},
+        ],
+        "normalize": {"method": "zscore", "window": rng.randint(2, 6)},
+    }
+    yield {"target_lags": [1, 3], "exog": {"x1": {"lags": [0]}}, "pack": "ta_basic", "max_features": rng.randint(1, 6)}
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_assemble_supervised_v2(seed):
+    rng = random.Random(seed)
+    frame = _frame(rng, rng.randint(0, 60), ["y", "x1", "x2"])
+    for cfg in _configs(rng):
+        for horizon in (1, 3, 12):
+            new = features.assemble_supervised_v2(frame, "y", cfg, horizon)
+            old = legacy.assemble_supervised_v2(frame, "y", cfg, horizon)
+            assert new[0] == old[0], "origin dates (validity mask) differ"
+            assert len(new[1]) == len(old[1])
+            for row_new, row_old in zip(new[1], old[1]):
+                _assert_same(row_new, row_old)
+            _assert_same(new[2], old[2])
+            _assert_same(new[3], old[3])
+
+
+def test_assemble_supervised_v2_mostly_missing():
+    # Origins drop out wherever any feature is None, NaN or inf
+    dates = [datetime(2010, 1, 1) + timedelta(days=i) for i in range(12)]
+    y = [1.0, 2.0, float("nan"), 4.0, 5.0, float("inf"), 7.0, 8.0, 9.0, 10.0, 11.0, 12.0]
+    x = [math.nan if i % 4 == 0 else float(i) for i in range(12)]
+    frame = TimeSeriesFrame(dates, {"y": y, "x": x})
+    cfg = {"target_lags": [1], "exog": {"x": {"lags": [0]}}, "derived": [{"on": "y", "op": "ema", "span": 3}]}
+    new = features.assemble_supervised_v2(frame, "y", cfg, 1)
+    old = legacy.assemble_supervised_v2(frame, "y", cfg, 1)
+    assert new[0] == old[0]
+    assert len(new[0]) < 11
@@ -26,11 +26,15 @@ if SRC_DIR not in sys.path:
 from core.utils import parse_ymd, format_ymd
 from core.data import TimeSeriesFrame
 from core.registry import discover_plugins
-from core.backtest import backtest_direct
+from core.backtest import DEFAULT_SEED, backtest_direct, parse_strategy, strategy_label
 from core.output import OutputManager
-from core.features import build_feature_manifest, assemble_supervised_v2
+from core.features import COLUMN_CACHE, build_feature_manifest, build_feature_block
 from core.report import generate_comparison_report_html
-from core.cache import CacheManager
+from core.cache import CacheManager, OUTPUT_FILES
+from core.cache_telemetry import CacheTelemetry, aggregate as aggregate_telemetry, hit_rate
+
+# Rendered outputs a cache entry keeps for its hits (relative to a run directory)
+_BACKTEST_CSV, _METRICS_CSV, _MANIFEST_JSON = OUTPUT_FILES
 
 
 def load_recipe(path: str) -> dict:
@@ -54,17 +58,47 @@ def main():
                         help="Verbose output")
     parser.add_argument("--cache", choices=["use", "ignore", "rebuild"], default="use",
                         help="Cache mode: use (default), ignore, or rebuild")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Worker processes for --all (default 1 = serial)")
+    parser.add_argument("--fit-jobs", type=int, default=1,
+                        help="Pool size for fitting horizons/refit origins inside each backtest (default 1 = serial; "
+                             "ignored by --all with --jobs > 1)")
     parser.add_argument("--cache-stats", action="store_true",
                         help="Show cache statistics and exit")
     parser.add_argument("--clear-cache", action="store_true",
                         help="Clear all cache entries and exit")
+    parser.add_argument("--cache-report", action="store_true",
+                        help="Aggregate the per-run cache telemetry (hits/misses by model, bytes, load vs train time) and exit")
+    parser.add_argument("--cache-report-since", metavar="YYYY-MM-DD", default=None,
+                        help="Only count lookups recorded on or after this date in --cache-report")
+    parser.add_argument("--cache-compact", action="store_true",
+                        help="Remove model/result directories not referenced by the cache index and exit")
+    parser.add_argument("--cache-export-json", metavar="CACHE_KEY", default=None,
+                        help="Write a cache entry as plain JSON under model_library/exports/ and exit")
+    parser.add_argument("--cache-export-tar", metavar="PATH", default=None,
+                        help="Write the cache (and the shared store, if any) to a .tar.gz for another host and exit")
+    parser.add_argument("--cache-import-tar", metavar="PATH", default=None,
+                        help="Add the entries of a --cache-export-tar archive to the cache and exit")
+    parser.add_argument("--shared-cache", metavar="DIR", default=os.environ.get("SMF_SHARED_CACHE"),
+                        help="Content-addressed store shared with other runs/users on this host "
+                             "(default: $SMF_SHARED_CACHE); entries are published to it and misses looked up in it")
+    parser.add_argument("--no-warm-start", action="store_true",
+                        help="Fit from scratch instead of seeding lasso/elastic-net/boosting fits from the "
+                             "nearest cached hyperparameter neighbour")
+    parser.add_argument("--cache-max-mb", type=float, default=None,
+                        help="Byte budget for the model library in MB; entries are evicted past it (default: unbounded)")
+    parser.add_argument("--cache-eviction", choices=["lru", "lfu"], default="lru",
+                        help="Eviction order when over --cache-max-mb: least recently or least frequently used")
 
     args = parser.parse_args()
 
     # Initialize cache manager
     cache_mgr = CacheManager(
         base_dir=os.path.join(CUR_DIR, "model_library"),
-        verbose=args.verbose
+        verbose=args.verbose,
+        max_bytes=int(args.cache_max_mb * 1024 * 1024) if args.cache_max_mb is not None else None,
+        eviction=args.cache_eviction,
+        shared_dir=args.shared_cache,
     )
 
     # Handle cache management commands
@@ -74,12 +108,19 @@ def main():
         print(f"Total entries: {stats['total_entries']}")
         print(f"Total models: {stats['total_models']}")
         print(f"Cache size: {stats['cache_size_mb']:.2f} MB")
+        if stats['max_size_mb'] is not None:
+            print(f"Cache budget: {stats['max_size_mb']:.2f} MB ({cache_mgr.eviction})")
         if stats['oldest_entry']:
             print(f"Oldest entry: {stats['oldest_entry']}")
         if stats['newest_entry']:
             print(f"Newest entry: {stats['newest_entry']}")
         return
 
+    if args.cache_report:
+        since = parse_ymd(args.cache_report_since) if args.cache_report_since else None
+        _print_cache_report(aggregate_telemetry(cache_mgr.base_dir, since=since), cache_mgr.get_cache_stats())
+        return
+
     if args.clear_cache:
         confirm = input("Are you sure you want to clear all cache? (yes/no): ")
         if confirm.lower() == "yes":
@@ -87,6 +128,30 @@ def main():
             print("Cache cleared successfully")
         return
 
+    if args.cache_compact:
+        result = cache_mgr.compact()
+        print(f"Removed {result['removed_dirs']} orphaned paths and {result['removed_blobs']} unreferenced shared blobs "
+              f"({result['freed_bytes'] / (1024 * 1024):.2f} MB), dropped {result['dropped_entries']} dangling index entries")
+        return
+
+    if args.cache_export_tar:
+        n = cache_mgr.export_tar(args.cache_export_tar)
+        print(f"Exported {n} cache entries to: {args.cache_export_tar}")
+        return
+
+    if args.cache_import_tar:
+        keys = cache_mgr.import_tar(args.cache_import_tar)
+        print(f"Imported {len(keys)} cache entries from: {args.cache_import_tar}")
+        return
+
+    if args.cache_export_json:
+        if not cache_mgr.check_cache(args.cache_export_json):
+            print(f"Cache entry '{args.cache_export_json}' not found")
+            sys.exit(1)
+        out = cache_mgr.export_json(args.cache_export_json, os.path.join(cache_mgr.base_dir, "exports"))
+        print(f"Exported cache entry to: {out}")
+        return
+
     # Load recipe
     recipe_path = args.recipe
     recipe = load_recipe(recipe_path)
@@ -95,7 +160,9 @@ def main():
     target_id = recipe["target_id"]
     freq = recipe.get("frequency", "M")
     horizons = recipe.get("horizons", [1])
-    strategy = recipe.get("strategy", "frozen")
+    # Canonical strategy label (cache keys, reports) plus its parsed parameters
+    strategy_params = parse_strategy(recipe.get("strategy", "frozen"))
+    strategy = strategy_label(strategy_params)
     mode = args.mode
     all_mode = args.all
     verbose = args.verbose
@@ -162,21 +229,25 @@ def main():
 
     out_dir = recipe.get("output", {}).get("dir", os.path.join(CUR_DIR, "outputs"))
 
-    if mode == "train":
-        train_cfg = recipe.get("train", {})
-        test_cfg = recipe.get("test", {})
-        train_start = parse_ymd(train_cfg.get("start")) if train_cfg.get("start") else None
-        train_end = parse_ymd(train_cfg.get("end")) if train_cfg.get("end") else None
-        test_start = parse_ymd(test_cfg.get("start")) if test_cfg.get("start") else None
-        test_end = parse_ymd(test_cfg.get("end")) if test_cfg.get("end") else None
+    # Train/test windows are part of the cache key in both modes
+    train_cfg = recipe.get("train", {})
+    test_cfg = recipe.get("test", {})
+    train_start = parse_ymd(train_cfg.get("start")) if train_cfg.get("start") else None
+    train_end = parse_ymd(train_cfg.get("end")) if train_cfg.get("end") else None
+    test_start = parse_ymd(test_cfg.get("start")) if test_cfg.get("start") else None
+    test_end = parse_ymd(test_cfg.get("end")) if test_cfg.get("end") else None
+
+    # Structured record of this run's cache use (see --cache-report)
+    telemetry = CacheTelemetry(cache_mgr.base_dir, mode="all" if mode == "train" and all_mode else mode)
 
+    if mode == "train":
         if all_mode:
             # Run all models with caching support
             _run_all_models_cached(
                 recipe, frame, target_id, freq, horizons, strategy,
                 train_start, train_end, test_start, test_end,
                 data_fingerprint, out_dir, cache_mgr, args.cache, verbose,
-                recipe_path
+                recipe_path, jobs=args.jobs, fit_jobs=args.fit_jobs, telemetry=telemetry
             )
         else:
             # Single model training with caching
@@ -184,25 +255,125 @@ def main():
                 recipe, frame, target_id, freq, horizons, strategy,
                 train_start, train_end, test_start, test_end,
                 data_fingerprint, out_dir, cache_mgr, args.cache, verbose,
-                recipe_path
+                recipe_path, fit_jobs=args.fit_jobs, warm_start=not args.no_warm_start, telemetry=telemetry
             )
 
     else:  # predict mode
-        # Prediction mode - use latest cached or trained model
+        # Prediction mode - serve the models train mode cached for this recipe
         _run_predict_cached(
-            recipe, frame, target_id, freq, out_dir, verbose
+            recipe, frame, target_id, freq, horizons, strategy,
+            train_start, train_end, test_start, test_end,
+            out_dir, cache_mgr, args.cache, verbose, telemetry=telemetry
         )
 
+    # --jobs workers save without a budget; enforce it once the run is done
+    if cache_mgr.max_bytes is not None:
+        cache_mgr.evict()
+
+    run_record = telemetry.close()
+    vprint(f"[Cache] Telemetry: {telemetry.path} (lookups={run_record['lookups']}, hits={run_record['hits']}, "
+           f"read={run_record['bytes_read'] / 1e6:.2f} MB, written={run_record['bytes_written'] / 1e6:.2f} MB)")
+
     vprint(f"Total elapsed: {time.time()-t0_total:.2f}s")
 
 
+def _print_cache_report(report, stats):
+    """Print ``aggregate_telemetry`` output, overall and per model, next to the library's current size."""
+    def rate(totals):
+        r = hit_rate(totals)
+        return "-" if r is None else f"{r * 100:.1f}%"
+
+    t = report["totals"]
+    print("\n=== Cache Report ===")
+    if not report["runs"]:
+        print("No telemetry recorded")
+        return
+    print(f"Runs: {report['runs']} ({report['first']} .. {report['last']})")
+    print(f"Lookups: {t['lookups']}, hits: {t['hits']}, misses: {t['misses']}, hit rate: {rate(t)}")
+    print(f"Read from cache: {t['bytes_read'] / (1024 * 1024):.2f} MB, written to cache: {t['bytes_written'] / (1024 * 1024):.2f} MB")
+    print(f"Loading: {t['load_seconds']:.2f}s, training: {t['train_seconds']:.2f}s, saved by hits: {t['saved_seconds']:.2f}s")
+    budget = f" of {stats['max_size_mb']:.2f} MB budget" if stats.get("max_size_mb") is not None else ""
+    print(f"Cache size now: {stats['cache_size_mb']:.2f} MB{budget} ({stats['total_entries']} entries)")
+    print()
+    header = f"{'model':<24}{'lookups':>8}{'hits':>6}{'misses':>7}{'rate':>8}{'read MB':>9}{'write MB':>9}{'load s':>9}{'train s':>9}{'saved s':>9}"
+    print(header)
+    print("-" * len(header))
+    for name, m in report["by_model"].items():
+        print(f"{name[:23]:<24}{m['lookups']:>8}{m['hits']:>6}{m['misses']:>7}{rate(m):>8}"
+              f"{m['bytes_read'] / (1024 * 1024):>9.2f}{m['bytes_written'] / (1024 * 1024):>9.2f}"
+              f"{m['load_seconds']:>9.2f}{m['train_seconds']:>9.2f}{m['saved_seconds']:>9.2f}")
+
+
+def _entry_data(cache_mgr, frame, target_id, features_cfg, horizons, train_end, test_end):
+    """Fingerprint of the columns and date range one model x features cache entry reads."""
+    data_end = None if train_end is None or test_end is None else max(train_end, test_end)
+    manifest = build_feature_manifest(frame, target_id, features_cfg)
+    return cache_mgr.compute_entry_fingerprint(frame, manifest, horizons, data_end)
+
+
+def _single_model_key(cache_mgr, recipe, frame, target_id, freq, horizons, strategy,
+                      train_start, train_end, test_start, test_end):
+    """
+    Cache key and entry fingerprint of a single-model recipe (shared by train
+    and predict mode). The entry data also carries the ``param_family`` key
+    that hyperparameter variants of the recipe share.
+    """
+    features_cfg = recipe.get("features", {})
+    # Key on the columns and date range these features read, so appended months or unrelated revisions keep the entry
+    entry_data = _entry_data(cache_mgr, frame, target_id, features_cfg, horizons, train_end, test_end)
+    key_args = dict(
+        model_name=recipe.get("model", {}).get("name"),
+        model_params=recipe.get("model", {}).get("params", {}),
+        target_id=target_id,
+        features_cfg=features_cfg,
+        horizons=horizons,
+        train_range=(train_start, train_end),
+        test_range=(test_start, test_end),
+        data_fingerprint=entry_data["data_fingerprint"],
+        frequency=freq,
+        strategy=strategy,
+        seed=DEFAULT_SEED,
+    )
+    cache_key = cache_mgr.generate_cache_key(**key_args)
+    entry_data["param_family"] = cache_mgr.generate_cache_key(**key_args, with_params=False)
+    return cache_key, entry_data
+
+
+def _find_warm_start(cache_mgr, create_fn, model_name, model_params, param_family, cache_key, horizons):
+    """
+    Fitted params of the nearest cached hyperparameter neighbour whose models
+    this plugin accepts as a warm start.
+
+    Returns:
+        ``(params by horizon, provenance)``, or ``({}, None)`` if there is none
+    """
+    for entry in cache_mgr.find_neighbours(model_name, param_family, model_params, exclude=cache_key):
+        models = cache_mgr.load_cached_models(entry["cache_key"])
+        accepted = {
+            h: models[h]["params"] for h in sorted(horizons)
+            if h in models and create_fn(model_params).warm_start(models[h]["params"])
+        }
+        if accepted:
+            return accepted, {
+                "from": entry["cache_key"],
+                "model_params": entry["metadata"]["model_params"],
+                "horizons": sorted(accepted),
+            }
+    return {}, None
+
+
 def _run_single_model_cached(
     recipe, frame, target_id, freq, horizons, strategy,
     train_start, train_end, test_start, test_end,
     data_fingerprint, out_dir, cache_mgr, cache_mode, verbose,
-    recipe_path
+    recipe_path, fit_jobs=1, warm_start=True, telemetry=None
 ):
-    """Run single model training with cache support."""
+    """
+    Run single model training with cache support. On a miss, frozen backtest
+    fits and final fits are warm-started from the nearest cached neighbour
+    in hyperparameter space, unless ``warm_start`` is off or the cache ignored.
+    The hit or miss is recorded in ``telemetry`` when given.
+    """
 
     def vprint(msg):
         if verbose:
@@ -220,17 +391,9 @@ def _run_single_model_cached(
     create_fn, _ = plugins[model_name]
 
     # Generate cache key
-    cache_key = cache_mgr.generate_cache_key(
-        model_name=model_name,
-        model_params=model_params,
-        target_id=target_id,
-        features_cfg=features_cfg,
-        horizons=horizons,
-        train_range=(train_start, train_end),
-        test_range=(test_start, test_end),
-        data_fingerprint=data_fingerprint,
-        frequency=freq,
-        strategy=strategy
+    cache_key, entry_data = _single_model_key(
+        cache_mgr, recipe, frame, target_id, freq, horizons, strategy,
+        train_start, train_end, test_start, test_end
     )
 
     vprint(f"Cache key: {cache_key}")
@@ -248,24 +411,33 @@ def _run_single_model_cached(
     run_id = build_run_id(model_name)
     om = OutputManager(base_dir=out_dir, run_id=run_id)
 
-    if use_cache:
-        # Load from cache
-        cached_models = cache_mgr.load_cached_models(cache_key)
-        cached_results = cache_mgr.load_cached_results(cache_key)
+    io_before = dict(cache_mgr.io)
 
-        # Save cached models to output directory
-        for h, model_data in cached_models.items():
-            om.save_model_params(h, model_data["plugin"], model_data["params"])
+    if use_cache:
+        # Link the stored outputs and write the models; render whatever older entries lack
+        _t_load = time.time()
+        linked = cache_mgr.copy_from_cache(cache_key, om.run_dir)
+        if _METRICS_CSV not in linked or _BACKTEST_CSV not in linked:
+            cached_results = cache_mgr.load_cached_results(cache_key)
 
-        # Save cached metrics
-        if "metrics" in cached_results:
-            om.save_metrics_csv(cached_results["metrics"])
+            # Save cached metrics
+            if "metrics" in cached_results and _METRICS_CSV not in linked:
+                om.save_metrics_csv(cached_results["metrics"])
 
-        # Save cached backtest results
-        if "backtest" in cached_results:
-            om.save_backtest_csv(cached_results["backtest"])
+            # Save cached backtest results
+            if "backtest" in cached_results and _BACKTEST_CSV not in linked:
+                om.save_backtest_csv(cached_results["backtest"])
 
         vprint(f"[Cache] Loaded cached results to: {om.run_dir}")
+        if telemetry is not None:
+            load_seconds = time.time() - _t_load
+            trained = (cache_entry.get("metadata") or {}).get("train_seconds")
+            telemetry.lookup(
+                model_name, cache_key, hit=True,
+                bytes_read=cache_mgr.io["bytes_read"] - io_before["bytes_read"],
+                load_seconds=load_seconds,
+                saved_seconds=None if trained is None else max(0.0, trained - load_seconds),
+            )
 
     else:
         # Train from scratch
@@ -277,6 +449,24 @@ def _run_single_model_cached(
         except Exception:
             pass
 
+        # Feature block is horizon-independent: build once for backtest and final fits
+        _t_fb = time.time()
+        feature_block = build_feature_block(frame, target_id, features_cfg)
+        _fb_time = time.time() - _t_fb
+        # Estimate only: prices each avoided per-horizon build at this block's cost
+        _avoided = 2 * len(horizons) - 1
+        vprint(f"Feature block built in {_fb_time:.2f}s; {_avoided} per-horizon builds avoided "
+               f"(~{_fb_time * _avoided:.2f}s if each cost as much as this block)")
+
+        warm_params, warm_info = {}, None
+        if warm_start and cache_mode != "ignore":
+            warm_params, warm_info = _find_warm_start(
+                cache_mgr, create_fn, model_name, model_params, entry_data["param_family"], cache_key, horizons
+            )
+            if warm_info:
+                vprint(f"[Cache] Warm start from {warm_info['from']} (params={warm_info['model_params']}, "
+                       f"horizons={warm_info['horizons']})")
+
         _t_bt = time.time()
 
         # Backtest
@@ -291,6 +481,9 @@ def _run_single_model_cached(
             train_range=(train_start, train_end),
             test_range=(test_start, test_end),
             strategy=strategy,
+            feature_block=feature_block,
+            n_jobs=fit_jobs,
+            warm_start=warm_params,
         )
 
         vprint(f"Backtest done in {time.time()-_t_bt:.2f}s")
@@ -298,12 +491,7 @@ def _run_single_model_cached(
         # Train final models and collect for caching
         models_for_cache = {}
         for h in sorted(horizons):
-            d_tr, X_tr, y_tr, _ = assemble_supervised_v2(
-                frame=frame,
-                target_id=target_id,
-                features_cfg=features_cfg,
-                horizon=h,
-            )
+            d_tr, X_tr, y_tr, _ = feature_block.for_horizon(h)
 
             # Filter by train window
             def _filter_by_date(dates, X, y, start, end):
@@ -320,12 +508,16 @@ def _run_single_model_cached(
 
             if X_fit and y_fit:
                 m = create_fn(model_params)
+                if h in warm_params:
+                    m.warm_start(warm_params[h])
                 m.fit(X_fit, y_fit)
                 om.save_model_params(h, model_name, m.get_params())
                 models_for_cache[h] = {
                     "plugin": model_name,
                     "params": m.get_params()
                 }
+        # Feature block, backtest and final fits: what a later hit saves
+        train_seconds = time.time() - _t_fb
 
         # Save lineage
         lineage = {
@@ -335,11 +527,13 @@ def _run_single_model_cached(
             "frequency": freq,
             "horizons": horizons,
             "strategy": strategy,
+            "strategy_params": parse_strategy(strategy),
             "features": features_cfg,
             "train_window": {"start": format_ymd(train_start), "end": format_ymd(train_end)},
             "test_window": {"start": format_ymd(test_start), "end": format_ymd(test_end)},
             "recipe_path": recipe_path,
-            "cache_key": cache_key
+            "cache_key": cache_key,
+            "warm_start": warm_info
         }
         om.save_lineage(lineage)
         om.save_backtest_csv(rows)
@@ -374,24 +568,158 @@ def _run_single_model_cached(
                 backtest_rows=rows,
                 metadata={
                     "model_name": model_name,
+                    "model_params": model_params,
+                    "target_id": target_id,
+                    "frame_fingerprint": data_fingerprint,
+                    **entry_data,
                     "strategy": strategy,
+                    "strategy_params": parse_strategy(strategy),
+                    "seed": DEFAULT_SEED,
                     "horizons": horizons,
                     "train_window": [format_ymd(train_start), format_ymd(train_end)],
                     "test_window": [format_ymd(test_start), format_ymd(test_end)],
+                    # Neighbour the fits were seeded from (None: cold start)
+                    "warm_start": warm_info,
+                    "train_seconds": round(train_seconds, 3),
                 }
             )
+            cache_mgr.store_outputs(cache_key, om.run_dir)
             vprint(f"[Cache] Saved results to cache: {cache_key}")
 
+        if telemetry is not None:
+            telemetry.lookup(
+                model_name, cache_key, hit=False, lookup=cache_mode == "use",
+                bytes_written=cache_mgr.io["bytes_written"] - io_before["bytes_written"],
+                train_seconds=train_seconds,
+            )
+
     print(f"Training complete. Outputs written to: {om.run_dir}")
 
 
+def _train_variant(create_fn, name, fv, frame, ctx, cache_mgr, cache_key, var_count):
+    """
+    Backtest one model x feature variant and, unless the cache is ignored, fit
+    and cache the final per-horizon models. Runs in-process or in a --jobs worker.
+    """
+    _t0 = time.time()
+    written_before = cache_mgr.io["bytes_written"]
+    target_id, horizons, strategy = ctx["target_id"], ctx["horizons"], ctx["strategy"]
+    train_start, train_end = ctx["train_range"]
+
+    # One feature block serves the backtest, final fits and burn-in
+    feature_block = build_feature_block(frame, target_id, fv)
+    _fb_time = time.time() - _t0
+
+    metrics_by_h, rows = backtest_direct(
+        model_factory=create_fn,
+        model_params={},
+        frame=frame,
+        target_id=target_id,
+        freq=ctx["freq"],
+        features_cfg=fv,
+        horizons=horizons,
+        train_range=ctx["train_range"],
+        test_range=ctx["test_range"],
+        strategy=strategy,
+        feature_block=feature_block,
+        n_jobs=ctx.get("fit_jobs", 1),
+    )
+
+    try:
+        burn_in_h1 = feature_block.first_origin_index(1)
+    except Exception:
+        burn_in_h1 = None
+
+    # Save to cache if not in ignore mode
+    if ctx["cache_mode"] != "ignore":
+        # Train final models for caching
+        models_for_cache = {}
+        for h in sorted(horizons):
+            d_tr, X_tr, y_tr, _ = feature_block.for_horizon(h)
+
+            # Filter by train window
+            def _filter_by_date(dates, X, y, start, end):
+                out_d, out_X, out_y = [], [], []
+                for d, xr, yr in zip(dates, X, y):
+                    if start is not None and d < start:
+                        continue
+                    if end is not None and d > end:
+                        continue
+                    out_d.append(d); out_X.append(xr); out_y.append(yr)
+                return out_d, out_X, out_y
+
+            _, X_fit, y_fit = _filter_by_date(d_tr, X_tr, y_tr, train_start, train_end)
+
+            if X_fit and y_fit:
+                m = create_fn({})
+                m.fit(X_fit, y_fit)
+                models_for_cache[h] = {
+                    "plugin": name,
+                    "params": m.get_params()
+                }
+
+        cache_mgr.save_to_cache(
+            cache_key=cache_key,
+            models=models_for_cache,
+            metrics=metrics_by_h,
+            backtest_rows=rows,
+            metadata={
+                "model_name": name,
+                "target_id": target_id,
+                "frame_fingerprint": ctx["data_fingerprint"],
+                **_entry_data(cache_mgr, frame, target_id, fv, horizons, train_end, ctx["test_range"][1]),
+                "strategy": strategy,
+                "strategy_params": parse_strategy(strategy),
+                "seed": DEFAULT_SEED,
+                "horizons": horizons,
+                "variant": var_count,
+                # Stored so a hit needs no feature assembly
+                "burn_in_h1": burn_in_h1,
+                "train_seconds": round(time.time() - _t0, 3),
+            }
+        )
+
+    return {
+        "metrics": metrics_by_h,
+        "rows": rows,
+        "burn_in_h1": burn_in_h1,
+        "block_time": _fb_time,
+        "elapsed": time.time() - _t0,
+        "bytes_written": cache_mgr.io["bytes_written"] - written_before,
+    }
+
+
+# Per-process state of --jobs workers, set once by _init_worker
+_WORKER = {}
+
+
+def _init_worker(frame, ctx):
+    _WORKER["frame"] = frame
+    _WORKER["ctx"] = ctx
+    _WORKER["plugins"] = discover_plugins("models")
+    _WORKER["cache_mgr"] = CacheManager(base_dir=ctx["cache_dir"], shared_dir=ctx["shared_cache_dir"])
+
+
+def _train_variant_job(name, fv, cache_key, var_count):
+    w = _WORKER
+    before = COLUMN_CACHE.stats()
+    result = _train_variant(w["plugins"][name][0], name, fv, w["frame"], w["ctx"], w["cache_mgr"], cache_key, var_count)
+    after = COLUMN_CACHE.stats()
+    result["col_hits"] = after["hits"] - before["hits"]
+    result["col_misses"] = after["misses"] - before["misses"]
+    return result
+
+
 def _run_all_models_cached(
     recipe, frame, target_id, freq, horizons, strategy,
     train_start, train_end, test_start, test_end,
     data_fingerprint, out_dir, cache_mgr, cache_mode, verbose,
-    recipe_path
+    recipe_path, jobs=1, fit_jobs=1, telemetry=None
 ):
-    """Run all models in batch with cache support."""
+    """
+    Run all models in batch with cache support (``jobs`` > 1 trains in a process
+    pool). Each member's hit or miss is recorded in ``telemetry`` when given.
+    """
 
     def vprint(msg):
         if verbose:
@@ -496,32 +824,44 @@ def _run_all_models_cached(
     total_models = len(plugins)
     total_variants = len(features_variants) if isinstance(features_variants, list) else 1
     total_iters = total_models * (total_variants or 1)
-    iter_idx = 0
     start_all = time.time()
     vprint(f"[ALL] models={total_models}, variants={total_variants}, total={total_iters}")
 
     cache_hits = 0
     cache_misses = 0
-
+    blocks_built = 0
+    block_time = 0.0
+    builds_avoided = 0
+    avoided_estimate = 0.0
+    col_hits = 0
+    col_misses = 0
+
+    ctx = {
+        "target_id": target_id,
+        "freq": freq,
+        "horizons": horizons,
+        "strategy": strategy,
+        "train_range": (train_start, train_end),
+        "test_range": (test_start, test_end),
+        "data_fingerprint": data_fingerprint,
+        "cache_mode": cache_mode,
+        "cache_dir": cache_mgr.base_dir,
+        "shared_cache_dir": cache_mgr.shared.root if cache_mgr.shared is not None else None,
+        # --jobs workers fit serially: a --fit-jobs pool in each would fork jobs x fit_jobs processes
+        "fit_jobs": fit_jobs if jobs <= 1 else 1,
+    }
+    if jobs > 1 and fit_jobs > 1:
+        vprint(f"[ALL] --fit-jobs {fit_jobs} ignored with --jobs {jobs}; each worker fits serially")
+
+    # Enumerate model x variant tasks in output order and resolve cache hits up front
+    tasks = []
+    hit_metadata = {}
+    iter_idx = 0
     for name in sorted(plugins.keys()):
-        create_fn_i, spec_i = plugins[name]
-
-        # Choose base features
-        if not ("features" in recipe and recipe["features"]):
-            input_spec = (spec_i or {}).get("input", {})
-            base_features = {
-                "target_lags": list(input_spec.get("target", {}).get("lags", [0])),
-                "exog": input_spec.get("exog", {}),
-            }
-        else:
-            base_features = recipe["features"]
-
-        # Iterate variants
         var_count = 0
         for fv in features_variants:
             var_count += 1
             iter_idx += 1
-            _iter_start = time.time()
 
             # Generate cache key
             cache_key = cache_mgr.generate_cache_key(
@@ -532,9 +872,12 @@ def _run_all_models_cached(
                 horizons=horizons,
                 train_range=(train_start, train_end),
                 test_range=(test_start, test_end),
-                data_fingerprint=data_fingerprint,
+                data_fingerprint=_entry_data(
+                    cache_mgr, frame, target_id, fv, horizons, train_end, test_end
+                )["data_fingerprint"],
                 frequency=freq,
-                strategy=strategy
+                strategy=strategy,
+                seed=DEFAULT_SEED,
             )
 
             # Check cache
@@ -544,95 +887,65 @@ def _run_all_models_cached(
                 if cache_entry:
                     cache_hits += 1
                     use_cache = True
-                    vprint(f"[{iter_idx}/{total_iters}] model={name} variant={var_count}/{total_variants} [CACHE HIT]")
+                    hit_metadata[cache_key] = cache_entry.get("metadata") or {}
                 else:
                     cache_misses += 1
-
-            if use_cache:
-                # Load from cache
-                cached_results = cache_mgr.load_cached_results(cache_key)
-                metrics_by_h = cached_results.get("metrics", {})
-                rows = cached_results.get("backtest", [])
+            tasks.append((iter_idx, name, var_count, fv, cache_key, use_cache))
+
+    def announce(task):
+        iter_idx, name, var_count = task[:3]
+        vprint(f"[{iter_idx}/{total_iters}] model={name} variant={var_count}/{total_variants} strategy={strategy}")
+
+    def emit(task, result):
+        """Write one member's outputs and its summary row (always called in task order)."""
+        nonlocal blocks_built, block_time, builds_avoided, avoided_estimate, col_hits, col_misses
+        iter_idx, name, var_count, fv, cache_key, use_cache = task
+        run_suffix = f"{name}-{iter_idx:03d}-v{var_count:02d}-{time.strftime('%H%M%S')}"
+        om = OutputManager(base_dir=os.path.join(group.run_dir, "members"), run_id=run_suffix)
+        linked = []
+        io_before = dict(cache_mgr.io)
+        if use_cache:
+            vprint(f"[{iter_idx}/{total_iters}] model={name} variant={var_count}/{total_variants} [CACHE HIT]")
+            # Load from cache: stored outputs are linked, rows are decoded only if needed
+            _t_load = time.time()
+            linked = cache_mgr.copy_from_cache(cache_key, om.run_dir, models=False)
+            cached_results = cache_mgr.load_cached_results(cache_key)
+            metrics_by_h = cached_results.get("metrics", {})
+            # Decoded here (the H=1 series below needs them) so loading is timed as such
+            rows = list(cached_results.get("backtest", []))
+            load_seconds = time.time() - _t_load
+            meta = hit_metadata.get(cache_key, {})
+            if "burn_in_h1" in meta:
+                burn_in_h1 = meta["burn_in_h1"]
             else:
-                # Train from scratch
-                vprint(f"[{iter_idx}/{total_iters}] model={name} variant={var_count}/{total_variants} strategy={strategy}")
-
-                metrics_by_h, rows = backtest_direct(
-                    model_factory=create_fn_i,
-                    model_params={},
-                    frame=frame,
-                    target_id=target_id,
-                    freq=freq,
-                    features_cfg=fv,
-                    horizons=horizons,
-                    train_range=(train_start, train_end),
-                    test_range=(test_start, test_end),
-                    strategy=strategy,
-                )
-
-                # Save to cache if not in ignore mode
-                if cache_mode != "ignore":
-                    # Train final models for caching
-                    models_for_cache = {}
-                    for h in sorted(horizons):
-                        d_tr, X_tr, y_tr, _ = assemble_supervised_v2(
-                            frame=frame,
-                            target_id=target_id,
-                            features_cfg=fv,
-                            horizon=h,
-                        )
-
-                        # Filter by train window
-                        def _filter_by_date(dates, X, y, start, end):
-                            out_d, out_X, out_y = [], [], []
-                            for d, xr, yr in zip(dates, X, y):
-                                if start is not None and d < start:
-                                    continue
-                                if end is not None and d > end:
-                                    continue
-                                out_d.append(d); out_X.append(xr); out_y.append(yr)
-                            return out_d, out_X, out_y
-
-                        _, X_fit, y_fit = _filter_by_date(d_tr, X_tr, y_tr, train_start, train_end)
-
-                        if X_fit and y_fit:
-                            m = create_fn_i({})
-                            m.fit(X_fit, y_fit)
-                            models_for_cache[h] = {
-                                "plugin": name,
-                                "params": m.get_params()
-                            }
-
-                    cache_mgr.save_to_cache(
-                        cache_key=cache_key,
-                        models=models_for_cache,
-                        metrics=metrics_by_h,
-                        backtest_rows=rows,
-                        metadata={
-                            "model_name": name,
-                            "strategy": strategy,
-                            "horizons": horizons,
-                            "variant": var_count,
-                        }
-                    )
-
-            vprint(f"  OK in {time.time()-_iter_start:.2f}s")
-
-            # Save under members
-            run_suffix = f"{name}-{iter_idx:03d}-v{var_count:02d}-{time.strftime('%H%M%S')}"
-            om = OutputManager(base_dir=os.path.join(group.run_dir, "members"), run_id=run_suffix)
+                # Entries saved before the burn-in was stored
+                try:
+                    burn_in_h1 = build_feature_block(frame, target_id, fv).first_origin_index(1)
+                except Exception:
+                    burn_in_h1 = None
+        else:
+            metrics_by_h, rows = result["metrics"], result["rows"]
+            burn_in_h1 = result["burn_in_h1"]
+            blocks_built += 1
+            block_time += result["block_time"]
+            # Previously: one assembly per horizon for backtest and final fits, plus burn-in
+            _assemblies = len(horizons) * (2 if cache_mode != "ignore" else 1) + 1
+            builds_avoided += _assemblies - 1
+            avoided_estimate += result["block_time"] * (_assemblies - 1)
+            col_hits += result.get("col_hits", 0)
+            col_misses += result.get("col_misses", 0)
+            vprint(f"  OK in {result['elapsed']:.2f}s")
+
+        # Save under members
+        if _BACKTEST_CSV not in linked:
             om.save_backtest_csv(rows)
+        if _METRICS_CSV not in linked:
             om.save_metrics_csv(metrics_by_h)
 
-            # Compute burn-in
-            total_periods = len(frame.dates)
-            try:
-                d1, _X1, _y1, _yt1 = assemble_supervised_v2(frame, target_id, fv, 1)
-                burn_in_h1 = frame.dates.index(d1[0]) if d1 else None
-            except Exception:
-                burn_in_h1 = None
+        total_periods = len(frame.dates)
 
-            # Save feature manifest
+        # Save feature manifest
+        if _MANIFEST_JSON not in linked:
             manifest = build_feature_manifest(frame, target_id, fv)
             try:
                 os.makedirs(om.artifacts_dir, exist_ok=True)
@@ -641,69 +954,136 @@ def _run_all_models_cached(
             except Exception:
                 pass
 
-            # Evaluate extended metrics
-            try:
-                import importlib.util
-                spec = importlib.util.spec_from_file_location("v2_eval", os.path.join(CUR_DIR, "eval.py"))
-                mod = importlib.util.module_from_spec(spec)
-                assert spec and spec.loader
-                spec.loader.exec_module(mod)
-                ext_i = mod.evaluate_run(om.run_dir)
-            except Exception:
-                ext_i = None
+        # Keep the rendered outputs with the entry (saved by _train_variant) for later hits
+        if not use_cache and cache_mode != "ignore":
+            cache_mgr.store_outputs(cache_key, om.run_dir)
 
-            # Collect series for H=1 chart
-            try:
-                rows_h1 = [r for r in rows if r.get("horizon") == 1]
-                rows_h1 = sorted(rows_h1, key=lambda r: r.get("target_date", r.get("origin_date", "")))
-                series_h1 = {
-                    "dates": [r.get("target_date", r.get("origin_date", "")) for r in rows_h1],
-                    "y_t": [float(r.get("y_t")) for r in rows_h1],
-                    "actual": [float(r.get("actual")) for r in rows_h1],
-                    "forecast": [float(r.get("forecast")) for r in rows_h1],
-                }
-            except Exception:
-                series_h1 = None
-
-            # Short feature description
-            desc_parts = []
-            if fv.get("pack"):
-                desc_parts.append(f"pack={fv.get('pack')}")
-            norm = fv.get("normalize", {}) or {}
-            if isinstance(norm, dict) and norm.get("method") and norm.get("method") != "none":
-                if norm.get("method") == "zscore":
-                    desc_parts.append(f"norm=z({norm.get('window', '')})")
-                else:
-                    desc_parts.append(f"norm={norm.get('method')}")
-            t_lags = fv.get("target_lags", [])
-            if t_lags:
-                desc_parts.append(f"t_lags={t_lags}")
-            exog_desc = []
-            for exn in sorted((fv.get("exog", {}) or {}).keys()):
-                l = (fv.get("exog", {}) or {}).get(exn, {}).get("lags", [])
-                if l:
-                    exog_desc.append(f"{exn}{l}")
-            if exog_desc:
-                desc_parts.append("exog=" + ",".join(exog_desc))
-            if isinstance(fv.get("max_features"), int):
-                desc_parts.append(f"maxF={fv.get('max_features')}")
-            feature_desc = "; ".join(desc_parts) if desc_parts else "lags-only"
-
-            summary_rows.append({
-                "model_name": name,
-                "strategy": strategy,
-                "run_dir": om.run_dir,
-                "rmse": {h: metrics_by_h.get(h, {}).get("rmse") for h in horizons},
-                "mae": {h: metrics_by_h.get(h, {}).get("mae") for h in horizons},
-                "series_h1": series_h1,
-                "ext": ext_i or {},
-                "feature_desc": feature_desc,
-                "total_periods": total_periods,
-                "burn_in_h1": burn_in_h1,
-            })
+        if telemetry is not None:
+            if use_cache:
+                trained = meta.get("train_seconds")
+                telemetry.lookup(
+                    name, cache_key, hit=True,
+                    bytes_read=cache_mgr.io["bytes_read"] - io_before["bytes_read"],
+                    load_seconds=load_seconds,
+                    saved_seconds=None if trained is None else max(0.0, trained - load_seconds),
+                )
+            else:
+                telemetry.lookup(
+                    name, cache_key, hit=False, lookup=cache_mode == "use",
+                    bytes_written=result.get("bytes_written", 0) + cache_mgr.io["bytes_written"] - io_before["bytes_written"],
+                    train_seconds=result["elapsed"],
+                )
+
+        # Evaluate extended metrics
+        try:
+            import importlib.util
+            spec = importlib.util.spec_from_file_location("v2_eval", os.path.join(CUR_DIR, "eval.py"))
+            mod = importlib.util.module_from_spec(spec)
+            assert spec and spec.loader
+            spec.loader.exec_module(mod)
+            ext_i = mod.evaluate_run(om.run_dir)
+        except Exception:
+            ext_i = None
+
+        # Collect series for H=1 chart
+        try:
+            rows_h1 = [r for r in rows if r.get("horizon") == 1]
+            rows_h1 = sorted(rows_h1, key=lambda r: r.get("target_date", r.get("origin_date", "")))
+            series_h1 = {
+                "dates": [r.get("target_date", r.get("origin_date", "")) for r in rows_h1],
+                "y_t": [float(r.get("y_t")) for r in rows_h1],
+                "actual": [float(r.get("actual")) for r in rows_h1],
+                "forecast": [float(r.get("forecast")) for r in rows_h1],
+            }
+        except Exception:
+            series_h1 = None
+
+        # Short feature description
+        desc_parts = []
+        if fv.get("pack"):
+            desc_parts.append(f"pack={fv.get('pack')}")
+        norm = fv.get("normalize", {}) or {}
+        if isinstance(norm, dict) and norm.get("method") and norm.get("method") != "none":
+            if norm.get("method") == "zscore":
+                desc_parts.append(f"norm=z({norm.get('window', '')})")
+            else:
+                desc_parts.append(f"norm={norm.get('method')}")
+        t_lags = fv.get("target_lags", [])
+        if t_lags:
+            desc_parts.append(f"t_lags={t_lags}")
+        exog_desc = []
+        for exn in sorted((fv.get("exog", {}) or {}).keys()):
+            l = (fv.get("exog", {}) or {}).get(exn, {}).get("lags", [])
+            if l:
+                exog_desc.append(f"{exn}{l}")
+        if exog_desc:
+            desc_parts.append("exog=" + ",".join(exog_desc))
+        if isinstance(fv.get("max_features"), int):
+            desc_parts.append(f"maxF={fv.get('max_features')}")
+        feature_desc = "; ".join(desc_parts) if desc_parts else "lags-only"
+
+        summary_rows.append({
+            "model_name": name,
+            "strategy": strategy,
+            "strategy_params": parse_strategy(strategy),
+            "run_dir": om.run_dir,
+            "rmse": {h: metrics_by_h.get(h, {}).get("rmse") for h in horizons},
+            "mae": {h: metrics_by_h.get(h, {}).get("mae") for h in horizons},
+            "series_h1": series_h1,
+            "ext": ext_i or {},
+            "feature_desc": feature_desc,
+            "total_periods": total_periods,
+            "burn_in_h1": burn_in_h1,
+        })
+
+    if jobs > 1 and any(not t[5] for t in tasks):
+        import concurrent.futures as _cf
+        import multiprocessing as _mp
+        # Workers inherit the frame via fork where available (otherwise it is pickled
+        # once per worker by the initializer); results are emitted in task order.
+        _methods = _mp.get_all_start_methods()
+        _mp_ctx = _mp.get_context("fork") if "fork" in _methods else None
+        vprint(f"[ALL] parallel: jobs={jobs}, start_method={'fork' if _mp_ctx else _mp.get_start_method()}")
+        done = {}
+        next_pos = 0
+        with _cf.ProcessPoolExecutor(max_workers=jobs, mp_context=_mp_ctx,
+                                     initializer=_init_worker, initargs=(frame, ctx)) as pool:
+            pending = {}
+            for pos, task in enumerate(tasks):
+                if not task[5]:
+                    _, name, _, fv, cache_key, _ = task
+                    pending[pool.submit(_train_variant_job, name, fv, cache_key, task[2])] = pos
+            for fut in _cf.as_completed(pending):
+                done[pending[fut]] = fut.result()
+                while next_pos < len(tasks) and (tasks[next_pos][5] or next_pos in done):
+                    if not tasks[next_pos][5]:
+                        announce(tasks[next_pos])
+                    emit(tasks[next_pos], done.pop(next_pos, None))
+                    next_pos += 1
+        while next_pos < len(tasks):
+            emit(tasks[next_pos], None)
+            next_pos += 1
+    else:
+        for task in tasks:
+            _, name, var_count, fv, cache_key, use_cache = task
+            result = None
+            if not use_cache:
+                # Train from scratch
+                announce(task)
+                result = _train_variant(plugins[name][0], name, fv, frame, ctx, cache_mgr, cache_key, var_count)
+            emit(task, result)
 
     vprint(f"[ALL] complete | elapsed={time.time()-start_all:.2f}s")
-    vprint(f"[Cache] Hits: {cache_hits}, Misses: {cache_misses}, Hit Rate: {cache_hits/(cache_hits+cache_misses)*100:.1f}%")
+    # An estimate of avoided builds priced at the measured block cost, not measured wall time
+    vprint(f"[Features] Blocks built: {blocks_built} in {block_time:.2f}s, per-horizon builds avoided: {builds_avoided} "
+           f"(~{avoided_estimate:.2f}s if each cost as much as a block)")
+    _cc = COLUMN_CACHE.stats()
+    # col_hits/col_misses are counted in --jobs workers; entries/size are this process's cache
+    vprint(f"[Features] Column cache: hits={_cc['hits'] + col_hits}, misses={_cc['misses'] + col_misses}, entries={_cc['entries']}, {_cc['bytes'] / 1e6:.1f} MB, evictions={_cc['evictions']}")
+    # No lookups at all with --cache rebuild/ignore
+    _lookups = cache_hits + cache_misses
+    vprint(f"[Cache] Hits: {cache_hits}, Misses: {cache_misses}"
+           + (f", Hit Rate: {cache_hits / _lookups * 100:.1f}%" if _lookups else ""))
 
     # Write comparison outputs
     import csv as _csv
@@ -729,8 +1109,36 @@ def _run_all_models_cached(
     print(f"All-model run complete. Summary: {csv_path}\nReport: {os.path.join(report_dir, 'index.html')}")
 
 
-def _run_predict_cached(recipe, frame, target_id, freq, out_dir, verbose):
-    """Run prediction mode with cached models."""
+def _load_run_models(run_dir):
+    """``horizon -> {"plugin", "params"}`` from a trained run's ``models/`` directory."""
+    models = {}
+    models_dir = os.path.join(run_dir, "models")
+    for f in os.listdir(models_dir):
+        if not (f.startswith("model_h") and f.endswith(".json")):
+            continue
+        try:
+            h = int(f[len("model_h"):-len(".json")])
+        except ValueError:
+            continue
+        with open(os.path.join(models_dir, f), "r") as fp:
+            models[h] = json.load(fp)
+    return models
+
+
+def _run_predict_cached(
+    recipe, frame, target_id, freq, horizons, strategy,
+    train_start, train_end, test_start, test_end,
+    out_dir, cache_mgr, cache_mode, verbose, telemetry=None
+):
+    """
+    Run prediction mode with cached models.
+
+    Models are looked up by the cache key train mode uses for the same recipe
+    (which survives appended months), so nothing is refit; without an entry
+    the latest trained run in ``out_dir`` is used as before. Each model is
+    decoded once and all horizons are served from one feature block. The
+    lookup is recorded in ``telemetry`` when given (predictions count as loading).
+    """
 
     def vprint(msg):
         if verbose:
@@ -738,72 +1146,83 @@ def _run_predict_cached(recipe, frame, target_id, freq, out_dir, verbose):
 
     from run import _advance_date_safe, format_ymd
 
+    _t0 = time.time()
     model_name = recipe.get("model", {}).get("name")
 
-    # Find latest trained run for this model
-    om_probe = OutputManager(base_dir=out_dir, run_id="probe")
-    latest_dir = om_probe.find_latest_with_models(prefix=model_name)
+    models = {}
+    source = {}
+    cache_key = None
+    io_before = dict(cache_mgr.io)
+    if cache_mode != "ignore":
+        cache_key, _ = _single_model_key(
+            cache_mgr, recipe, frame, target_id, freq, horizons, strategy,
+            train_start, train_end, test_start, test_end
+        )
+        if cache_mgr.check_cache(cache_key):
+            models = cache_mgr.load_cached_models(cache_key)
+            source = {"cache_key": cache_key}
+            vprint(f"[Cache HIT] Serving cached models: {cache_key}")
 
-    if latest_dir is None:
-        print("No existing trained model found for predict. Train first.")
-        sys.exit(1)
+    if not models:
+        # Find latest trained run for this model
+        om_probe = OutputManager(base_dir=out_dir, run_id="probe")
+        latest_dir = om_probe.find_latest_with_models(prefix=model_name)
 
-    # Load per-horizon model params
-    models_dir = os.path.join(latest_dir, "models")
-    model_files = [f for f in os.listdir(models_dir) if f.startswith("model_h") and f.endswith(".json")]
+        if latest_dir is None:
+            print("No existing trained model found for predict. Train first.")
+            sys.exit(1)
 
-    if not model_files:
-        print("No saved models in latest run.")
-        sys.exit(1)
+        # Load per-horizon model params
+        models = _load_run_models(latest_dir)
+        source = {"source_model_dir": latest_dir}
+        vprint(f"[Cache] No cached models for this recipe; using latest trained run: {latest_dir}")
+
+        if not models:
+            print("No saved models in latest run.")
+            sys.exit(1)
 
     # Discover plugins
     plugins = discover_plugins("models")
 
-    # Build features at the last available origin
+    # Build features at the last available origin (one block serves every horizon)
+    feature_block = build_feature_block(frame, target_id, recipe.get("features", {}))
     preds_rows = []
-    for f in sorted(model_files):
-        with open(os.path.join(models_dir, f), "r") as fp:
-            obj = json.load(fp)
+    for h in sorted(models):
+        obj = models[h]
         plugin = obj.get("plugin")
         params = obj.get("params", {})
 
         if plugin not in plugins:
-            print(f"Missing plugin '{plugin}' for saved model {f}")
-            continue
-
-        create_fn, _ = plugins[plugin]
-        h_str = f.split("model_h")[-1].split(".")[0]
-
-        try:
-            h = int(h_str)
-        except Exception:
+            print(f"Missing plugin '{plugin}' for saved model h={h}")
             continue
 
-        dates, X, y, y_t = assemble_supervised_v2(
-            frame=frame,
-            target_id=target_id,
-            features_cfg=recipe.get("features", {}),
-            horizon=h,
-        )
-
-        if not dates:
+        # Last usable origin for this horizon
+        rows = feature_block.rows(h)
+        if not len(rows):
             continue
+        i = int(rows[-1])
 
-        # Use last origin row
+        create_fn, _ = plugins[plugin]
         m = create_fn(params)
         m.set_params(params)
-        x_last = X[-1]
-        d_last = dates[-1]
-        yhat = m.predict_row(x_last)
+        d_last = feature_block.dates[i]
+        yhat = m.predict_batch(feature_block.matrix[i:i + 1].tolist())[0]
 
         preds_rows.append({
             "origin_date": format_ymd(d_last),
             "target_date": format_ymd(_advance_date_safe(d_last, freq=freq, steps=h)),
             "horizon": h,
-            "y_t": y_t[-1],
+            "y_t": float(feature_block.y_series[i]),
             "forecast": yhat,
         })
 
+    if telemetry is not None:
+        telemetry.lookup(
+            model_name, cache_key, hit="cache_key" in source, lookup=cache_key is not None,
+            bytes_read=cache_mgr.io["bytes_read"] - io_before["bytes_read"],
+            load_seconds=time.time() - _t0,
+        )
+
     # Write predict.csv under a new run dir
     run_id = build_run_id(f"{model_name}-predict")
     om = OutputManager(base_dir=out_dir, run_id=run_id)
@@ -812,7 +1231,7 @@ def _run_predict_cached(recipe, frame, target_id, freq, out_dir, verbose):
     as_of_date = parse_ymd(recipe.get("as_of_date")) if recipe.get("as_of_date") else None
     om.save_lineage({
         "model_name": model_name,
-        "source_model_dir": latest_dir,
+        **source,
         "target_id": target_id,
         "frequency": freq,
         "horizons": sorted([r["horizon"] for r in preds_rows]),
@@ -828,6 +1247,7 @@ def _run_predict_cached(recipe, frame, target_id, freq, out_dir, verbose):
         for r in sorted(preds_rows, key=lambda z: z["horizon"]):
             w.writerow([r["origin_date"], r["target_date"], r["horizon"], r["y_t"], r["forecast"]])
 
+    vprint(f"Predict done in {time.time()-_t0:.2f}s")
     print(f"Prediction complete. Outputs written to: {om.run_dir}")
 
 